@@ -32,11 +32,34 @@ Version: 1.0.0
 """
 
 from .classes.button_game import ButtonGame
+from .classes.session_replay import SessionRecorder
+import os
 
 from dotenv import load_dotenv
 load_dotenv()  # Ensure environment variables are loaded
 
 
+def play_game(developer_mode: bool = False):
+    """
+    Play a full game, recording it when BUTTON_RECORD_SESSIONS is set.
+    
+    BUTTON_RECORD_SESSIONS names a JSON-lines file; each finished session
+    is appended to it for later headless replay.
+    
+    Args:
+        developer_mode (bool): Enable detailed debug output. Defaults to False
+    """
+    record_path = os.getenv("BUTTON_RECORD_SESSIONS")
+    if not record_path:
+        ButtonGame(developer_mode=developer_mode).play_full_game()
+        return
+    
+    recorder = SessionRecorder(record_path)
+    game = recorder.new_game(developer_mode=developer_mode)
+    game.play_full_game()
+    recorder.finish(game)
+
+
 def main():
     """
     Main entry point for the button game.
@@ -71,12 +94,10 @@ def main():
         
         if choice == "1":
             # Production game mode - clean experience
-            production_game = ButtonGame(developer_mode=False)
-            production_game.play_full_game()
+            play_game(developer_mode=False)
         elif choice == "2":
             # Developer game mode - with debug info
-            dev_game = ButtonGame(developer_mode=True)
-            dev_game.play_full_game()
+            play_game(developer_mode=True)
         elif choice == "3":
             # Single node development
             game = ButtonGame()
@@ -98,8 +119,7 @@ def main():
                 print(f"{i:2d}. {node}")
         else:
             print("Invalid choice. Starting production game...")
-            production_game = ButtonGame(developer_mode=False)
-            production_game.play_full_game()
+            play_game(developer_mode=False)
             
     except Exception as e:
         print(f"❌ Error running game: {e}")
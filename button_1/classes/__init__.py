@@ -9,21 +9,81 @@ overall architecture, from data management to user interaction.
 Architecture Overview:
     Data Layer:
         - ButtonDf: Google Sheets connector with retry logic
+        - SheetLoader: Concurrent tab loading with a shared rate limiter
+        - SheetCache: Persistent on-disk cache with stale-while-revalidate
         - ButtonDat: Multi-source data aggregator and validator
+        - ContentRegistry: Process-wide shared ButtonDat snapshots
+        - ContentValidator: Linear, incremental story graph checks
+        - LoopAnalysis: Tarjan SCCs of the played graph, flagging inescapable loops
+        - DistanceTables: Per-node shortest and expected steps to the end
+        - ContentBundle: Compiled, versioned content with fast loading
+        - NodeView: Precompiled per-node records for the engine hot path
+    
+    Simulation Layer:
+        - GraphArrays: Story graph compiled into CSR integer arrays
+        - simulate: Headless, vectorized Monte Carlo playthroughs
+        - MarkovAnalysis: Exact expected path length and ending odds
+        - SimulationRunner: Reproducible simulation across a process pool
     
     Visualization Layer:
         - StoryGraph: NetworkX-based narrative flow visualization
     
     Game Logic Layer:
         - NodeEngine: Individual node execution and interaction
+        - WrapCache: Memoized, terminal-width-aware text wrapping
+        - TerminalInput/ScriptedInput: Buffered key backends with timeouts
+        - FrameRenderer: One output write per frame to a tty, socket, file or memory
+        - TransitionResult: Immutable outcome of one node step
+        - GameCore: Pure step(state, key) -> (frames, state) game rules
         - ButtonGame: Main game loop and state management
+        - JourneyLog: Journey stored as edge ids, with an optional history cap
+        - JourneyExporter: Background, batched journey export to JSONL/Parquet/SQLite
+        - JourneyQueries: Funnel, loop and edge analytics over the SQLite store
+        - PathSketch: Fixed-memory top journeys, n-grams and loops with error bounds
+        - SessionRecorder/SessionReplayer: Record and headlessly replay sessions
+        - SnapshotStore: Compact binary session snapshots for park and resume
+        - GameServer: Asyncio telnet server hosting many sessions per process
+        - StepApi: Stateless HTTP step API with signed session tokens
 
 Classes:
     ButtonDf: Google Sheets data scraper with exponential backoff
+    RateLimiter: Token bucket shared between concurrent scrapers
+    SheetLoader: Bounded thread pool loader with per-tab timings
+    SheetCache: Content-addressed CSV cache keyed by sheet id and gid
     ButtonDat: Comprehensive game data manager and validator
+    ContentBundle: Immutable compiled content with pre-resolved adjacency
+    ContentRegistry: Loads each content source once per process
+    ContentValidator: Full then incremental checks of graph, selectors and texts
+    LoopAnalysis: Components, loops and traps of the effective story graph
+    DistanceTables: Precomputed steps-to-end arrays for progress and routing
+    NodeView: Slot record of a node's text, selector and outgoing edges
+    EdgeView: Slot record of one edge's outro text and desired flag
+    GraphArrays: CSR adjacency, selector codes and desired flags
+    SimulationResult: Path lengths, visits and edge rates of a batch
+    MarkovAnalysis: Absorbing Markov chain solved with linear algebra
+    SimulationRunner: Seeded, chunked simulation on worker processes
     StoryGraph: Network visualization of narrative structure  
     NodeEngine: Node execution engine with edge selector logic
+    TransitionResult: Next node, selector, text and desired flag of a step
+    GameState: Immutable node, random stream state and step count of a session
+    GameCore: Shared rules and pre-rendered frames every front end adapts
+    WrapCache: Bounded LRU cache of wrapped paragraphs
+    TerminalInput: Raw mode once per session, selector-driven typeahead buffer
+    ScriptedInput: Fixed key sequence for tests and harnesses
+    FrameRenderer: Joins frame parts into one sink write and counts bytes
     ButtonGame: Main game controller and journey tracker
+    JourneyLog: Array of edge ids with lazily resolved journey entries
+    JourneyExporter: Bounded queue and writer thread feeding an export sink
+    SqliteSink: Batched WAL-mode inserts of exported journeys
+    JourneyQueries: Read-only funnels, loop counts and desired ratios
+    SpaceSaving: Top-k counter whose counts carry an overestimate bound
+    CountMinSketch: Frequency estimates for any key from a fixed table
+    PathSketch: Streaming journey, n-gram and loop summaries
+    SessionRecorder: Records seed, keys and transcript digest of a game
+    SessionReplayer: Replays recordings without a terminal and verifies them
+    SnapshotStore: Parks idle sessions as snapshot files and rehydrates them
+    GameServer: Concurrent socket sessions sharing one content snapshot
+    StepApi: Start/step/node logic whose session state lives in the token
 
 Key Design Principles:
     - Separation of concerns between data, logic, and presentation
@@ -39,16 +99,107 @@ Data Flow:
 """
 
 # Import all classes for easy access
+from button_common.sheet_cache import SheetCache
+from button_common.content_bundle import ContentBundle, compile_content, compile_csv_dir, load_bundle
 from .button_df import ButtonDf
+from .sheet_loader import RateLimiter, SheetLoader
+from .text_wrap import WrapCache, wrap_cache, terminal_width
+from .frame_renderer import BinarySink, FrameRenderer, MemorySink, SocketSink, StreamSink
+from .key_input import InputTimeout, KeyDecoder, ScriptedInput, TerminalInput
+from .node_view import EdgeView, NodeView, compile_node_views
 from .button_dat import ButtonDat
+from .content_registry import ContentRegistry, content_registry
+from .content_validator import ContentValidator
+from .loop_analysis import LoopAnalysis, analyse_loops
+from .distance_tables import DistanceTables, compile_distance_tables
+from .graph_arrays import GraphArrays, compile_graph_arrays
+from .simulator import SimulationResult, simulate
+from .markov import MarkovAnalysis
+from .simulation_runner import SimulationRunner, run_simulation
 from .story_graph import StoryGraph
+from .transition import TransitionResult
 from .node_engine import NodeEngine
+from .game_core import GameCore, GameState
+from .journey_log import JourneyLog
+from .journey_store import SqliteSink
+from .journey_export import BufferSink, JourneyExporter, JsonlSink, ParquetSink, open_sink
+from .journey_queries import FunnelStage, JourneyQueries
+from .path_sketch import CountMinSketch, HeavyHitter, PathSketch, SpaceSaving
 from .button_game import ButtonGame
+from .session_replay import SessionRecording, SessionRecorder, SessionReplayer, load_recordings
+from .session_snapshot import SnapshotError, SnapshotStore, restore_game, snapshot_game
+from .game_server import GameServer, TelnetKeyDecoder
+from .http_api import StepApi, TokenError, make_server
 
 __all__ = [
+    'SheetCache',
     'ButtonDf',
+    'RateLimiter',
+    'SheetLoader',
+    'ContentBundle',
+    'compile_content',
+    'compile_csv_dir',
+    'load_bundle',
+    'WrapCache',
+    'wrap_cache',
+    'terminal_width',
+    'BinarySink',
+    'FrameRenderer',
+    'MemorySink',
+    'SocketSink',
+    'StreamSink',
+    'InputTimeout',
+    'KeyDecoder',
+    'ScriptedInput',
+    'TerminalInput',
+    'EdgeView',
+    'NodeView',
+    'compile_node_views',
     'ButtonDat', 
+    'ContentRegistry',
+    'content_registry',
+    'ContentValidator',
+    'LoopAnalysis',
+    'analyse_loops',
+    'DistanceTables',
+    'compile_distance_tables',
+    'GraphArrays',
+    'compile_graph_arrays',
+    'SimulationResult',
+    'simulate',
+    'MarkovAnalysis',
+    'SimulationRunner',
+    'run_simulation',
     'StoryGraph',
+    'TransitionResult',
     'NodeEngine',
-    'ButtonGame'
+    'GameCore',
+    'GameState',
+    'JourneyLog',
+    'BufferSink',
+    'JourneyExporter',
+    'JsonlSink',
+    'ParquetSink',
+    'open_sink',
+    'SqliteSink',
+    'FunnelStage',
+    'JourneyQueries',
+    'CountMinSketch',
+    'HeavyHitter',
+    'PathSketch',
+    'SpaceSaving',
+    'ButtonGame',
+    'SessionRecording',
+    'SessionRecorder',
+    'SessionReplayer',
+    'load_recordings',
+    'SnapshotError',
+    'SnapshotStore',
+    'restore_game',
+    'snapshot_game',
+    'GameServer',
+    'TelnetKeyDecoder',
+    'StepApi',
+    'TokenError',
+    'make_server'
 ]
\ No newline at end of file
@@ -19,14 +19,19 @@ Data Sources:
     - text: Reusable text snippets and UI elements
 
 Key Features:
-    - Automatic Google Sheets data loading with rate limiting
+    - Concurrent Google Sheets data loading with shared rate limiting
     - Comprehensive data validation with detailed error reporting
-    - Convenient query methods for game logic
+    - Constant-time query methods backed by indexes built at load time
     - Robust connection mapping for state transitions
 """
 
-from .button_df import ButtonDf
-import time
+from button_common.content_bundle import NODE_FIELDS, compile_content, load_bundle
+from .content_validator import ContentValidator
+from .loop_analysis import analyse_loops
+from .node_view import compile_node_views
+from .text_wrap import prewarm_views
+from types import MappingProxyType
+import os
 
 
 class ButtonDat:
@@ -36,7 +41,7 @@ class ButtonDat:
     ButtonDat serves as the central data hub, loading content from multiple
     Google Sheets sources and providing validation and query interfaces
     for all game logic. It coordinates edges, nodes, and text data while
-    implementing rate limiting to avoid API restrictions.
+    sharing a rate limiter across concurrent loads to avoid API restrictions.
     
     The class provides high-level methods for common game queries like
     finding node connections, validating data integrity, and retrieving
@@ -47,6 +52,8 @@ class ButtonDat:
         edges_df (pd.DataFrame): State transition definitions
         nodes_df (pd.DataFrame): Node content and configuration
         text_df (pd.DataFrame): Reusable text snippets
+        load_timings (dict): Seconds taken to fetch each tab
+        content (ContentBundle): Compiled content and lookup indexes
         
     Data Structure:
         edges: source, target, outro_text, desired
@@ -54,13 +61,23 @@ class ButtonDat:
         text: id_text, text_type, text_context, text
     """
     
-    def __init__(self):
+    def __init__(self, data_urls=None, max_workers=3, bundle_path=None):
         """
         Initialize with comprehensive data loading from Google Sheets.
         
-        Loads three primary datasets (edges, nodes, text) with appropriate
-        rate limiting between requests to avoid Google Sheets API restrictions.
-        Each dataset is loaded via ButtonDf scrapers with automatic retry logic.
+        Loads three primary datasets (edges, nodes, text) concurrently via
+        a SheetLoader. The tabs share one rate limiter rather than being
+        spaced out with fixed delays, so a cold start costs roughly a single
+        round trip. Each dataset is loaded via ButtonDf scrapers with
+        automatic retry logic.
+        
+        Args:
+            data_urls (dict, optional): Mapping of tab name to CSV URL, used
+                in place of the Google Sheets export URLs
+            max_workers (int): Maximum tabs fetched at once. Defaults to 3
+            bundle_path (str, optional): Compiled content bundle to load
+                instead of Google Sheets. When neither this nor data_urls is
+                given, the BUTTON_CONTENT_BUNDLE environment variable is used
         
         Raises:
             ConnectionError: If Google Sheets data cannot be accessed
@@ -70,21 +87,175 @@ class ButtonDat:
             Requires .env file with appropriate Google Sheets API credentials
             and sheet configuration for the 'edges', 'nodes', and 'text' tabs.
         """
-        # Add small delays to avoid Google Sheets rate limiting
+        if bundle_path is None and data_urls is None:
+            bundle_path = os.getenv("BUTTON_CONTENT_BUNDLE")
+        if bundle_path:
+            self._load_from_bundle(bundle_path)
+            return
+        
+        # Imported here so bundle-only runs never import pandas
+        from .sheet_loader import SheetLoader
+        
+        self.content = None
+        loader = SheetLoader(max_workers=max_workers, data_urls=data_urls)
+        scrapers = loader.load(['edges', 'nodes', 'text'])
+        
+        # Per-tab wall time in seconds, useful for diagnosing slow starts
+        self.load_timings = loader.timings
         
         # Load edges data - state transitions and outcomes
-        self._edges_scraper = ButtonDf('edges')
+        self._edges_scraper = scrapers['edges']
         self.edges_df = self._edges_scraper.df
-        time.sleep(0.5)  # Rate limiting delay
         
         # Load nodes data - individual node definitions
-        self._nodes_scraper = ButtonDf('nodes')
+        self._nodes_scraper = scrapers['nodes']
         self.nodes_df = self._nodes_scraper.df
-        time.sleep(0.5)  # Rate limiting delay
         
         # Load text data - reusable content snippets
-        self._text_scraper = ButtonDf('text')
+        self._text_scraper = scrapers['text']
         self.text_df = self._text_scraper.df
+        
+        # Build the hash indexes used by every query; rows that cannot be
+        # indexed are skipped and reported by validate_data()
+        self._index_issues = []
+        self.content = compile_content(self.edges_df, self.nodes_df, self.text_df, issues=self._index_issues)
+
+    @classmethod
+    def from_bundle(cls, path):
+        """
+        Load game data from a compiled content bundle.
+        
+        Reading a bundle takes milliseconds and does not import pandas.
+        The DataFrame attributes are materialized from the bundle the
+        first time they are accessed.
+        
+        Args:
+            path (str): Path to a bundle written by ContentBundle.write
+            
+        Returns:
+            ButtonDat: Game data backed by the bundle
+        """
+        return cls(bundle_path=path)
+    
+    @classmethod
+    def from_content(cls, content):
+        """
+        Wrap already-compiled content without any loading.
+        
+        Args:
+            content (ContentBundle): Compiled content, e.g. from compile_content
+            
+        Returns:
+            ButtonDat: Game data backed by the given content
+        """
+        button_dat = cls.__new__(cls)
+        button_dat.content = content
+        button_dat.load_timings = {}
+        button_dat._index_issues = []
+        return button_dat
+    
+    def _load_from_bundle(self, path):
+        """Load content from a bundle file, deferring DataFrame creation"""
+        self.content = load_bundle(path)
+        self.load_timings = {}
+        self._index_issues = []
+    
+    def __getattr__(self, name):
+        """Materialize edges_df/nodes_df/text_df from the bundle on first use"""
+        content = self.__dict__.get('content')
+        if name in ('edges_df', 'nodes_df', 'text_df') and content is not None:
+            frames = content.to_frames()
+            self.edges_df = frames['edges']
+            self.nodes_df = frames['nodes']
+            self.text_df = frames['text']
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def node_views(self):
+        """
+        Get precompiled NodeView records for every node.
+        
+        Built on first access and then shared by every NodeEngine that
+        uses this snapshot. The views' paragraphs are pre-wrapped at the
+        common console widths at the same time.
+        """
+        views = self.__dict__.get('_node_views')
+        if views is None:
+            views = self._node_views = compile_node_views(self.content)
+            prewarm_views(views, self.get_text_by_id("edge_good"), self.get_text_by_id("edge_bad"))
+        return views
+
+    @property
+    def edge_views(self):
+        """
+        Get every EdgeView keyed by its edge id.
+        
+        Built from node_views on first access, so journey logs can store
+        bare edge ids and resolve them later.
+        """
+        edges = self.__dict__.get('_edge_views')
+        if edges is None:
+            edges = self._edge_views = MappingProxyType({
+                edge.edge_id: edge for view in self.node_views.values() for edge in view.edges
+            })
+        return edges
+
+    @property
+    def graph_arrays(self):
+        """
+        Get the story graph as integer arrays for vectorized simulation.
+        
+        Built on first access (NumPy is only imported then) and shared by
+        every simulator that uses this snapshot.
+        """
+        arrays = self.__dict__.get('_graph_arrays')
+        if arrays is None:
+            from .graph_arrays import compile_graph_arrays
+            arrays = self._graph_arrays = compile_graph_arrays(self.content)
+        return arrays
+
+    @property
+    def distance_tables(self):
+        """
+        Get the shortest and expected steps from every node to the end.
+        
+        Flat arrays indexed like graph_arrays, computed once per snapshot:
+        by the content registry when it loads the snapshot, otherwise on
+        first access. Expected steps are solved on first use. Progress
+        displays read them in O(1) per step.
+        """
+        tables = self.__dict__.get('_distance_tables')
+        if tables is None:
+            from .distance_tables import compile_distance_tables
+            tables = self._distance_tables = compile_distance_tables(self.graph_arrays)
+        return tables
+
+    @property
+    def loop_analysis(self):
+        """
+        Get the strongly connected components, loops and traps of the
+        story as the game plays it.
+        
+        Computed once per snapshot on first access.
+        """
+        analysis = self.__dict__.get('_loop_analysis')
+        if analysis is None:
+            analysis = self._loop_analysis = analyse_loops(self.node_views)
+        return analysis
+
+    @property
+    def validator(self):
+        """
+        Get the ContentValidator that validate_data() uses.
+        
+        It remembers the last content it checked, so validating again
+        after the content changes only re-checks the changed nodes.
+        """
+        validator = self.__dict__.get('_validator')
+        if validator is None:
+            validator = self._validator = ContentValidator()
+        return validator
 
     @property
     def edges(self):
@@ -103,36 +274,21 @@ class ButtonDat:
         
     def get_node_info(self, node_name):
         """Get information about a specific node"""
-        if 'node' in self.nodes_df.columns:
-            node_data = self.nodes_df[self.nodes_df['node'] == node_name]
-            if not node_data.empty:
-                return node_data.iloc[0].to_dict()
-        return None
+        row = self.content.nodes.get(node_name)
+        return dict(zip(NODE_FIELDS, row)) if row is not None else None
         
     def get_connections(self, node_name):
         """Get all connections (edges) from a specific node"""
-        connections = self.edges_df[self.edges_df['source'] == node_name]
-        return connections['target'].tolist()
+        return list(self.content.successors.get(node_name, ()))
         
     def get_all_nodes(self):
         """Get list of all unique nodes in the game"""
-        # Get unique nodes from both source and target columns
-        edge_nodes = set(self.edges_df['source'].tolist() + self.edges_df['target'].tolist())
-        
-        # If nodes DataFrame has a 'node' column, include those too
-        if 'node' in self.nodes_df.columns:
-            node_list_nodes = set(self.nodes_df['node'].tolist())
-            return list(edge_nodes.union(node_list_nodes))
-        
-        return list(edge_nodes)
+        # Nodes from the nodes table plus any only referenced by edges
+        return list(self.content.node_names)
         
     def get_text_by_id(self, text_id):
         """Get text content by id_text"""
-        if 'id_text' in self.text_df.columns:
-            text_data = self.text_df[self.text_df['id_text'] == text_id]
-            if not text_data.empty:
-                return text_data.iloc[0]['text']
-        return None
+        return self.content.text_by_id.get(text_id)
     
     def get_texts_by_type(self, text_type):
         """Get all texts of a specific type"""
@@ -144,15 +300,19 @@ class ButtonDat:
         """Get all texts associated with a specific node"""
         # Assuming text IDs follow pattern: node_name_text_type
         node_texts = {}
-        if 'id_text' in self.text_df.columns:
-            for _, row in self.text_df.iterrows():
-                if row['id_text'].startswith(f"{node_name}_"):
-                    text_type = row.get('text_type', 'unknown')
-                    node_texts[text_type] = row['text']
+        prefix = f"{node_name}_"
+        for id_text, text_type, _, text in self.content.texts:
+            if id_text.startswith(prefix):
+                node_texts[text_type or 'unknown'] = text
         return node_texts
         
     def validate_data(self):
-        """Validate that the game data is consistent"""
+        """
+        Validate that the game data is consistent.
+        
+        Returns:
+            list or None: Issue strings, or None when there are none
+        """
         issues = []
         
         # Check if edges DataFrame is not empty
@@ -178,5 +338,14 @@ class ButtonDat:
             issues.append("Text DataFrame missing 'text_type' column")
         if 'text' not in self.text_df.columns:
             issues.append("Text DataFrame missing 'text' column")
+        
+        # Rows that could not be indexed at load time
+        issues.extend(self._index_issues)
+        
+        # Graph structure, selectors and required text ids
+        issues.extend(self.validator.update(self.content))
+        
+        # Loops a session could never leave
+        issues.extend(self.loop_analysis.issues())
             
         return issues if issues else None
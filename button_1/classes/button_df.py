@@ -19,20 +19,23 @@ Environment Requirements:
     - BUTTON_SHEET_NODES_GID: GID for nodes data tab  
     - BUTTON_SHEET_TEXT_GID: GID for text content tab
     - BUTTON_SHEET_TITLES_GID: GID for job titles tab
+    - BUTTON_CACHE_DIR / BUTTON_CACHE_TTL / BUTTON_OFFLINE: see SheetCache
 
 Key Features:
     - Automatic retry with exponential backoff
     - Environment-specific .env file loading
     - Comprehensive error handling and reporting
     - Rate limiting protection for API compliance
+    - Persistent on-disk cache so warm starts skip the network
 """
 
-import pandas as pd
+import io
 import os
 from dotenv import load_dotenv
 import time
 from urllib.error import HTTPError
 from pathlib import Path
+from button_common.sheet_cache import SheetCache, default_cache
 
 
 # Load .env file from the button_1 directory (not root)
@@ -72,7 +75,7 @@ class ButtonDf:
         BUTTON_SHEET_*_GID: Individual tab GID for each sheet type
     """
     
-    def __init__(self, sheet_name):
+    def __init__(self, sheet_name, data_url=None, rate_limiter=None, cache=None):
         """
         Initialize Google Sheets connection for specified tab.
         
@@ -82,6 +85,12 @@ class ButtonDf:
         Args:
             sheet_name (str): Name of sheet tab to load
                 Must be one of: 'edges', 'nodes', 'text', 'titles'
+            data_url (str, optional): CSV URL to load instead of the Google
+                Sheets export URL (e.g. a local mirror)
+            rate_limiter (RateLimiter, optional): Limiter shared with other
+                scrapers; acquired before every request attempt
+            cache (SheetCache, optional): On-disk cache to read through.
+                Defaults to the process-wide cache from the environment
         
         Raises:
             ValueError: If sheet_name is not recognized
@@ -100,16 +109,25 @@ class ButtonDf:
             self._sheet_gid = os.getenv("BUTTON_SHEET_TITLES_GID")
         else:
             raise ValueError(f"Unknown sheet name: {sheet_name}. Must be one of: edges, nodes, text, titles")
-        self.data_url = f"https://docs.google.com/spreadsheets/d/{self._sheet_id}/export?format=csv&gid={self._sheet_gid}"
+        self.sheet_name = sheet_name
+        self.data_url = data_url or f"https://docs.google.com/spreadsheets/d/{self._sheet_id}/export?format=csv&gid={self._sheet_gid}"
+        self._rate_limiter = rate_limiter
+        self._cache = cache or default_cache()
+        if data_url:
+            self.cache_key = SheetCache.key_for(data_url, '')
+        else:
+            self.cache_key = SheetCache.key_for(self._sheet_id, self._sheet_gid)
         
         # Load data with retry logic for rate limiting
         self.df = self._load_data_with_retry()
     
     def _load_data_with_retry(self, max_retries=3, delay=1):
-        """Load CSV data with retry logic for rate limiting"""
+        """Load CSV data through the on-disk cache with retry logic for rate limiting"""
+        import pandas as pd  # deferred so bundle-only runs never import pandas
         for attempt in range(max_retries):
             try:
-                return pd.read_csv(self.data_url)
+                text = self._cache.get(self.cache_key, self.data_url, self._rate_limiter)
+                return pd.read_csv(io.StringIO(text))
             except HTTPError as e:
                 if e.code == 404 and attempt < max_retries - 1:
                     print(f"⚠️  Rate limited, retrying in {delay} seconds... (attempt {attempt + 1})")
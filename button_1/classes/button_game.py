@@ -9,14 +9,110 @@ data science adventure game.
 Classes:
     ButtonGame: Primary game controller managing state, transitions, and modes
 
+Functions:
+    session_limit: Why a session must stop before its next step, if it must
+    render_journey_summary: End-of-game summary of a journey log
+
 Dependencies:
     - ButtonDat: Game data aggregation and validation
+    - GameCore: Pure step function the game loop adapts to the terminal
     - NodeEngine: Individual node execution and interaction handling
 """
 
 from .button_dat import ButtonDat
+from .content_registry import content_registry
+from .frame_renderer import FrameRenderer
+from .game_core import GameCore, render_summary_footer
+from .journey_log import JourneyLog
+from .key_input import InputTimeout
 from .node_engine import NodeEngine
-import textwrap
+from .text_wrap import terminal_width, wrap_cache
+import random
+import secrets
+import time
+
+
+# Shown when a session stops before reaching an end, keyed by end_reason
+END_MESSAGES = {
+    'idle_timeout': "\n\n⏱️  No key pressed for a while - ending the game.\n",
+    'step_budget': "\n\n⏹️  This session has reached its step limit - ending the game.\n",
+    'time_budget': "\n\n⏹️  This session has reached its time limit - ending the game.\n",
+    'trapped': "\n\n⏹️  This part of the story never ends - ending the game.\n",
+}
+
+
+def session_limit(button_dat, state, started: float, max_steps: int = None, max_seconds: float = None):
+    """
+    Check whether a session must be cut short before its next step.
+
+    Besides the step and time budgets, a session that has entered a loop
+    it can never leave (see ButtonDat.loop_analysis) is stopped.
+
+    Args:
+        button_dat (ButtonDat): Content the session is played on
+        state (GameState): Current core state
+        started (float): time.monotonic() when play began
+        max_steps (int, optional): Step budget. Defaults to no limit
+        max_seconds (float, optional): Time budget. Defaults to no limit
+
+    Returns:
+        str or None: 'trapped', 'step_budget' or 'time_budget', or None
+            while the session may continue
+    """
+    if state.node is not None and button_dat.loop_analysis.is_trapped(state.node):
+        return 'trapped'
+    if max_steps is not None and state.steps >= max_steps:
+        return 'step_budget'
+    if max_seconds is not None and time.monotonic() - started >= max_seconds:
+        return 'time_budget'
+    return None
+
+
+def render_journey_summary(journey, width: int = None, developer_mode: bool = False):
+    """
+    Render a journey log as the end-of-game summary with full narrative.
+
+    Args:
+        journey (JourneyLog): The session's journey
+        width (int, optional): Wrap width. Defaults to the terminal width
+        developer_mode (bool): Show each step's selector and desired flag
+
+    Returns:
+        str: Summary text ending with a newline
+    """
+    width = width or terminal_width()
+    lines = [
+        f"\n{'='*60}",
+        "🗺️  Your Journey Through the Data Science World",
+        "="*60,
+    ]
+
+    if journey.dropped > 1:
+        lines.append(f"\n   … {journey.dropped - 1} earlier steps not kept")
+
+    for i, step in enumerate(journey, start=journey.dropped):
+        if i == 0:
+            continue  # Skip initial "start" entry
+
+        # Show the transition
+        from_node = step['from'].replace('_', ' ').title()
+        to_node = step['to'].replace('_', ' ').title()
+        lines.append(f"\n{i}. {from_node} → {to_node}")
+
+        # Show outro text if available (now includes edge feedback)
+        if step.get('outro_text'):
+            # Wrap the outro text for consistent formatting
+            lines.append(wrap_cache.wrap(step['outro_text'], width,
+                                         initial_indent="   � ", subsequent_indent="   "))
+
+        # Show technical details only in developer mode
+        if developer_mode:
+            edge_selector = step.get('edge_selector', 'unknown')
+            desired_status = "✅" if step.get('is_desired') else "⚠️" if step.get('is_desired') is False else "❓"
+            lines.append(f"   🔧 [{edge_selector}] {desired_status}")
+
+    lines.append(render_summary_footer(journey.total))
+    return "\n".join(lines) + "\n"
 
 
 class ButtonGame:
@@ -37,29 +133,77 @@ class ButtonGame:
     Attributes:
         game_data (ButtonDat): Game content and validation manager
         engine (NodeEngine): Individual node execution engine
-        game_path (list): Complete record of player's journey
+        game_path (JourneyLog): Record of player's journey, one edge id per step
         current_node (str): Current position in the game graph
         game_running (bool): Main loop control flag
         developer_mode (bool): Debug information display toggle
+        seed (int): Seed of the GameCore random stream for this game
+        session_id (str): Identifier of this game in exported journeys
+        exporter (JourneyExporter or None): Receives every logged transition
+        state (GameState or None): Core state once play has started; a
+            resumed game continues from it
+        max_steps (int or None): Steps after which the session is ended
+        max_seconds (float or None): Wall time after which the session is ended
+        end_reason (str or None): Why play stopped: 'end', or a key of
+            END_MESSAGES when the session was cut short
+        show_progress (bool): Progress bar toggle
     """
     
-    def __init__(self, developer_mode: bool = False):
+    def __init__(self, developer_mode: bool = False, button_dat: ButtonDat = None, rng: random.Random = None,
+                 key_input=None, idle_timeout: float = None, renderer: FrameRenderer = None,
+                 max_history: int = None, exporter=None, session_id: str = None,
+                 max_steps: int = None, max_seconds: float = None, show_progress: bool = False):
         """
         Initialize game with data loading and engine setup.
         
-        Creates a new game instance, loads all game data from external sources
-        (Google Sheets), initializes the node execution engine, and sets up
-        journey tracking and state management.
+        Creates a new game instance backed by the process-wide content
+        snapshot (loaded from Google Sheets on first use only), initializes
+        the node execution engine, and sets up journey tracking and state
+        management.
         
         Args:
             developer_mode (bool): Enable detailed debug output. Defaults to False
+            button_dat (ButtonDat, optional): Game data to use. Defaults to the
+                shared snapshot from the content registry
+            rng (random.Random, optional): Random stream for random edge
+                selectors, e.g. random.Random(seed) for a reproducible game.
+                The game's GameCore seed is drawn from it
+            key_input (optional): Key backend, e.g. ScriptedInput. Defaults to
+                a TerminalInput on stdin
+            idle_timeout (float, optional): Seconds without a key press after
+                which the game ends. Defaults to waiting forever
+            renderer (FrameRenderer, optional): Output destination. Defaults
+                to a renderer on stdout
+            max_history (int, optional): Journey entries to keep. Defaults to
+                keeping the whole journey
+            exporter (JourneyExporter, optional): Streams each transition to
+                a sink as it is logged. Defaults to no export
+            session_id (str, optional): Identifier for exported rows. Defaults
+                to a random hex id
+            max_steps (int, optional): End the session after this many
+                steps. Defaults to no limit
+            max_seconds (float, optional): End the session after this much
+                wall time in play_full_game. Defaults to no limit
+            show_progress (bool): Show a progress bar and the expected steps
+                left after every step. Defaults to False
         """
-        self.game_data = ButtonDat()
-        self.engine = NodeEngine(self.game_data, developer_mode=developer_mode)
-        self.game_path = []
+        self.game_data = button_dat or content_registry.get()
+        self.seed = rng.getrandbits(64) if rng is not None else secrets.randbits(64)
+        self.engine = NodeEngine(
+            self.game_data, developer_mode=developer_mode, seed=self.seed,
+            key_input=key_input, input_timeout=idle_timeout, renderer=renderer
+        )
+        self.game_path = JourneyLog(self.engine, max_history=max_history)
+        self.exporter = exporter
+        self.session_id = session_id or secrets.token_hex(8)
         self.current_node = "start_game"
         self.game_running = True
         self.developer_mode = developer_mode
+        self.state = None
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.end_reason = None
+        self.show_progress = show_progress
         
         # Initialize path tracking
         self.log_transition(None, self.current_node, "start")
@@ -68,9 +212,10 @@ class ButtonGame:
         """
         Record a transition in the player's journey.
         
-        Maintains a comprehensive log of all state transitions including
-        the narrative context and technical details for later summary
-        generation and debugging purposes.
+        Maintains a compact log of all state transitions; the narrative
+        context and technical details are resolved from content when the
+        summary or debugging tools read the log back. With an exporter the
+        transition is also queued for export, without waiting on its sink.
         
         Args:
             from_node (str or None): Source node identifier (None for game start)
@@ -79,13 +224,11 @@ class ButtonGame:
             outro_text (str, optional): Narrative text shown during transition
             is_desired (bool, optional): Whether this was the intended outcome
         """
-        self.game_path.append({
-            'from': from_node,
-            'to': to_node,
-            'edge_selector': edge_selector,
-            'outro_text': outro_text,
-            'is_desired': is_desired
-        })
+        self.game_path.append(from_node, to_node, edge_selector, outro_text, is_desired)
+        if self.exporter is not None:
+            self.exporter.submit(
+                self.session_id, self.game_path.total - 1, from_node, to_node, edge_selector, is_desired
+            )
     
     def get_edge_info(self, from_node, to_node):
         """
@@ -99,43 +242,103 @@ class ButtonGame:
             tuple: (combined_outro_text, is_desired_boolean)
                 combined_outro_text includes edge feedback for random transitions
         """
-        # Get the combined outro text (includes edge feedback for random selectors)
-        combined_outro = self.engine.get_combined_outro_text(from_node, to_node)
-        is_desired = self.engine.get_edge_desired_status(from_node, to_node)
+        result = self.engine.resolve_transition(from_node, to_node)
+        return result.combined_text, result.is_desired
+    
+    def session_limit(self, state, started: float):
+        """
+        Check whether a session must be cut short before its next step.
         
-        return combined_outro, is_desired
+        Args:
+            state (GameState): Current core state
+            started (float): time.monotonic() when play began
+            
+        Returns:
+            str or None: 'trapped', 'step_budget' or 'time_budget', or None
+                while the session may continue
+        """
+        return session_limit(self.game_data, state, started, self.max_steps, self.max_seconds)
+    
+    def _read_timeout(self, started: float):
+        """Key read timeout under a time budget: the time left, or the idle timeout if sooner"""
+        remaining = max(0.0, started + self.max_seconds - time.monotonic())
+        timeout = self.engine.input_timeout
+        return remaining if timeout is None else min(timeout, remaining)
     
     def play_full_game(self):
         """
         Execute the complete game experience from start to finish.
         
-        Runs the main game loop, managing state transitions and user
-        interactions until reaching a terminal state. Automatically
-        displays the journey summary upon completion.
+        A terminal adapter over GameCore: writes the frames the core
+        returns, one renderer write per step, feeds it arrow key presses
+        and logs every transition it resolves until reaching a terminal
+        state. The journey summary goes out with the final step's frames.
+        A game restored from a snapshot continues where it was left.
+        Sessions over their step or time budget, or stuck in a loop with no
+        way out, end cleanly with end_reason saying why.
         """
-        if self.developer_mode:
-            print("🔧 Development mode: Full game experience")
+        renderer = self.engine.renderer
+        started = time.monotonic()
+        header = "🔧 Development mode: Full game experience\n" if self.developer_mode else ""
         
-        while self.game_running and self.current_node:
-            # Run the current node
-            next_node = self.engine.run_single_node(self.current_node)
-            
-            if next_node:
-                # Get edge information for logging
-                edge_selector = self.engine.get_edge_selector(self.current_node)
-                outro_text, is_desired = self.get_edge_info(self.current_node, next_node)
+        core = GameCore(self.game_data, developer_mode=self.developer_mode)
+        if self.state is None:
+            frames, self.state = core.start(self.seed, self.current_node)
+        else:
+            frames = (core.node_frame(self.state.node),) if self.state.node else ()
+        state = self.state
+        renderer.write(header, *frames)
+        frames = ()
+        
+        # Hold the key backend open so raw mode is entered once per session
+        with self.engine.key_input:
+            while self.game_running and state.node:
+                # Re-render at the new width if the terminal was resized
+                if core.width != terminal_width():
+                    core = GameCore(self.game_data, developer_mode=self.developer_mode)
+                
+                self.end_reason = self.session_limit(state, started)
+                if self.end_reason:
+                    frames = (END_MESSAGES[self.end_reason],)
+                    self.game_running = False
+                    break
+                
+                try:
+                    if self.max_seconds is None:
+                        key = self.engine.get_arrow_key_input()
+                    else:
+                        key = self.engine.get_arrow_key_input(self._read_timeout(started))
+                except InputTimeout:
+                    self.end_reason = self.session_limit(state, started) or 'idle_timeout'
+                    frames = (END_MESSAGES[self.end_reason],)
+                    self.game_running = False
+                    break
                 
-                # Log the transition with all details
-                self.log_transition(self.current_node, next_node, edge_selector, outro_text, is_desired)
+                frames, new_state = core.step(state, key)
+                if new_state is state:
+                    continue  # key did not advance the game
+                state = self.state = new_state
+                result = state.last
                 
-                # Move to next node
-                self.current_node = next_node
-            else:
-                # End of game
-                self.game_running = False
-        
-        # Show final summary
-        self.show_game_summary()
+                if result.next_node:
+                    # Log the transition exactly as the core resolved it
+                    self.log_transition(
+                        result.from_node, result.next_node, result.edge_selector,
+                        result.combined_text, result.is_desired
+                    )
+                    
+                    # Move to next node
+                    self.current_node = result.next_node
+                    if self.show_progress:
+                        frames = (frames[0], self.render_progress(state.node, state.steps), *frames[1:])
+                    renderer.write(*frames)
+                else:
+                    # End of game
+                    self.end_reason = 'end'
+                    self.game_running = False
+        
+        # Final step and summary in one write
+        renderer.write(*frames, self.render_game_summary())
     
     def play_single_node(self, node_name: str):
         """
@@ -151,42 +354,51 @@ class ButtonGame:
             str or None: Next node identifier or None if terminal
         """
         if not self.developer_mode:
-            print(f"🔧 Development mode: Single node ({node_name})")
+            self.engine.renderer.write(f"🔧 Development mode: Single node ({node_name})\n")
         
-        # Create a temporary developer-mode engine for single node testing
-        dev_engine = NodeEngine(self.game_data, developer_mode=True)
-        return dev_engine.run_single_node(node_name)
+        # Create a temporary developer-mode engine on the game's random stream
+        dev_engine = NodeEngine(
+            self.game_data, developer_mode=True, seed=self.engine.rng_state,
+            key_input=self.engine.key_input, renderer=self.engine.renderer
+        )
+        result = dev_engine.run_single_node(node_name)
+        self.engine.rng_state = dev_engine.rng_state
+        return result.next_node
     
-    def show_game_summary(self):
-        """Show the player's journey through the game with full narrative"""
-        print(f"\n{'='*60}")
-        print("🗺️  Your Journey Through the Data Science World")
-        print("="*60)
+    def render_progress(self, node: str, steps_taken: int, width: int = 20):
+        """
+        Render a progress bar from the precomputed distance tables.
         
-        for i, step in enumerate(self.game_path):
-            if i == 0:
-                continue  # Skip initial "start" entry
-                
-            # Show the transition
-            from_node = step['from'].replace('_', ' ').title()
-            to_node = step['to'].replace('_', ' ').title()
-            print(f"\n{i}. {from_node} → {to_node}")
+        Args:
+            node (str): Node the player has arrived at
+            steps_taken (int): Transitions made so far
+            width (int): Bar width in characters. Defaults to 20
             
-            # Show outro text if available (now includes edge feedback)
-            if step.get('outro_text'):
-                # Wrap the outro text for consistent formatting
-                wrapped_outro = textwrap.fill(step['outro_text'], width=80, 
-                                            initial_indent="   � ", subsequent_indent="   ")
-                print(wrapped_outro)
-                
-            # Show technical details only in developer mode
-            if self.developer_mode:
-                edge_selector = step.get('edge_selector', 'unknown')
-                desired_status = "✅" if step.get('is_desired') else "⚠️" if step.get('is_desired') is False else "❓"
-                print(f"   🔧 [{edge_selector}] {desired_status}")
-        
-        print(f"\nTotal nodes visited: {len(self.game_path)}")
-        print("Thanks for playing!")
+        Returns:
+            str: Progress line, or "" if no end can be reached from the node
+        """
+        shortest, expected = self.game_data.distance_tables.remaining(node)
+        if shortest is None or expected == float('inf'):
+            return ""
+        total = steps_taken + expected
+        filled = round(width * steps_taken / total) if total else width
+        return f"\n📈 [{'█' * filled}{'░' * (width - filled)}] about {expected:.0f} steps to go\n"
+    
+    def render_game_summary(self, width: int = None):
+        """
+        Render the player's journey through the game with full narrative.
+        
+        Args:
+            width (int, optional): Wrap width. Defaults to the terminal width
+            
+        Returns:
+            str: Summary text ending with a newline
+        """
+        return render_journey_summary(self.game_path, width, self.developer_mode)
+    
+    def show_game_summary(self):
+        """Show the player's journey through the game with full narrative"""
+        self.engine.renderer.write(self.render_game_summary())
     
     def get_available_nodes(self):
         """Get list of available nodes for development/testing"""
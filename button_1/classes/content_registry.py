@@ -0,0 +1,115 @@
+"""
+ContentRegistry - Process-Wide Shared Game Content
+==================================================
+
+This module keeps one loaded ButtonDat snapshot per content source for the
+whole process. ButtonGame, NodeEngine and StoryGraph ask the registry for
+their data instead of loading it themselves, so the menu game, the game
+actually played and any graph built alongside them all share the same
+objects by reference, and each source is fetched and parsed only once.
+
+Each snapshot's shortest distance-to-end table is computed as part of
+the load, which is linear in the size of the story. The expected-steps
+table needs a Markov solve and is left until a session first shows
+progress.
+
+Snapshots are treated as read-only once loaded. When the underlying
+content changes, call `invalidate` (or `clear`) and the next request loads
+a fresh snapshot; objects already holding the old snapshot keep using it.
+
+Classes:
+    ContentRegistry: Thread-safe map of content source to ButtonDat
+
+Module Attributes:
+    content_registry: The process-wide registry used by the game classes
+"""
+
+import os
+import threading
+
+from .button_dat import ButtonDat
+
+
+class ContentRegistry:
+    """
+    Thread-safe registry of loaded ButtonDat snapshots keyed by source.
+
+    A source is either a compiled bundle path or a set of sheet URLs
+    (None meaning the Google Sheets configured in .env). Concurrent
+    requests for the same source wait for a single load instead of
+    fetching in parallel.
+
+    Attributes:
+        load_count (int): Number of snapshots loaded so far
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._snapshots = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.load_count = 0
+
+    @staticmethod
+    def _key(bundle_path=None, data_urls=None):
+        """Normalize a content source into a hashable registry key"""
+        if bundle_path is None and data_urls is None:
+            bundle_path = os.getenv("BUTTON_CONTENT_BUNDLE")
+        if bundle_path:
+            return ('bundle', os.path.abspath(bundle_path))
+        return ('sheets', tuple(sorted((data_urls or {}).items())))
+
+    def get(self, bundle_path=None, data_urls=None):
+        """
+        Return the shared snapshot for a content source, loading it once.
+
+        Args:
+            bundle_path (str, optional): Compiled content bundle path
+            data_urls (dict, optional): Tab name to CSV URL overrides
+
+        Returns:
+            ButtonDat: Shared, read-only game data snapshot
+        """
+        key = self._key(bundle_path, data_urls)
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+                generation = self._generation
+            if snapshot is None:
+                snapshot = ButtonDat(data_urls=data_urls, bundle_path=key[1] if key[0] == 'bundle' else None)
+                snapshot.distance_tables  # shortest steps now; expected steps on first use
+                with self._lock:
+                    self.load_count += 1
+                    # An invalidation during the load may mean this content
+                    # is already stale: hand it to the caller, don't keep it
+                    if self._generation == generation:
+                        self._snapshots[key] = snapshot
+        return snapshot
+
+    def invalidate(self, bundle_path=None, data_urls=None):
+        """
+        Drop the snapshot for a content source so the next get reloads it.
+
+        Returns:
+            bool: True if a snapshot was dropped
+        """
+        key = self._key(bundle_path, data_urls)
+        with self._lock:
+            self._generation += 1
+            return self._snapshots.pop(key, None) is not None
+
+    def clear(self):
+        """Drop every snapshot"""
+        with self._lock:
+            self._generation += 1
+            self._snapshots.clear()
+
+
+content_registry = ContentRegistry()
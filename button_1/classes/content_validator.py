@@ -0,0 +1,194 @@
+"""
+ContentValidator - Linear and Incremental Story Graph Validation
+================================================================
+
+This module checks compiled content for authoring mistakes the game
+would otherwise only hit at run time:
+
+    - edges pointing at nodes missing from the nodes table
+    - nodes with no outgoing edge whose edge_selector is not 'end'
+    - nodes that cannot be reached from start_game
+    - 'random' nodes with a single successor
+    - missing pbn, edge_good and edge_bad text ids
+    - unknown edge_selector values
+
+A full check is one pass over the ContentBundle indexes plus one
+breadth-first search, so it is linear in nodes and edges. After a content
+update, update() re-checks only the nodes whose row or outgoing edges
+changed and the predecessors of nodes that appeared or disappeared.
+Reachability is extended from new edges; only removing an edge from a
+reachable node costs a fresh search.
+
+Classes:
+    ContentValidator: Keeps the issues of the last content it checked
+"""
+
+from collections import deque
+
+
+KNOWN_SELECTORS = frozenset(('start', 'auto', 'random', 'end'))
+REQUIRED_TEXT_IDS = ('pbn', 'edge_good', 'edge_bad')
+
+
+class ContentValidator:
+    """
+    Validate content fully once, then incrementally after each update.
+
+    Attributes:
+        start_node (str): Node reachability is measured from
+        required_text_ids (tuple): Text ids the game needs
+        checked (int): Nodes examined by the last validate() or update()
+    """
+
+    def __init__(self, start_node: str = "start_game", required_text_ids=REQUIRED_TEXT_IDS):
+        self.start_node = start_node
+        self.required_text_ids = tuple(required_text_ids)
+        self.checked = 0
+        self._content = None
+        self._node_issues = {}
+        self._predecessors = {}
+        self._reachable = set()
+        self._unreachable = set()
+
+    def _check_node(self, content, name):
+        """Record the issues local to one node and its outgoing edges"""
+        issues = [
+            f"edge {name} -> {target}: target node '{target}' is not in the nodes table"
+            for target in content.successors.get(name, ()) if target not in content.nodes
+        ]
+        row = content.nodes.get(name)
+        if row is None:
+            if name in content.successors:
+                issues.append(f"node '{name}': has outgoing edges but is not in the nodes table")
+        else:
+            selector = row[1] or 'auto'
+            successors = content.successors.get(name, ())
+            if selector not in KNOWN_SELECTORS:
+                issues.append(f"node '{name}': unknown edge_selector '{selector}'")
+            if not successors and selector != 'end':
+                issues.append(f"node '{name}': no outgoing edges but edge_selector is '{selector}', not 'end'")
+            if selector == 'random' and len(successors) == 1:
+                issues.append(f"node '{name}': 'random' selector with a single successor")
+        if issues:
+            self._node_issues[name] = issues
+        else:
+            self._node_issues.pop(name, None)
+
+    def _search(self, content, frontier):
+        """Extend the reachable set breadth-first from frontier nodes already in it"""
+        successors = content.successors
+        reachable = self._reachable
+        queue = deque(frontier)
+        reached = []
+        while queue:
+            for target in successors.get(queue.popleft(), ()):
+                if target not in reachable:
+                    reachable.add(target)
+                    reached.append(target)
+                    queue.append(target)
+        return reached
+
+    def validate(self, content):
+        """
+        Check every node, edge and required text.
+
+        Args:
+            content (ContentBundle): Content to check
+
+        Returns:
+            list: Issue strings, empty when the content is clean
+        """
+        self._content = content
+        self._node_issues = {}
+        predecessors = {}
+        for source, targets in content.successors.items():
+            for target in targets:
+                predecessors.setdefault(target, set()).add(source)
+        self._predecessors = predecessors
+        for name in content.node_names:
+            self._check_node(content, name)
+        self.checked = len(content.node_names)
+        self._reachable = {self.start_node}
+        self._search(content, (self.start_node,))
+        self._unreachable = content.nodes.keys() - self._reachable
+        return self.issues
+
+    def update(self, content, changed=None):
+        """
+        Re-check what changed since the last validate() or update().
+
+        Args:
+            content (ContentBundle): The updated content
+            changed (iterable, optional): Names of nodes whose row or
+                outgoing edges changed. Found by diffing the two bundles'
+                indexes when omitted
+
+        Returns:
+            list: Issue strings for the updated content
+        """
+        old = self._content
+        if old is None:
+            return self.validate(content)
+        if changed is None:
+            changed = {name for name, _ in content.nodes.items() ^ old.nodes.items()}
+            changed.update(name for name, _ in content.successors.items() ^ old.successors.items())
+        else:
+            changed = set(changed)
+
+        recheck = set(changed)
+        frontier, removed_reachable_edge = [], False
+        for name in changed:
+            before = set(old.successors.get(name, ()))
+            after = set(content.successors.get(name, ()))
+            for target in before - after:
+                sources = self._predecessors.get(target)
+                if sources is not None:
+                    sources.discard(name)
+                    if not sources:
+                        del self._predecessors[target]
+            for target in after - before:
+                self._predecessors.setdefault(target, set()).add(name)
+            if name in self._reachable:
+                if before - after:
+                    removed_reachable_edge = True
+                frontier.extend(target for target in after - before if target not in self._reachable)
+            if (name in old.nodes) != (name in content.nodes):
+                recheck.update(self._predecessors.get(name, ()))
+
+        self._content = content
+        for name in recheck:
+            self._check_node(content, name)
+        self.checked = len(recheck)
+
+        if removed_reachable_edge:
+            self._reachable = {self.start_node}
+            self._search(content, (self.start_node,))
+            self._unreachable = content.nodes.keys() - self._reachable
+        else:
+            self._reachable.update(frontier)
+            self._unreachable.difference_update(frontier)
+            self._unreachable.difference_update(self._search(content, frontier))
+            for name in changed:
+                if name in content.nodes and name not in self._reachable:
+                    self._unreachable.add(name)
+                else:
+                    self._unreachable.discard(name)
+        return self.issues
+
+    @property
+    def issues(self):
+        """Issue strings for the content last checked"""
+        content = self._content
+        if content is None:
+            return []
+        issues = []
+        if self.start_node not in content.nodes:
+            issues.append(f"start node '{self.start_node}' is not in the nodes table")
+        issues.extend(
+            f"text id '{text_id}' is missing" for text_id in self.required_text_ids
+            if text_id not in content.text_by_id
+        )
+        for name in sorted(self._node_issues):
+            issues.extend(self._node_issues[name])
+        issues.extend(f"node '{name}': not reachable from '{self.start_node}'" for name in sorted(self._unreachable))
+        return issues
@@ -0,0 +1,175 @@
+"""
+DistanceTables - Precomputed Steps-to-End for Every Node
+========================================================
+
+This module answers "how far is this player from finishing?" in O(1) per
+step. Two flat arrays, indexed like GraphArrays, are computed once per
+content snapshot:
+
+    shortest  fewest transitions from a node to any node where the game
+              ends ('end' nodes and nodes without successors, such as
+              end and summary), by a breadth-first search backwards from
+              those nodes over the edges a session can actually take
+    expected  mean transitions left under the game's own selector rules,
+              from one linear solve of the absorbing Markov chain,
+              computed on first use
+
+Nodes that can never finish get UNREACHABLE in `shortest`; nodes that
+can reach a loop with no way out get inf in `expected`.
+
+One distance per node is enough for both 'end' and 'summary': the game
+stops as soon as it reaches an 'end' node and shows the journey summary
+itself, so the end -> summary edge is never taken in play and summary is
+never further away than end. The tables measure to whichever finishing
+node comes first and record the finishing nodes in `targets`.
+
+The content registry runs the linear-time search when it loads a
+snapshot. The Markov solve behind `expected` is deferred until a progress
+display first asks for it, so loads and hot reloads never pay for it.
+
+Classes:
+    DistanceTables: Per-node shortest and expected steps to the end
+
+Functions:
+    compile_distance_tables: Build the tables for a story graph
+"""
+
+from collections import deque
+import math
+import threading
+
+import numpy as np
+
+from .graph_arrays import SELECT_RANDOM
+from .markov import MarkovAnalysis
+
+
+UNREACHABLE = -1
+
+
+class DistanceTables:
+    """
+    Read-only distance-to-end arrays.
+
+    Attributes:
+        graph (GraphArrays): Graph the tables index into
+        shortest (np.ndarray): int32 fewest steps to an end per node, or UNREACHABLE
+        expected (np.ndarray): float64 expected steps to an end per node, or inf
+        targets (tuple): Names of the finishing nodes distances are measured to
+    """
+
+    def __init__(self, graph, shortest, expected=None, targets=()):
+        """
+        Wrap precomputed arrays.
+
+        Args:
+            graph (GraphArrays): Graph the tables index into
+            shortest (np.ndarray): Fewest steps to an end per node
+            expected (np.ndarray, optional): Expected steps per node.
+                Solved from the Markov chain on first use when omitted
+            targets (tuple): Names of the finishing nodes
+        """
+        self.graph = graph
+        self.shortest = shortest
+        self.targets = tuple(targets)
+        shortest.flags.writeable = False
+        # Plain lists make single lookups cheaper than NumPy scalar indexing
+        self._shortest = shortest.tolist()
+        self._expected = None
+        self._expected_lock = threading.Lock()
+        if expected is not None:
+            self._set_expected(expected)
+
+    def _set_expected(self, expected):
+        """Freeze the expected-steps array and its lookup list"""
+        expected.flags.writeable = False
+        self._expected_list = expected.tolist()
+        self._expected = expected
+
+    @property
+    def expected(self):
+        """Expected steps to an end per node, solved once on first access"""
+        if self._expected is None:
+            with self._expected_lock:
+                if self._expected is None:
+                    self._set_expected(MarkovAnalysis(self.graph).steps_to_finish())
+        return self._expected
+
+    def remaining(self, node):
+        """
+        Get the steps left from a node.
+
+        Args:
+            node (str): Node name
+
+        Returns:
+            tuple: (shortest or None if no end is reachable, expected or inf)
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        index = self.graph.index_of(node)
+        shortest = self._shortest[index]
+        if self._expected is None:
+            self.expected
+        return (None if shortest == UNREACHABLE else shortest), self._expected_list[index]
+
+    def progress(self, node, steps_taken: int):
+        """
+        Estimate how far through the game a session is.
+
+        Args:
+            node (str): Node the session is at
+            steps_taken (int): Transitions made so far
+
+        Returns:
+            float or None: Fraction in [0, 1], None if the end is out of reach
+        """
+        _, expected = self.remaining(node)
+        if math.isinf(expected):
+            return None
+        total = steps_taken + expected
+        return steps_taken / total if total else 1.0
+
+
+def _effective_edges(graph):
+    """Get (sources, targets) of the edges a session can take"""
+    sources = np.repeat(np.arange(graph.n_nodes), graph.out_degree)
+    is_first = np.arange(graph.n_edges) == graph.indptr[sources]
+    keep = ~graph.absorbing[sources] & ((graph.selector[sources] == SELECT_RANDOM) | is_first)
+    return sources[keep], graph.targets[keep]
+
+
+def compile_distance_tables(graph):
+    """
+    Compute shortest steps to the end for every node.
+
+    The breadth-first search runs now, in O(nodes + edges); expected steps
+    are solved when the tables are first asked for them.
+
+    Args:
+        graph (GraphArrays): Compiled story graph
+
+    Returns:
+        DistanceTables: The tables
+    """
+    sources, targets = _effective_edges(graph)
+    order = np.argsort(targets, kind='stable')
+    predecessors = sources[order].tolist()
+    starts = np.concatenate(([0], np.cumsum(np.bincount(targets, minlength=graph.n_nodes)))).tolist()
+
+    shortest = [UNREACHABLE] * graph.n_nodes
+    finishing = np.flatnonzero(graph.absorbing).tolist()
+    queue = deque(finishing)
+    for node in queue:
+        shortest[node] = 0
+    while queue:
+        node = queue.popleft()
+        distance = shortest[node] + 1
+        for source in predecessors[starts[node]:starts[node + 1]]:
+            if shortest[source] == UNREACHABLE:
+                shortest[source] = distance
+                queue.append(source)
+
+    targets = [graph.node_names[node] for node in finishing]
+    return DistanceTables(graph, np.array(shortest, dtype=np.int32), targets=targets)
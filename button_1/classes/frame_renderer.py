@@ -0,0 +1,159 @@
+"""
+FrameRenderer - One Output Write per Frame
+==========================================
+
+This module batches everything shown for a node into a single write. A
+front end hands the renderer all the pieces of a frame (title, text,
+prompt, transition text, developer info); they are joined into one
+buffer and passed to a sink in one call, instead of one print per piece.
+Over SSH, a container log pipe or a socket this turns many small writes
+per node into one.
+
+Sinks adapt the output to where it goes:
+
+    StreamSink: text streams such as sys.stdout or a tty
+    BinarySink: binary writers such as files, pipes or asyncio StreamWriter
+    SocketSink: connected sockets
+    MemorySink: in-memory capture for tests and benchmarks
+
+Every renderer counts the writes it made and the bytes it sent, for
+benchmarking.
+
+Classes:
+    FrameRenderer: Joins frame parts and writes them once
+    StreamSink, BinarySink, SocketSink, MemorySink: Output destinations
+"""
+
+import sys
+
+
+class StreamSink:
+    """
+    Write to a text stream, flushing after every frame.
+
+    Attributes:
+        stream: Text stream, or None to use whatever sys.stdout is at write time
+        encoding (str): Encoding used to count bytes
+    """
+
+    def __init__(self, stream=None, encoding: str = 'utf-8'):
+        self.stream = stream
+        self.encoding = encoding
+
+    def write(self, text: str):
+        """Write one frame and return its size in bytes"""
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+        return len(text.encode(self.encoding))
+
+
+class BinarySink:
+    """
+    Write encoded frames to a binary writer (file, pipe, asyncio StreamWriter).
+
+    Attributes:
+        writer: Object with write(bytes)
+        encoding (str): Text encoding
+        newline (str or None): Replacement for "\\n", e.g. "\\r\\n" for telnet
+    """
+
+    def __init__(self, writer, encoding: str = 'utf-8', newline: str = None):
+        self.writer = writer
+        self.encoding = encoding
+        self.newline = newline
+
+    def _encode(self, text):
+        if self.newline:
+            text = text.replace("\n", self.newline)
+        return text.encode(self.encoding)
+
+    def write(self, text: str):
+        """Write one frame and return its size in bytes"""
+        data = self._encode(text)
+        self.writer.write(data)
+        flush = getattr(self.writer, 'flush', None)
+        if flush is not None:
+            flush()
+        return len(data)
+
+
+class SocketSink(BinarySink):
+    """Send encoded frames on a connected socket"""
+
+    def __init__(self, sock, encoding: str = 'utf-8', newline: str = "\r\n"):
+        super().__init__(sock, encoding, newline)
+
+    def write(self, text: str):
+        """Send one frame and return its size in bytes"""
+        data = self._encode(text)
+        self.writer.sendall(data)
+        return len(data)
+
+
+class MemorySink:
+    """
+    Keep frames in memory.
+
+    Attributes:
+        frames (list): Every frame written, in order
+    """
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, text: str):
+        """Store one frame and return its size in bytes"""
+        self.frames.append(text)
+        return len(text.encode('utf-8'))
+
+    def getvalue(self):
+        """Get everything written so far as one string"""
+        return "".join(self.frames)
+
+
+class FrameRenderer:
+    """
+    Join the parts of a frame and write them with a single sink call.
+
+    Attributes:
+        sink: Output destination (StreamSink, BinarySink, SocketSink, MemorySink)
+        writes (int): Sink writes made
+        bytes_written (int): Encoded bytes written
+    """
+
+    def __init__(self, sink=None):
+        """
+        Initialize the renderer.
+
+        Args:
+            sink (optional): Output destination. Defaults to a StreamSink on
+                the current sys.stdout
+        """
+        self.sink = sink if sink is not None else StreamSink()
+        self.writes = 0
+        self.bytes_written = 0
+
+    def write(self, *parts):
+        """
+        Write one frame.
+
+        Args:
+            *parts (str): Pieces of the frame, joined without separators;
+                empty pieces are fine
+
+        Returns:
+            int: Bytes written, 0 if the frame was empty (no write is made)
+        """
+        text = "".join(parts)
+        if not text:
+            return 0
+        size = self.sink.write(text)
+        self.writes += 1
+        self.bytes_written += size
+        return size
+
+    @property
+    def mean_write_bytes(self):
+        """Average bytes per write"""
+        return self.bytes_written / self.writes if self.writes else 0.0
@@ -0,0 +1,281 @@
+"""
+GameCore - Pure Step Function Behind Every Front End
+====================================================
+
+This module holds the game's rules as a pure function of an immutable
+state and one key press:
+
+    frames, new_state = core.step(state, key)
+
+A GameState is four fields: the current node, a 64-bit random stream
+state, the number of steps taken and the TransitionResult that led to
+the node. Random edge selectors draw from the state's own SplitMix64
+stream, so a state fully determines what happens next and can be copied,
+stored in a token or handed to another process.
+
+The core never reads a terminal or prints. It returns the text frames to
+show, and each front end (the terminal game, the telnet server, the HTTP
+API, NodeEngine's single-node runs, tests) decides how to read keys and
+where to write frames. The core is also the one place the edge selector
+rules live: every front end picks successors through select(). Frames
+and transition results are rendered once per edge and reused, so a step
+in-process is a couple of dict lookups and one small state object.
+
+Classes:
+    GameState: Immutable, compact state of one session
+    GameCore: Pure start/step functions over a content snapshot
+
+Functions:
+    render_summary_footer: Closing lines of the end-of-game summary
+"""
+
+from dataclasses import dataclass, replace
+import secrets
+
+from .content_registry import content_registry
+from .node_engine import NodeEngine
+from .node_view import NodeView
+from .text_wrap import terminal_width
+from .transition import TransitionResult
+
+
+ADVANCE_KEYS = frozenset(('RIGHT', 'ENTER'))
+CONFIRMATION = " ✓\n"
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _next_random(rng: int):
+    """Advance a SplitMix64 stream; returns (new_state, 64-bit output)"""
+    rng = (rng + _GOLDEN_GAMMA) & _MASK64
+    z = ((rng ^ (rng >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return rng, z ^ (z >> 31)
+
+
+def render_summary_footer(nodes_visited: int):
+    """
+    Render the closing lines every front end shows when a game ends.
+
+    Args:
+        nodes_visited (int): Nodes the player passed through, the start included
+
+    Returns:
+        str: Footer text, without a trailing newline
+    """
+    return f"\nTotal nodes visited: {nodes_visited}\nThanks for playing!"
+
+
+@dataclass(frozen=True, slots=True)
+class GameState:
+    """
+    Immutable state of one game session.
+
+    Attributes:
+        node (str or None): Node awaiting input, None once the game has ended
+        rng (int): SplitMix64 state used by random edge selectors
+        steps (int): Transitions taken so far
+        last (TransitionResult or None): Transition that led here, None at the start
+    """
+
+    node: str
+    rng: int
+    steps: int = 0
+    last: TransitionResult = None
+
+    @property
+    def done(self):
+        """True once the game has ended"""
+        return self.node is None
+
+    @property
+    def nodes_visited(self):
+        """
+        Nodes passed through so far, counting the start node.
+
+        Every visited node but the current one has been stepped out of;
+        once the game has ended there is no current node left to count.
+        """
+        return self.steps if self.done else self.steps + 1
+
+
+class GameCore:
+    """
+    Pure game rules over one content snapshot, width and display mode.
+
+    A core holds no session state, so one instance can serve any number
+    of sessions from any number of threads.
+
+    Attributes:
+        button_dat (ButtonDat): Shared, read-only content snapshot
+        views (Mapping): Precompiled NodeView per node, shared with button_dat
+        width (int): Wrap width of rendered frames
+        developer_mode (bool): Include developer info in frames
+    """
+
+    def __init__(self, button_dat=None, width: int = None, developer_mode: bool = False, engine=None):
+        """
+        Initialize the core.
+
+        Args:
+            button_dat (ButtonDat, optional): Content snapshot. Defaults to the
+                shared snapshot from the content registry
+            width (int, optional): Wrap width. Defaults to the terminal width
+            developer_mode (bool): Include developer info. Defaults to False
+            engine (NodeEngine, optional): Engine that renders the frames.
+                Defaults to a new engine that never reads keys or writes
+        """
+        self.button_dat = button_dat or content_registry.get()
+        self.views = self.button_dat.node_views
+        self.width = width or terminal_width()
+        self.developer_mode = developer_mode
+        self._engine = engine if engine is not None else NodeEngine(
+            self.button_dat, developer_mode=developer_mode, core=self
+        )
+        self._node_frames = {}
+        self._transitions = {}
+
+    @property
+    def engine(self):
+        """NodeEngine the frames are rendered with; it never reads keys or writes"""
+        return self._engine
+
+    def view(self, node: str):
+        """Get the NodeView for a node, or an empty 'auto' view if unknown"""
+        view = self.views.get(node)
+        return view if view is not None else NodeView(node)
+
+    def select(self, node: str, rng: int):
+        """
+        Apply a node's edge selector.
+
+        'end' nodes and nodes without successors finish the game, 'random'
+        nodes draw a successor from the SplitMix64 stream and every other
+        selector (auto, start, and choice for now) takes the first one.
+
+        Args:
+            node (str): Node being left
+            rng (int): SplitMix64 stream state
+
+        Returns:
+            tuple: (successor index or None at the end, new stream state)
+        """
+        view = self.view(node)
+        count = len(view.successors)
+        if not count or view.edge_selector == 'end':
+            return None, rng
+        if view.edge_selector == 'random':
+            rng, draw = _next_random(rng)
+            return (draw * count) >> 64, rng
+        return 0, rng
+
+    def next_node(self, node: str, rng: int):
+        """
+        Pick the node a session moves to from a node.
+
+        Args:
+            node (str): Node being left
+            rng (int): SplitMix64 stream state
+
+        Returns:
+            tuple: (next node name or None at the end, new stream state)
+        """
+        index, rng = self.select(node, rng)
+        return (self.view(node).successors[index] if index is not None else None), rng
+
+    def node_frame(self, node: str):
+        """
+        Get the frame shown on arriving at a node: its text and prompt.
+
+        Raises:
+            ValueError: If 'pbn' text is missing from game data
+        """
+        frame = self._node_frames.get(node)
+        if frame is None:
+            engine = self._engine
+            frame = engine.render_node(node, self.width) + engine.render_prompt(node, self.width)
+            if self.developer_mode:
+                frame = f"\n🎮 Running single node: {node}\n" + frame
+            self._node_frames[node] = frame
+        return frame
+
+    def _transition(self, node: str, index, key=None):
+        """
+        Resolve and render the step from node along successor `index` once.
+
+        The cached result carries no key, so callers attach the key that
+        was pressed. Developer frames print the key and are cached per key.
+        """
+        shown_key = key if self.developer_mode else None
+        cache_key = (node, index, shown_key)
+        cached = self._transitions.get(cache_key)
+        if cached is None:
+            engine = self._engine
+            next_node = self.view(node).successors[index] if index is not None else None
+            result = engine.resolve_transition(node, next_node, shown_key)
+            frame = CONFIRMATION + engine.render_outro(result, self.width)
+            if self.developer_mode:
+                frame += engine.render_developer_info(result)
+            frames = (frame, self.node_frame(next_node)) if next_node else (frame,)
+            cached = self._transitions[cache_key] = (frames, result)
+        return cached
+
+    def start(self, seed: int = None, node: str = "start_game"):
+        """
+        Begin a session.
+
+        Args:
+            seed (int, optional): Seed of the session's random stream.
+                Random when omitted
+            node (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            tuple: (frames, GameState)
+        """
+        seed = secrets.randbits(64) if seed is None else seed
+        return (self.node_frame(node),), GameState(node, seed & _MASK64)
+
+    def step(self, state: GameState, key):
+        """
+        Apply one key press to a session.
+
+        RIGHT and ENTER advance; any other key, or any key after the game
+        has ended, returns no frames and the same state object.
+
+        Args:
+            state (GameState): Current state
+            key (str or None): Key name ('RIGHT', 'ENTER', 'LEFT', ...)
+
+        Returns:
+            tuple: (frames, GameState); frames is a tuple of strings, the
+                transition text followed by the next node's frame
+        """
+        node = state.node
+        if node is None or key not in ADVANCE_KEYS:
+            return (), state
+
+        index, rng = self.select(node, state.rng)
+        frames, result = self._transition(node, index, key)
+        if result.user_input != key:
+            result = replace(result, user_input=key)
+        return frames, GameState(result.next_node, rng, state.steps + 1, result)
+
+    def run(self, state: GameState, keys):
+        """
+        Apply a sequence of key presses.
+
+        Args:
+            state (GameState): Starting state
+            keys (iterable): Key names
+
+        Returns:
+            tuple: (frames, GameState) with the frames of every step, in order
+        """
+        frames = []
+        for key in keys:
+            if state.node is None:
+                break
+            step_frames, state = self.step(state, key)
+            frames.extend(step_frames)
+        return tuple(frames), state
@@ -0,0 +1,322 @@
+"""
+GameServer - Asyncio Multi-Session Terminal Server
+==================================================
+
+This module serves the game over plain TCP so that one process can host
+many players at once. Each connection is a thin adapter over one shared
+GameCore: it keeps its own GameState and journey log, while every session
+shares the same immutable content snapshot and pre-rendered frames. Keys
+are decoded from the socket, so nothing touches the server's own tty.
+
+Any telnet client works (`telnet host 8000`); the server asks it for
+character-at-a-time mode so arrow keys arrive immediately. Line-mode
+clients such as `nc` can press Enter to advance. `q` or Ctrl+C leaves.
+
+Set BUTTON_JOURNEY_EXPORT to a .jsonl, .parquet or .sqlite path to stream
+every session's transitions there. BUTTON_MAX_STEPS and BUTTON_MAX_SECONDS
+end sessions that run longer than that, and BUTTON_IDLE_TIMEOUT (seconds,
+DEFAULT_IDLE_TIMEOUT unless set) ends sessions that stop sending keys.
+
+Classes:
+    TelnetKeyDecoder: Incremental socket bytes -> key names decoder
+    GameServer: asyncio server hosting concurrent game sessions
+
+Usage:
+    python -m button_1.classes.game_server [PORT]
+"""
+
+from collections import Counter
+import asyncio
+import os
+import secrets
+import sys
+import time
+
+from .button_game import END_MESSAGES, render_journey_summary, session_limit
+from .content_registry import content_registry
+from .frame_renderer import BinarySink, FrameRenderer
+from .game_core import GameCore
+from .journey_export import JourneyExporter, open_sink
+from .journey_log import JourneyLog
+from .key_input import KeyDecoder
+
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+ECHO, SUPPRESS_GO_AHEAD = 1, 3
+
+# Ask the client to let the server echo and to send characters immediately
+TELNET_CHARACTER_MODE = bytes((IAC, WILL, ECHO, IAC, WILL, SUPPRESS_GO_AHEAD))
+
+
+class TelnetKeyDecoder(KeyDecoder):
+    """
+    Turn bytes read from a socket into the key names NodeEngine uses.
+
+    Decodes like KeyDecoder, and also skips telnet option negotiation and
+    treats q, Ctrl+C and Ctrl+D as 'QUIT'.
+    """
+
+    QUIT_BYTES = frozenset((ord('q'), ord('Q'), 0x03, 0x04))
+    TELNET = True
+
+
+class _SessionClosed(Exception):
+    """Raised when a player disconnects or asks to quit"""
+
+
+class _Session:
+    """
+    What one connection owns; the rules and frames come from the shared core.
+
+    Attributes:
+        seed (int): Seed of the session's GameCore random stream
+        session_id (str): Identifier of the session in exported journeys
+        journey (JourneyLog): Transitions taken so far
+        end_reason (str or None): Why play stopped, as in ButtonGame.end_reason
+    """
+
+    __slots__ = ('seed', 'session_id', 'journey', 'end_reason', '_exporter')
+
+    def __init__(self, engine, max_history: int = None, exporter=None):
+        self.seed = secrets.randbits(64)
+        self.session_id = secrets.token_hex(8)
+        self.journey = JourneyLog(engine, max_history=max_history)
+        self.end_reason = None
+        self._exporter = exporter
+        self.log(None, "start_game", "start")
+
+    def log(self, from_node, to_node, edge_selector="auto", outro_text=None, is_desired=None):
+        """Record a transition, and queue it for export like ButtonGame.log_transition"""
+        self.journey.append(from_node, to_node, edge_selector, outro_text, is_desired)
+        if self._exporter is not None:
+            self._exporter.submit(
+                self.session_id, self.journey.total - 1, from_node, to_node, edge_selector, is_desired
+            )
+
+
+class GameServer:
+    """
+    Host many concurrent game sessions in one asyncio process.
+
+    Attributes:
+        button_dat (ButtonDat): Shared, read-only content snapshot
+        host (str): Interface to listen on
+        port (int): Port to listen on (the bound port once started)
+        developer_mode (bool): Show developer info in every session
+        width (int): Wrap width used for every session
+        max_history (int or None): Journey entries kept per session
+        exporter (JourneyExporter or None): Shared export of every session's transitions
+        max_steps (int or None): Steps after which a session is ended
+        max_seconds (float or None): Connection time after which a session is ended
+        idle_timeout (float or None): Seconds without a key after which a session is ended
+        end_reasons (Counter): Sessions by ButtonGame.end_reason, with
+            'disconnected' for players who left or quit
+        core (GameCore): Game rules and frames shared by every session
+        active_sessions (int): Sessions currently connected
+        total_sessions (int): Sessions started since the server began
+        steps (int): Node steps served across all sessions
+        step_seconds (float): Total time spent computing those steps
+        writes (int): Socket writes made across all sessions
+        bytes_sent (int): Bytes written across all sessions
+    """
+
+    def __init__(self, button_dat=None, host: str = "0.0.0.0", port: int = 8000,
+                 developer_mode: bool = False, width: int = 80, max_history: int = None,
+                 exporter=None, max_steps: int = None, max_seconds: float = None,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the server.
+
+        Args:
+            button_dat (ButtonDat, optional): Content snapshot shared by all
+                sessions. Defaults to the shared snapshot from the content registry
+            host (str): Interface to listen on. Defaults to all interfaces
+            port (int): Port to listen on (0 picks a free port). Defaults to 8000
+            developer_mode (bool): Show developer info. Defaults to False
+            width (int): Wrap width for players' terminals. Defaults to 80
+            max_history (int, optional): Journey entries kept per session.
+                Defaults to keeping whole journeys
+            exporter (JourneyExporter, optional): Streams every session's
+                transitions to a sink. Defaults to no export
+            max_steps (int, optional): Steps after which a session is ended.
+                Defaults to no limit
+            max_seconds (float, optional): Connection time after which a
+                session is ended. Defaults to no limit
+            idle_timeout (float, optional): Seconds without a key press
+                after which a session is ended, so silent clients do not
+                hold a slot. Defaults to DEFAULT_IDLE_TIMEOUT; None waits forever
+        """
+        self.button_dat = button_dat or content_registry.get()
+        self.button_dat.node_views  # compile views and prewarm wrapping before serving
+        self.host = host
+        self.port = port
+        self.developer_mode = developer_mode
+        self.width = width
+        self.max_history = max_history
+        self.exporter = exporter
+        self.max_steps = max_steps
+        self.max_seconds = max_seconds
+        self.idle_timeout = idle_timeout
+        self.end_reasons = Counter()
+        self.core = GameCore(self.button_dat, width=width, developer_mode=developer_mode)
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self.steps = 0
+        self.step_seconds = 0.0
+        self.writes = 0
+        self.bytes_sent = 0
+        self._server = None
+
+    @property
+    def mean_step_seconds(self):
+        """Average server-side time per node step"""
+        return self.step_seconds / self.steps if self.steps else 0.0
+
+    async def start(self):
+        """
+        Start listening.
+
+        Returns:
+            GameServer: self, with `port` set to the bound port
+        """
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        """Run one player's session on a connection"""
+        self.active_sessions += 1
+        self.total_sessions += 1
+        try:
+            await self._play(reader, writer)
+        except (_SessionClosed, ConnectionError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _play(self, reader, writer):
+        """Drive a GameCore session from socket input until it ends"""
+        session = _Session(self.core.engine, self.max_history, self.exporter)
+        renderer = FrameRenderer(BinarySink(writer, newline="\r\n"))
+        try:
+            await self._run_session(session, renderer, reader, writer)
+        finally:
+            self.end_reasons[session.end_reason or 'disconnected'] += 1
+            self.writes += renderer.writes
+            self.bytes_sent += renderer.bytes_written
+
+    def _read_timeout(self, started: float):
+        """Timeout for the next socket read and the end reason if it expires"""
+        if self.max_seconds is not None:
+            remaining = max(0.0, started + self.max_seconds - time.monotonic())
+            if self.idle_timeout is None or remaining <= self.idle_timeout:
+                return remaining, 'time_budget'
+        return self.idle_timeout, 'idle_timeout'
+
+    async def _run_session(self, session, renderer, reader, writer):
+        """Exchange frames and keys for one session, one write per step"""
+        core = self.core
+        decoder = TelnetKeyDecoder()
+        keys = []
+        writer.write(TELNET_CHARACTER_MODE)
+        frames, state = core.start(session.seed)
+        renderer.write(*frames)
+        await writer.drain()
+        started = time.monotonic()
+
+        while state.node:
+            session.end_reason = session_limit(self.button_dat, state, started, self.max_steps, self.max_seconds)
+            while not keys and not session.end_reason:
+                timeout, reason = self._read_timeout(started)
+                try:
+                    data = await asyncio.wait_for(reader.read(1024), timeout)
+                except asyncio.TimeoutError:
+                    session.end_reason = reason
+                    break
+                if not data:
+                    raise _SessionClosed()
+                keys.extend(decoder.feed(data))
+            if session.end_reason:
+                renderer.write(END_MESSAGES[session.end_reason], self._summary(session))
+                await writer.drain()
+                return
+            key = keys.pop(0)
+            if key == 'QUIT':
+                renderer.write("\nGoodbye!\n")
+                await writer.drain()
+                raise _SessionClosed()
+
+            step_started = time.perf_counter()
+            frames, new_state = core.step(state, key)
+            if new_state is state:
+                continue
+            state = new_state
+            result = state.last
+            summary = ""
+            if result.next_node:
+                session.log(
+                    result.from_node, result.next_node, result.edge_selector,
+                    result.combined_text, result.is_desired
+                )
+            else:
+                session.end_reason = 'end'
+                summary = self._summary(session)
+            renderer.write(*frames, summary)
+            self.steps += 1
+            self.step_seconds += time.perf_counter() - step_started
+            await writer.drain()
+
+    def _summary(self, session):
+        """Render a session's end-of-game summary at the server's width"""
+        return render_journey_summary(session.journey, self.width, self.developer_mode)
+
+
+def main(argv=None):
+    """Serve the game over TCP until interrupted"""
+    args = sys.argv[1:] if argv is None else argv
+    port = int(args[0]) if args else int(os.getenv("BUTTON_SERVER_PORT", "8000"))
+    export_path = os.getenv("BUTTON_JOURNEY_EXPORT")
+    exporter = JourneyExporter(open_sink(export_path)) if export_path else None
+    max_steps = os.getenv("BUTTON_MAX_STEPS")
+    max_seconds = os.getenv("BUTTON_MAX_SECONDS")
+    idle_timeout = os.getenv("BUTTON_IDLE_TIMEOUT")
+    server = GameServer(
+        port=port, exporter=exporter,
+        max_steps=int(max_steps) if max_steps else None,
+        max_seconds=float(max_seconds) if max_seconds else None,
+        idle_timeout=float(idle_timeout) if idle_timeout else DEFAULT_IDLE_TIMEOUT
+    )
+    print(f"🎮 Serving 'Press A Button Now' on port {port} (telnet localhost {port})")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if exporter is not None:
+            exporter.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
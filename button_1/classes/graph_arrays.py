@@ -0,0 +1,138 @@
+"""
+GraphArrays - Integer Array Form of the Story Graph
+===================================================
+
+This module compiles a ContentBundle's nodes, edges and edge selector
+semantics into flat NumPy arrays so whole populations of playthroughs can
+be advanced with vectorized operations instead of one NodeEngine step at a
+time.
+
+Nodes are numbered in `ContentBundle.node_names` order. Outgoing edges are
+stored in compressed sparse row (CSR) form: the edges leaving node `i`
+occupy positions `indptr[i]:indptr[i + 1]` of `targets`, `edge_ids` and
+`desired`, in the same order NodeEngine sees them.
+
+Selector Codes:
+    SELECT_FIRST: auto, start and any other selector take the first edge
+    SELECT_RANDOM: random picks an outgoing edge uniformly
+    SELECT_END: end stops the game even if the node has outgoing edges
+
+Classes:
+    GraphArrays: CSR adjacency, selector codes and desired flags
+
+Functions:
+    compile_graph_arrays: Build GraphArrays from a content bundle
+"""
+
+import numpy as np
+
+
+SELECT_FIRST = 0
+SELECT_RANDOM = 1
+SELECT_END = 2
+
+DESIRED_UNKNOWN = -1
+
+
+class GraphArrays:
+    """
+    Read-only array view of the story graph.
+
+    Attributes:
+        node_names (tuple): Node name for each index
+        node_index (dict): Node name to index
+        selector (np.ndarray): int8 selector code per node
+        indptr (np.ndarray): int64 CSR row pointer, length n_nodes + 1
+        targets (np.ndarray): int32 target node index per CSR position
+        edge_ids (np.ndarray): int32 ContentBundle edge id per CSR position
+        desired (np.ndarray): int8 desired flag per CSR position
+            (1, 0, or -1 when unknown)
+        out_degree (np.ndarray): int32 number of outgoing edges per node
+        absorbing (np.ndarray): bool, True where a game ends on arrival
+    """
+
+    def __init__(self, node_names, selector, indptr, targets, edge_ids, desired):
+        self.node_names = tuple(node_names)
+        self.node_index = {name: i for i, name in enumerate(self.node_names)}
+        self.selector = selector
+        self.indptr = indptr
+        self.targets = targets
+        self.edge_ids = edge_ids
+        self.desired = desired
+        self.out_degree = np.diff(indptr).astype(np.int32)
+        self.absorbing = (selector == SELECT_END) | (self.out_degree == 0)
+        for array in (selector, indptr, targets, edge_ids, desired, self.out_degree, self.absorbing):
+            array.flags.writeable = False
+
+    @property
+    def n_nodes(self):
+        """Number of nodes"""
+        return len(self.node_names)
+
+    @property
+    def n_edges(self):
+        """Number of edges"""
+        return len(self.targets)
+
+    def index_of(self, node_name):
+        """
+        Get the index of a node.
+
+        Raises:
+            KeyError: If the node is not in the graph
+        """
+        try:
+            return self.node_index[node_name]
+        except KeyError:
+            raise KeyError(f"Unknown node: {node_name!r}") from None
+
+    def edge_label(self, position):
+        """Get the (source, target) names for a CSR position"""
+        source = int(np.searchsorted(self.indptr, position, side='right')) - 1
+        return self.node_names[source], self.node_names[self.targets[position]]
+
+
+def _selector_code(edge_selector):
+    """Map an edge_selector value onto its selector code"""
+    if edge_selector == 'random':
+        return SELECT_RANDOM
+    if edge_selector == 'end':
+        return SELECT_END
+    return SELECT_FIRST
+
+
+def compile_graph_arrays(content):
+    """
+    Build the array form of a content bundle's story graph.
+
+    Args:
+        content (ContentBundle): Compiled game content
+
+    Returns:
+        GraphArrays: CSR adjacency with selector codes and desired flags
+    """
+    names = content.node_names
+    index = {name: i for i, name in enumerate(names)}
+
+    selector = np.zeros(len(names), dtype=np.int8)
+    indptr = np.zeros(len(names) + 1, dtype=np.int64)
+    for i, name in enumerate(names):
+        row = content.nodes.get(name)
+        if row is not None:
+            selector[i] = _selector_code(row[1])
+        indptr[i + 1] = indptr[i] + len(content.out_edges.get(name, ()))
+
+    edge_ids = np.fromiter(
+        (edge_id for name in names for edge_id in content.out_edges.get(name, ())),
+        dtype=np.int32, count=int(indptr[-1])
+    )
+    targets = np.fromiter(
+        (index[content.edges[edge_id][1]] for edge_id in edge_ids),
+        dtype=np.int32, count=len(edge_ids)
+    )
+    desired = np.fromiter(
+        (DESIRED_UNKNOWN if content.edges[edge_id][3] is None else int(content.edges[edge_id][3])
+         for edge_id in edge_ids),
+        dtype=np.int8, count=len(edge_ids)
+    )
+    return GraphArrays(names, selector, indptr, targets, edge_ids, desired)
@@ -0,0 +1,306 @@
+"""
+HttpApi - Stateless HTTP Step API with Signed Session Tokens
+============================================================
+
+This module serves the game over HTTP without keeping any session state on
+the server. Each request is a thin adapter over GameCore.step, and the
+session's GameState travels with the client in a compact signed token:
+
+    - the current node
+    - the state of the session's random stream and the step number
+    - a running digest of the journey so far
+    - a prefix of the content hash the session was started on
+
+Tokens are `<payload>.<signature>`, both base64url, where the signature is
+a truncated HMAC-SHA256 of the payload. Every worker configured with the
+same secret (BUTTON_API_SECRET) can serve every request, so the API scales
+horizontally behind a plain load balancer with no sticky sessions.
+
+Endpoints:
+    POST /start            -> first node frame and token
+    POST /step             -> {"token", "key"} in, next frame and token out
+    GET  /nodes/<node>     -> a node's static frame, with an ETag
+
+Classes:
+    TokenError: Raised for malformed, forged or stale tokens
+    StepApi: Transport-independent start/step/node logic
+    StepRequestHandler: http.server handler exposing StepApi
+
+Functions:
+    make_server: Build a threading HTTP server for a StepApi
+
+Usage:
+    python -m button_1.classes.http_api [PORT]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+import urllib.parse
+
+from .content_registry import content_registry
+from .game_core import GameCore, GameState, render_summary_footer
+
+
+TOKEN_VERSION = 1
+_SIGNATURE_BYTES = 16
+
+
+class TokenError(ValueError):
+    """Raised when a session token is malformed, forged or for other content"""
+
+
+def _b64encode(data: bytes):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+class StepApi:
+    """
+    Stateless game logic behind the HTTP endpoints.
+
+    Attributes:
+        button_dat (ButtonDat): Shared, read-only content snapshot
+        width (int): Wrap width for rendered frames
+        core (GameCore): Game rules and frames shared by every request
+        content_tag (str): Content hash prefix embedded in tokens
+    """
+
+    def __init__(self, button_dat=None, secret: bytes = None, width: int = 80):
+        """
+        Initialize the API.
+
+        Args:
+            button_dat (ButtonDat, optional): Content snapshot. Defaults to the
+                shared snapshot from the content registry
+            secret (bytes, optional): Token signing key. Defaults to
+                BUTTON_API_SECRET, or a random key (single worker only)
+            width (int): Wrap width for rendered frames. Defaults to 80
+        """
+        self.button_dat = button_dat or content_registry.get()
+        env_secret = os.getenv("BUTTON_API_SECRET")
+        self._secret = secret or (env_secret.encode('utf-8') if env_secret else secrets.token_bytes(32))
+        self.width = width
+        self.core = GameCore(self.button_dat, width=width)
+        self.content_tag = self.button_dat.content.content_hash[:12]
+
+    # Tokens
+
+    def encode_token(self, state: GameState, digest):
+        """Sign a session state and journey digest into a token"""
+        payload = _b64encode(json.dumps(
+            [TOKEN_VERSION, state.node, state.rng, state.steps, digest, self.content_tag], separators=(',', ':')
+        ).encode('utf-8'))
+        signature = hmac.new(self._secret, payload.encode('ascii'), hashlib.sha256).digest()
+        return f"{payload}.{_b64encode(signature[:_SIGNATURE_BYTES])}"
+
+    def decode_token(self, token):
+        """
+        Verify a token and return its state.
+
+        Returns:
+            tuple: (GameState, digest)
+
+        Raises:
+            TokenError: If the token is malformed, forged or for other content
+        """
+        try:
+            payload, signature = token.split('.')
+            expected = hmac.new(self._secret, payload.encode('ascii'), hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+            if not hmac.compare_digest(_b64decode(signature), expected):
+                raise TokenError("Token signature does not match")
+            version, node, rng, steps, digest, content_tag = json.loads(_b64decode(payload))
+        except TokenError:
+            raise
+        except (ValueError, TypeError, AttributeError, UnicodeError) as exc:
+            raise TokenError(f"Malformed token: {exc}") from None
+        if version != TOKEN_VERSION:
+            raise TokenError(f"Unsupported token version: {version!r}")
+        if content_tag != self.content_tag:
+            raise TokenError("Token was issued for different game content")
+        return GameState(node, rng, steps), digest
+
+    @staticmethod
+    def journey_digest(digest, from_node, to_node):
+        """Extend a running journey digest with one transition"""
+        return hashlib.sha256(f"{digest}|{from_node}>{to_node}".encode('utf-8')).hexdigest()[:16]
+
+    # Frames
+
+    def node_frame(self, node):
+        """Render a node's static frame: title, intro, event and prompt"""
+        return self.core.node_frame(node)
+
+    def node_etag(self, node):
+        """Get the ETag of a node's static frame"""
+        return '"' + hashlib.sha256(f"{self.content_tag}:{node}:{self.width}".encode('utf-8')).hexdigest()[:16] + '"'
+
+    # Operations
+
+    def start(self, seed: int = None):
+        """
+        Begin a session.
+
+        Args:
+            seed (int, optional): Session seed. Random when omitted
+
+        Returns:
+            dict: token, node, frame and done flag
+        """
+        frames, state = self.core.start(seed)
+        return {
+            'token': self.encode_token(state, ""),
+            'node': state.node,
+            'frame': "".join(frames),
+            'done': False,
+        }
+
+    def step(self, token, key):
+        """
+        Apply one key press to the session in a token.
+
+        Keys other than RIGHT or ENTER leave the session where it is.
+
+        Args:
+            token (str): Token from the previous response
+            key (str): Key name ('RIGHT', 'ENTER', 'LEFT', ...)
+
+        Returns:
+            dict: token, node, frame, transition and done flag
+
+        Raises:
+            TokenError: If the token is not valid for this content
+        """
+        state, digest = self.decode_token(token)
+        frames, new_state = self.core.step(state, key)
+        if new_state is state:
+            return {'token': token, 'node': state.node, 'frame': "", 'transition': None, 'done': state.done}
+
+        result = new_state.last
+        frame = "".join(frames)
+        if result.next_node:
+            digest = self.journey_digest(digest, result.from_node, result.next_node)
+        else:
+            frame += render_summary_footer(new_state.nodes_visited) + "\n"
+
+        return {
+            'token': self.encode_token(new_state, digest),
+            'node': new_state.node,
+            'frame': frame,
+            'transition': {
+                'from': result.from_node,
+                'to': result.next_node,
+                'edge_selector': result.edge_selector,
+                'outro_text': result.combined_text,
+                'is_desired': result.is_desired,
+            },
+            'done': new_state.done,
+        }
+
+
+class StepRequestHandler(BaseHTTPRequestHandler):
+    """Expose a StepApi (set as the server's `api` attribute) over HTTP"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        """Keep request logging off the game console"""
+
+    def _send_json(self, status, body, headers=()):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        body = json.loads(self.rfile.read(length))
+        if not isinstance(body, dict):
+            raise ValueError("JSON body must be an object")
+        return body
+
+    def do_POST(self):
+        api = self.server.api
+        try:
+            body = self._read_json()
+            if self.path == "/start":
+                self._send_json(200, api.start(body.get('seed')))
+            elif self.path == "/step":
+                self._send_json(200, api.step(body['token'], body.get('key')))
+            else:
+                self._send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+        except TokenError as exc:
+            self._send_json(403, {'error': str(exc)})
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {'error': f"Bad request: {exc}"})
+
+    def do_GET(self):
+        api = self.server.api
+        prefix = "/nodes/"
+        path = urllib.parse.urlsplit(self.path).path
+        node = urllib.parse.unquote(path[len(prefix):]) if path.startswith(prefix) else None
+        if not node or node not in api.button_dat.node_views:
+            self._send_json(404, {'error': f"Unknown node: {node!r}"})
+            return
+        etag = api.node_etag(node)
+        cache_headers = (("ETag", etag), ("Cache-Control", "public, max-age=3600"))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            for name, value in cache_headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send_json(200, {'node': node, 'frame': api.node_frame(node)}, cache_headers)
+
+
+def make_server(api: StepApi, host: str = "0.0.0.0", port: int = 8000):
+    """
+    Build a threading HTTP server for a StepApi.
+
+    Args:
+        api (StepApi): Game logic to serve
+        host (str): Interface to listen on. Defaults to all interfaces
+        port (int): Port to listen on (0 picks a free port). Defaults to 8000
+
+    Returns:
+        ThreadingHTTPServer: Server ready for serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), StepRequestHandler)
+    server.api = api
+    return server
+
+
+def main(argv=None):
+    """Serve the step API until interrupted"""
+    args = sys.argv[1:] if argv is None else argv
+    port = int(args[0]) if args else int(os.getenv("BUTTON_SERVER_PORT", "8000"))
+    if not os.getenv("BUTTON_API_SECRET"):
+        print("⚠️  BUTTON_API_SECRET is not set; tokens will only be valid on this worker")
+    server = make_server(StepApi(), port=port)
+    print(f"🎮 Serving the step API on port {port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""
+JourneyExport - Streaming Journey Export on a Background Writer
+===============================================================
+
+This module persists every journey transition as it happens, for
+analysis outside the game. ButtonGame hands each logged transition to a
+JourneyExporter, which only puts a small row tuple on a bounded queue;
+a background thread drains the queue in batches and writes each batch
+to a sink with one call. The game loop never waits on disk, and memory
+stays bounded however many journeys a long-running server exports.
+
+Each row is:
+
+    (session_id, step, from_node, to_node, edge_selector, is_desired, timestamp)
+
+Outro text is not exported; it can be resolved from the content for any
+(from_node, to_node) pair.
+
+Sinks:
+    JsonlSink: Appends one JSON object per row to a file
+    ParquetSink: Writes Parquet row groups (requires pyarrow)
+    BufferSink: Keeps rows in memory, optionally only the most recent
+    SqliteSink: Inserts rows into a SQLite warehouse (see journey_store)
+
+Classes:
+    JourneyExporter: Bounded queue plus batching writer thread
+
+Functions:
+    open_sink: Pick a file sink from a path's suffix
+"""
+
+from collections import deque
+from pathlib import Path
+import json
+import queue
+import threading
+import time
+
+from .journey_store import SqliteSink
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only ParquetSink needs it
+    pa = None
+    pq = None
+
+
+FIELDS = ('session_id', 'step', 'from_node', 'to_node', 'edge_selector', 'is_desired', 'timestamp')
+
+
+class JsonlSink:
+    """
+    Append rows to a JSON-lines file, one write per batch.
+
+    Attributes:
+        path (Path): Output file
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, 'a', encoding='utf-8')
+
+    def write_batch(self, rows):
+        """Write a batch of rows"""
+        self._handle.write("".join(
+            json.dumps(dict(zip(FIELDS, row)), separators=(',', ':')) + "\n" for row in rows
+        ))
+        self._handle.flush()
+
+    def close(self):
+        """Close the file"""
+        self._handle.close()
+
+
+class ParquetSink:
+    """
+    Write rows to a Parquet file in row groups.
+
+    Rows are held until a full row group is ready, so memory is bounded by
+    row_group_size whatever the batch size.
+
+    Attributes:
+        path (Path): Output file
+        row_group_size (int): Rows per row group
+    """
+
+    def __init__(self, path, row_group_size: int = 65_536):
+        """
+        Open the file.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ImportError("ParquetSink requires pyarrow (pip install pyarrow)")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        self._schema = pa.schema([
+            ('session_id', pa.string()),
+            ('step', pa.int64()),
+            ('from_node', pa.string()),
+            ('to_node', pa.string()),
+            ('edge_selector', pa.string()),
+            ('is_desired', pa.bool_()),
+            ('timestamp', pa.float64()),
+        ])
+        self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._pending = []
+
+    def _write_group(self, rows):
+        columns = list(zip(*rows))
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self._schema)],
+            schema=self._schema
+        )
+        self._writer.write_table(table)
+
+    def write_batch(self, rows):
+        """Add rows, writing every complete row group"""
+        self._pending.extend(rows)
+        while len(self._pending) >= self.row_group_size:
+            self._write_group(self._pending[:self.row_group_size])
+            del self._pending[:self.row_group_size]
+
+    def close(self):
+        """Write the last, partial row group and close the file"""
+        if self._pending:
+            self._write_group(self._pending)
+            self._pending = []
+        self._writer.close()
+
+
+class BufferSink:
+    """
+    Keep rows in memory.
+
+    Attributes:
+        rows (deque): Exported rows, the oldest first
+    """
+
+    def __init__(self, maxlen: int = None):
+        """
+        Args:
+            maxlen (int, optional): Keep only this many recent rows
+        """
+        self.rows = deque(maxlen=maxlen)
+
+    def write_batch(self, rows):
+        """Store a batch of rows"""
+        self.rows.extend(rows)
+
+    def close(self):
+        """Nothing to release"""
+
+
+def open_sink(path, **kwargs):
+    """
+    Open a file sink based on the path's suffix.
+
+    Args:
+        path (str or Path): '.parquet' for ParquetSink, '.db', '.sqlite' or
+            '.sqlite3' for SqliteSink, anything else for JsonlSink
+        **kwargs: Passed to the sink
+
+    Returns:
+        JsonlSink, ParquetSink or SqliteSink: The opened sink
+    """
+    suffix = Path(path).suffix
+    if suffix == '.parquet':
+        return ParquetSink(path, **kwargs)
+    if suffix in ('.db', '.sqlite', '.sqlite3'):
+        return SqliteSink(path, **kwargs)
+    return JsonlSink(path, **kwargs)
+
+
+class _Flush:
+    """Queue marker asking the writer to write everything queued before it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_CLOSE = object()
+
+
+class JourneyExporter:
+    """
+    Export journey rows through a bounded queue and a batching writer thread.
+
+    submit() never blocks: if the writer falls so far behind that the queue
+    is full, the row is dropped and counted rather than stalling the game.
+    Rows submitted after close() are dropped too. Counters are updated
+    under a lock, so any number of sessions may share one exporter.
+
+    Attributes:
+        sink: Destination with write_batch(rows) and close()
+        batch_size (int): Rows written per sink call at most
+        flush_interval (float): Seconds after which a partial batch is written
+        submitted (int): Rows accepted
+        written (int): Rows written to the sink
+        dropped (int): Rows dropped because the queue was full
+        batches (int): Sink writes made
+        error (Exception or None): First error raised by the sink
+    """
+
+    def __init__(self, sink, batch_size: int = 1024, flush_interval: float = 1.0, max_queue: int = 100_000):
+        """
+        Start the writer thread.
+
+        Args:
+            sink: Destination with write_batch(rows) and close()
+            batch_size (int): Rows per sink call at most. Defaults to 1,024
+            flush_interval (float): Maximum seconds a row waits for its batch
+                to fill. Defaults to 1 second
+            max_queue (int): Rows that may wait for the writer. Defaults to 100,000
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.error = None
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="journey-exporter", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def submit(self, session_id, step, from_node, to_node, edge_selector, is_desired):
+        """
+        Queue one transition for export without waiting.
+
+        Returns:
+            bool: False if the row was dropped because the queue was full
+                or the exporter is closed
+        """
+        row = (session_id, step, from_node, to_node, edge_selector, is_desired, time.time())
+        # Checked under the close lock so no row can land behind _CLOSE
+        with self._close_lock:
+            accepted = not self._closed
+            if accepted:
+                try:
+                    self._queue.put_nowait(row)
+                except queue.Full:
+                    accepted = False
+        with self._count_lock:
+            if accepted:
+                self.submitted += 1
+            else:
+                self.dropped += 1
+        return accepted
+
+    def flush(self, timeout: float = None):
+        """
+        Wait until every row submitted so far has been written.
+
+        Once the exporter is closed everything has been written, so this
+        returns at once.
+
+        Returns:
+            bool: True if the writer caught up within the timeout
+        """
+        with self._close_lock:
+            if self._closed:
+                return True
+            marker = _Flush()
+            self._queue.put(marker)
+        return marker.done.wait(timeout)
+
+    def close(self):
+        """
+        Write everything queued, stop the writer and close the sink.
+
+        Raises:
+            Exception: The first error the sink raised, if any
+        """
+        with self._close_lock:
+            closing = not self._closed
+            if closing:
+                self._closed = True
+                self._queue.put(_CLOSE)
+        if closing:
+            self._thread.join()
+            self.sink.close()
+        if self.error is not None:
+            raise self.error
+
+    def _write(self, batch):
+        """Write one batch, remembering (not raising) sink errors"""
+        if not batch or self.error is not None:
+            return
+        try:
+            self.sink.write_batch(batch)
+        except Exception as exc:  # keep draining so submit() never blocks
+            self.error = exc
+            return
+        with self._count_lock:
+            self.written += len(batch)
+            self.batches += 1
+
+    def _run(self):
+        """Writer thread: gather rows into batches and hand them to the sink"""
+        batch = []
+        deadline = None
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=wait)
+            except queue.Empty:
+                self._write(batch)
+                batch, deadline = [], None
+                continue
+            if item is _CLOSE or isinstance(item, _Flush):
+                self._write(batch)
+                batch, deadline = [], None
+                if item is _CLOSE:
+                    return
+                item.done.set()
+                continue
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch, deadline = [], None
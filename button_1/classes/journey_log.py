@@ -0,0 +1,194 @@
+"""
+JourneyLog - Compact, Optionally Bounded Record of a Player's Journey
+=====================================================================
+
+This module stores ButtonGame's journey as one small integer per step:
+the content edge id of each transition, in an `array` of 2-byte (or, for
+very large stories, 4-byte) slots. Outro text, edge feedback, selectors
+and desired flags are not copied into the log; they are resolved from
+the content snapshot only when an entry is read, e.g. by the journey
+summary.
+
+Transitions that are not plain content edges (the start entry, or
+anything logged by hand with different details) are kept in a small side
+table keyed by step number, so every entry reads back exactly as it was
+logged.
+
+Story loops such as report_analytics -> source_data can make random
+sessions arbitrarily long. With `max_history` set, only the most recent
+entries are kept; older ones are discarded in amortized O(1) and counted
+in `dropped`.
+
+Classes:
+    JourneyLog: Sequence of journey entries backed by an edge id array
+"""
+
+from array import array
+from collections.abc import Sequence
+import sys
+
+
+_SIDE_ENTRY = -1
+
+
+class JourneyLog(Sequence):
+    """
+    Journey entries stored as content edge ids.
+
+    Reads like the list of dicts ButtonGame.game_path used to be: indexing,
+    slicing and iteration give dicts with 'from', 'to', 'edge_selector',
+    'outro_text' and 'is_desired', built on access.
+
+    Attributes:
+        engine (NodeEngine): Engine whose content and transition rules
+            resolve entries
+        max_history (int or None): Entries kept, None for no limit
+        dropped (int): Entries discarded because of max_history
+    """
+
+    def __init__(self, engine, max_history: int = None):
+        """
+        Initialize an empty log.
+
+        Args:
+            engine (NodeEngine): Engine used to resolve edges into entries
+            max_history (int, optional): Keep only this many recent entries.
+                Defaults to keeping everything
+
+        Raises:
+            ValueError: If max_history is not positive
+        """
+        if max_history is not None and max_history <= 0:
+            raise ValueError("JourneyLog max_history must be positive")
+        self.engine = engine
+        self.max_history = max_history
+        self.dropped = 0
+        edge_count = len(engine.button_dat.edge_views)
+        self._ids = array('h' if edge_count < 2 ** 15 else 'i')
+        self._start = 0
+        self._side = {}
+        self._records = {}
+
+    @property
+    def total(self):
+        """Entries ever logged, including dropped ones"""
+        return self.dropped + len(self)
+
+    @property
+    def itemsize(self):
+        """Bytes used per logged step"""
+        return self._ids.itemsize
+
+    def _record(self, edge_id):
+        """Resolve an edge id into its (from, to, selector, text, desired) entry, once"""
+        record = self._records.get(edge_id)
+        if record is None:
+            edge = self.engine.button_dat.edge_views[edge_id]
+            result = self.engine.resolve_transition(edge.source, edge.target)
+            record = self._records[edge_id] = (
+                result.from_node, result.next_node, result.edge_selector, result.combined_text, result.is_desired
+            )
+        return record
+
+    def append(self, from_node, to_node, edge_selector="auto", outro_text=None, is_desired=None):
+        """
+        Log one transition.
+
+        Stored as the content edge id when the details are exactly what the
+        content says for that edge, otherwise kept verbatim in the side table.
+        """
+        entry = (from_node, to_node, edge_selector, outro_text, is_desired)
+        view = self.engine.views.get(from_node) if from_node is not None else None
+        edge = view.edge_by_target.get(to_node) if view is not None else None
+        if edge is not None and self._record(edge.edge_id) == entry:
+            self._ids.append(edge.edge_id)
+        else:
+            self._side[self.total] = entry
+            self._ids.append(_SIDE_ENTRY)
+        if self.max_history is not None and len(self) > self.max_history:
+            self._drop_oldest()
+
+    def _drop_oldest(self):
+        """Forget the oldest entry, compacting the array once half of it is stale"""
+        self._side.pop(self.dropped, None)
+        self.dropped += 1
+        self._start += 1
+        if self._start >= self.max_history:
+            del self._ids[:self._start]
+            self._start = 0
+
+    def _entry(self, position):
+        """Build the dict for a physical array position"""
+        edge_id = self._ids[position]
+        if edge_id == _SIDE_ENTRY:
+            record = self._side[self.dropped + position - self._start]
+        else:
+            record = self._record(edge_id)
+        return dict(zip(('from', 'to', 'edge_selector', 'outro_text', 'is_desired'), record))
+
+    def __len__(self):
+        return len(self._ids) - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(self._start + i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("JourneyLog index out of range")
+        return self._entry(self._start + index)
+
+    def __iter__(self):
+        for position in range(self._start, len(self._ids)):
+            yield self._entry(position)
+
+    def snapshot(self):
+        """
+        Get the log's contents in a compact, serializable form.
+
+        Returns:
+            tuple: (dropped, little-endian edge id bytes, side entries as
+                (step, entry) pairs)
+        """
+        ids = self._ids[self._start:]
+        if sys.byteorder == 'big':
+            ids.byteswap()
+        return self.dropped, ids.tobytes(), tuple(sorted(self._side.items()))
+
+    @classmethod
+    def restore(cls, engine, snapshot, max_history: int = None):
+        """
+        Rebuild a log from snapshot().
+
+        Args:
+            engine (NodeEngine): Engine over the same content the log was taken on
+            snapshot (tuple): Value returned by snapshot()
+            max_history (int, optional): History cap for the restored log
+
+        Returns:
+            JourneyLog: Log with the same entries
+
+        Raises:
+            ValueError: If the edge id bytes do not fit this content's slot size
+        """
+        dropped, ids, side = snapshot
+        log = cls(engine, max_history=max_history)
+        if len(ids) % log._ids.itemsize:
+            raise ValueError("Journey snapshot does not match this content's edge id size")
+        log._ids.frombytes(ids)
+        if sys.byteorder == 'big':
+            log._ids.byteswap()
+        log.dropped = dropped
+        log._side = dict(side)
+        while max_history is not None and len(log) > max_history:
+            log._drop_oldest()
+        return log
+
+    def nodes(self):
+        """Get the 'to' node of every kept entry, without building dicts"""
+        views = self.engine.button_dat.edge_views
+        first = self.dropped - self._start
+        return [
+            self._side[first + position][1] if edge_id == _SIDE_ENTRY else views[edge_id].target
+            for position, edge_id in enumerate(self._ids) if position >= self._start
+        ]
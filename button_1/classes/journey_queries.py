@@ -0,0 +1,151 @@
+"""
+JourneyQueries - Funnel, Loop and Edge Analytics over Stored Journeys
+=====================================================================
+
+This module answers questions about many stored sessions at once, from
+the database SqliteSink writes: how far players get through a sequence of
+nodes, which nodes they keep coming back to, and how often each edge goes
+the way the content intends. Queries run on a separate read connection,
+so with the store in WAL mode they can run while a live server writes.
+
+Classes:
+    FunnelStage: Sessions reaching one stage of a funnel
+    JourneyQueries: Read-only analytics over a journey database
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import sqlite3
+
+
+@dataclass(frozen=True, slots=True)
+class FunnelStage:
+    """
+    Sessions that reached one stage of a funnel.
+
+    Attributes:
+        node (str): Stage node
+        sessions (int): Sessions that reached this node after every earlier stage
+        conversion (float): Share of the previous stage's sessions, 1.0 for the first
+    """
+
+    node: str
+    sessions: int
+    conversion: float
+
+
+class JourneyQueries:
+    """
+    Analytics over a journey database written by SqliteSink.
+
+    Attributes:
+        path (Path): Database file
+    """
+
+    def __init__(self, path):
+        """
+        Open the database read-only.
+
+        Args:
+            path (str or Path): Database file
+
+        Raises:
+            FileNotFoundError: If the database does not exist
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"No journey database at {self.path}")
+        self._connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        """Close the database"""
+        self._connection.close()
+
+    def session_count(self):
+        """Get the number of stored sessions"""
+        return self._connection.execute("SELECT count(*) FROM sessions").fetchone()[0]
+
+    def funnel(self, nodes):
+        """
+        Count sessions passing through nodes in order.
+
+        A session reaches a stage when it visits the stage's node at a later
+        step than it first reached the previous stage.
+
+        Args:
+            nodes (list): Stage nodes, in order
+
+        Returns:
+            list: FunnelStage per node
+        """
+        nodes = list(nodes)
+        placeholders = ", ".join("?" * len(nodes))
+        visits = {}
+        for session_id, node, step in self._connection.execute(
+            f"SELECT session_id, to_node, step FROM transitions WHERE to_node IN ({placeholders}) "
+            "ORDER BY session_id, step",
+            nodes
+        ):
+            visits.setdefault(session_id, []).append((node, step))
+
+        reached = [0] * len(nodes)
+        for steps in visits.values():
+            stage = 0
+            for node, _ in steps:
+                if stage < len(nodes) and node == nodes[stage]:
+                    reached[stage] += 1
+                    stage += 1
+
+        stages = []
+        for index, node in enumerate(nodes):
+            previous = reached[index - 1] if index else reached[0]
+            stages.append(FunnelStage(node, reached[index], reached[index] / previous if previous else 0.0))
+        return stages
+
+    def loop_counts(self):
+        """
+        Count returns to each node: visits beyond a session's first.
+
+        Returns:
+            dict: node -> (repeat visits, sessions that repeated it), most
+                repeated first
+        """
+        rows = self._connection.execute(
+            """
+            SELECT to_node, sum(visits - 1), count(*)
+            FROM (SELECT session_id, to_node, count(*) AS visits FROM transitions
+                  GROUP BY session_id, to_node HAVING visits > 1)
+            GROUP BY to_node ORDER BY 2 DESC, to_node
+            """
+        )
+        return {node: (repeats, sessions) for node, repeats, sessions in rows}
+
+    def edge_ratios(self):
+        """
+        Count desired and undesired traversals of each edge.
+
+        Traversals whose desired flag was not recorded count as neither.
+
+        Returns:
+            dict: (from_node, to_node) -> (desired, undesired, desired share),
+                the share being None when no traversal has a known flag
+        """
+        rows = self._connection.execute(
+            """
+            SELECT from_node, to_node, coalesce(sum(is_desired = 1), 0), coalesce(sum(is_desired = 0), 0)
+            FROM transitions WHERE from_node IS NOT NULL
+            GROUP BY from_node, to_node ORDER BY from_node, to_node
+            """
+        )
+        ratios = {}
+        for source, target, desired, undesired in rows:
+            total = desired + undesired
+            ratios[(source, target)] = (desired, undesired, desired / total if total else None)
+        return ratios
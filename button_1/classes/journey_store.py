@@ -0,0 +1,139 @@
+"""
+JourneyStore - SQLite Warehouse for Exported Journeys
+=====================================================
+
+This module keeps every exported journey in an embedded SQLite database,
+so sessions outlive the process that played them. SqliteSink is a
+JourneyExporter sink: rows arrive in batches on the exporter's writer
+thread and each batch is written in one transaction with executemany, so
+the game loop never waits on the database.
+
+The database runs in WAL mode with synchronous=NORMAL: readers (see
+JourneyQueries) never block the writer, and a batch costs one WAL append
+rather than a full sync. Schema:
+
+    sessions     one row per session: first and last timestamp, the
+                 number of transitions stored and the last node reached
+    transitions  one row per logged step, unique on (session_id, step),
+                 indexed by edge and by target node for the queries
+
+Classes:
+    SqliteSink: Batched, idempotent transition writer
+
+Functions:
+    connect: Open a journey database with the store's settings and schema
+"""
+
+from pathlib import Path
+import sqlite3
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id   TEXT PRIMARY KEY,
+    first_seen   REAL NOT NULL,
+    last_seen    REAL NOT NULL,
+    transitions  INTEGER NOT NULL,
+    last_node    TEXT
+);
+CREATE TABLE IF NOT EXISTS transitions (
+    session_id     TEXT NOT NULL,
+    step           INTEGER NOT NULL,
+    from_node      TEXT,
+    to_node        TEXT NOT NULL,
+    edge_selector  TEXT,
+    is_desired     INTEGER,
+    timestamp      REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS transitions_session_step ON transitions (session_id, step);
+CREATE INDEX IF NOT EXISTS transitions_edge ON transitions (from_node, to_node);
+CREATE INDEX IF NOT EXISTS transitions_to_node ON transitions (to_node);
+"""
+
+_INSERT_TRANSITION = "INSERT OR IGNORE INTO transitions VALUES (?, ?, ?, ?, ?, ?, ?)"
+_UPSERT_SESSION = """
+INSERT INTO sessions VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (session_id) DO UPDATE SET
+    first_seen = min(first_seen, excluded.first_seen),
+    last_seen = max(last_seen, excluded.last_seen),
+    transitions = transitions + excluded.transitions,
+    last_node = CASE WHEN excluded.last_seen >= last_seen THEN excluded.last_node ELSE last_node END
+"""
+
+
+def connect(path, check_same_thread: bool = True):
+    """
+    Open a journey database, creating the schema if needed.
+
+    Args:
+        path (str or Path): Database file
+        check_same_thread (bool): Passed to sqlite3.connect
+
+    Returns:
+        sqlite3.Connection: Connection in WAL mode with synchronous=NORMAL
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=check_same_thread)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class SqliteSink:
+    """
+    Write exported journey rows to a SQLite database.
+
+    Rows already stored (same session and step) are skipped, so exporting a
+    session twice does not double count it.
+
+    Attributes:
+        path (Path): Database file
+    """
+
+    def __init__(self, path):
+        """
+        Open the database. The connection is then used only by the
+        exporter's writer thread, and by close() once that thread has stopped.
+
+        Args:
+            path (str or Path): Database file, created with its schema if missing
+        """
+        self.path = Path(path)
+        self._connection = connect(self.path, check_same_thread=False)
+
+    def write_batch(self, rows):
+        """Insert a batch of rows and update their sessions in one transaction"""
+        sessions = {}
+        for session_id, _, _, to_node, _, _, timestamp in rows:
+            first, last, count, node = sessions.get(session_id, (timestamp, timestamp, 0, to_node))
+            if timestamp >= last:
+                last, node = timestamp, to_node
+            sessions[session_id] = (min(first, timestamp), last, count + 1, node)
+        with self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(_INSERT_TRANSITION, rows)
+            if self._connection.total_changes - before == len(rows):
+                self._connection.executemany(
+                    _UPSERT_SESSION, [(session_id, *values) for session_id, values in sessions.items()]
+                )
+            else:
+                self._recount(sessions)
+
+    def _recount(self, sessions):
+        """Rebuild session rows from stored transitions after duplicates were skipped"""
+        self._connection.executemany(
+            """
+            INSERT OR REPLACE INTO sessions
+            SELECT session_id, min(timestamp), max(timestamp), count(*),
+                   (SELECT to_node FROM transitions t WHERE t.session_id = s.session_id
+                    ORDER BY step DESC LIMIT 1)
+            FROM transitions s WHERE session_id = ? GROUP BY session_id
+            """,
+            [(session_id,) for session_id in sessions]
+        )
+
+    def close(self):
+        """Close the database"""
+        self._connection.close()
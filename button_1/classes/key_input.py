@@ -0,0 +1,292 @@
+"""
+KeyInput - Buffered Key Input Backends
+======================================
+
+This module reads key presses for the game without touching the terminal
+once per key. A backend is a context manager held open for a session:
+the terminal is put into raw-style input mode on the first read, once
+for the whole session, and leaving restores the saved settings. Inside, bytes are read as they
+arrive from a `selectors`-driven non-blocking reader and decoded
+incrementally, so fast typeahead is queued rather than dropped. Escape
+sequences split across reads are completed on the next read, and a lone
+Escape resolves after a short grace period.
+
+Reads accept a timeout, so a front end can detect idle sessions.
+
+Classes:
+    InputTimeout: Raised when no key arrives within a read timeout
+    KeyDecoder: Incremental bytes -> key names decoder
+    TerminalInput: Raw-mode, buffered reader for a tty (or any readable fd)
+    ScriptedInput: Plays back a fixed key sequence, for tests and harnesses
+"""
+
+from collections import deque
+import os
+import selectors
+import sys
+import termios
+import time
+
+
+_ARROWS = {ord('A'): 'UP', ord('B'): 'DOWN', ord('C'): 'RIGHT', ord('D'): 'LEFT'}
+_IAC, _SB, _SE = 255, 250, 240
+_NEGOTIATION = frozenset((251, 252, 253, 254))  # WILL, WONT, DO, DONT
+
+
+class InputTimeout(TimeoutError):
+    """Raised when no key arrives within a read timeout"""
+
+
+class KeyDecoder:
+    """
+    Turn raw input bytes into the key names NodeEngine uses.
+
+    ESC [ X / ESC O X arrow sequences become 'UP', 'DOWN', 'RIGHT' or
+    'LEFT', CR LF / CR NUL / LF / CR become a single 'ENTER', bytes in
+    QUIT_BYTES become 'QUIT', and any other byte becomes None. Incomplete
+    sequences are kept until the next feed. Subclasses set TELNET to skip
+    telnet option negotiation as well.
+    """
+
+    QUIT_BYTES = frozenset((0x03,))  # Ctrl+C
+    TELNET = False
+
+    def __init__(self):
+        self._pending = b''
+        self._after_cr = False
+
+    @property
+    def pending(self):
+        """True while an incomplete sequence is buffered"""
+        return bool(self._pending)
+
+    def feed(self, data: bytes):
+        """
+        Decode newly received bytes.
+
+        Args:
+            data (bytes): Bytes just read
+
+        Returns:
+            list: Key names, in order
+        """
+        buffer = self._pending + data
+        keys = []
+        i, n = 0, len(buffer)
+        while i < n:
+            byte = buffer[i]
+            if self._after_cr:
+                self._after_cr = False
+                if byte in (0x0a, 0x00):  # second half of CR LF / CR NUL
+                    i += 1
+                    continue
+            if byte == _IAC and self.TELNET:
+                if i + 1 >= n:
+                    break
+                command = buffer[i + 1]
+                if command in _NEGOTIATION:
+                    if i + 2 >= n:
+                        break
+                    i += 3
+                elif command == _SB:
+                    end = buffer.find(bytes((_IAC, _SE)), i + 2)
+                    if end < 0:
+                        break
+                    i = end + 2
+                else:
+                    i += 2
+            elif byte == 0x1b:
+                if i + 1 >= n:
+                    break
+                if buffer[i + 1] in (ord('['), ord('O')):
+                    if i + 2 >= n:
+                        break
+                    keys.append(_ARROWS.get(buffer[i + 2]))
+                    i += 3
+                else:
+                    keys.append(None)
+                    i += 1
+            elif byte in (0x0d, 0x0a):
+                keys.append('ENTER')
+                self._after_cr = byte == 0x0d
+                i += 1
+            elif byte in self.QUIT_BYTES:
+                keys.append('QUIT')
+                i += 1
+            else:
+                keys.append(None)
+                i += 1
+        self._pending = buffer[i:]
+        return keys
+
+    def flush(self):
+        """
+        Give up on a buffered incomplete sequence.
+
+        Returns:
+            list: [None] for the abandoned sequence, or [] if nothing was pending
+        """
+        if not self._pending:
+            return []
+        self._pending = b''
+        return [None]
+
+
+class TerminalInput:
+    """
+    Buffered key reader that enters raw-style mode once per session.
+
+    Use as a context manager around a session: the mode is switched on the
+    first read and restored when the outermost `with` block exits. Nested
+    use is a no-op, and read_key() outside a session opens the backend
+    just for that read.
+
+    Echo, line buffering, signal keys and CR translation are turned off,
+    while output processing is left alone so printed newlines still work.
+    Non-tty inputs such as pipes are read the same way without any mode
+    change.
+
+    Attributes:
+        stream: File object whose descriptor is read (sys.stdin by default)
+        escape_timeout (float): Seconds to wait for the rest of an escape
+            sequence before treating ESC as a key on its own
+    """
+
+    def __init__(self, stream=None, escape_timeout: float = 0.05):
+        """
+        Initialize the backend without touching the terminal.
+
+        Args:
+            stream (optional): Readable file object. Defaults to sys.stdin
+            escape_timeout (float): Lone ESC grace period. Defaults to 50ms
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.escape_timeout = escape_timeout
+        self._decoder = KeyDecoder()
+        self._keys = deque()
+        self._depth = 0
+        self._fd = None
+        self._saved_mode = None
+        self._selector = None
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            self._close()
+        return False
+
+    def _open(self):
+        """Switch the terminal mode and start watching the descriptor"""
+        fd = self.stream.fileno()
+        if os.isatty(fd):
+            self._saved_mode = termios.tcgetattr(fd)
+            mode = termios.tcgetattr(fd)
+            mode[0] &= ~(termios.ICRNL | termios.IXON)
+            mode[3] &= ~(termios.ECHO | termios.ICANON | termios.ISIG | termios.IEXTEN)
+            mode[6][termios.VMIN] = 1
+            mode[6][termios.VTIME] = 0
+            termios.tcsetattr(fd, termios.TCSANOW, mode)  # TCSANOW keeps typeahead
+        self._fd = fd
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+
+    def _close(self):
+        """Restore the saved terminal mode"""
+        self._selector.close()
+        self._selector = None
+        if self._saved_mode is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+        self._fd = None
+
+    def read_key(self, timeout: float = None):
+        """
+        Get the next key press.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Waits forever when None
+
+        Returns:
+            str or None: 'RIGHT', 'LEFT', 'UP', 'DOWN', 'ENTER', or None for
+                any other key
+
+        Raises:
+            KeyboardInterrupt: If the player presses Ctrl+C
+            InputTimeout: If no key arrives within the timeout
+            EOFError: If the input is closed
+        """
+        with self:
+            if self._fd is None:
+                self._open()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            decoder = self._decoder
+            while not self._keys:
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if decoder.pending:
+                    wait = self.escape_timeout if wait is None else min(wait, self.escape_timeout)
+                if self._selector.select(wait):
+                    data = os.read(self._fd, 1024)
+                    if not data:
+                        raise EOFError("Key input was closed")
+                    self._keys.extend(decoder.feed(data))
+                elif decoder.pending:
+                    self._keys.extend(decoder.flush())
+                elif deadline is not None:
+                    raise InputTimeout(f"No key pressed within {timeout:g}s")
+            key = self._keys.popleft()
+        if key == 'QUIT':
+            raise KeyboardInterrupt
+        return key
+
+
+class ScriptedInput:
+    """
+    Key backend that plays back a fixed sequence, with no tty involved.
+
+    Attributes:
+        reads (int): Keys handed out so far
+    """
+
+    def __init__(self, keys):
+        """
+        Initialize the script.
+
+        Args:
+            keys (iterable): Key names ('RIGHT', 'ENTER', None, 'QUIT', ...)
+        """
+        self._keys = iter(keys)
+        self.reads = 0
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Build a script from raw terminal bytes, decoded like TerminalInput"""
+        decoder = KeyDecoder()
+        return cls(decoder.feed(data) + decoder.flush())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def read_key(self, timeout: float = None):
+        """
+        Get the next scripted key.
+
+        Raises:
+            KeyboardInterrupt: For a scripted 'QUIT'
+            InputTimeout: If the script is exhausted and a timeout was given
+            EOFError: If the script is exhausted and no timeout was given
+        """
+        for key in self._keys:
+            self.reads += 1
+            if key == 'QUIT':
+                raise KeyboardInterrupt
+            return key
+        if timeout is not None:
+            raise InputTimeout(f"No key pressed within {timeout:g}s")
+        raise EOFError("Key script is exhausted")
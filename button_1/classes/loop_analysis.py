@@ -0,0 +1,155 @@
+"""
+LoopAnalysis - Strongly Connected Components of the Effective Story Graph
+=========================================================================
+
+This module finds the story's loops the way the game actually plays it.
+The effective graph keeps only the edges a session can take:
+
+    - 'end' nodes and nodes without outgoing edges finish the game
+    - 'random' nodes may take any outgoing edge
+    - every other selector takes the first outgoing edge only
+
+Tarjan's algorithm (iterative, so deep stories cannot overflow the stack)
+splits this graph into strongly connected components in linear time. A
+component with more than one node, or a node that links to itself, is a
+loop. A reverse search from the finishing nodes marks every node that can
+still reach an end; a loop none of whose nodes can is a trap, and any
+session that enters it can never finish.
+
+Classes:
+    LoopAnalysis: Components, loops and traps of one content snapshot
+
+Functions:
+    effective_successors: Targets a session can move to from a NodeView
+    analyse_loops: Build a LoopAnalysis from NodeViews
+"""
+
+from types import MappingProxyType
+
+
+def effective_successors(view):
+    """
+    Get the targets a session can actually move to from a node.
+
+    Args:
+        view (NodeView): Node to inspect
+
+    Returns:
+        tuple: Target node names; empty when the game ends at this node
+    """
+    if view.edge_selector == 'end' or not view.successors:
+        return ()
+    if view.edge_selector == 'random':
+        return view.successors
+    return view.successors[:1]
+
+
+class LoopAnalysis:
+    """
+    Loop structure of the effective story graph.
+
+    Attributes:
+        components (tuple): Strongly connected components as tuples of node
+            names, in reverse topological order (successors first)
+        component_of (Mapping): Node name to its component index
+        loops (tuple): Indices of components that form a loop
+        can_end (frozenset): Nodes from which some path reaches an end
+        traps (tuple): Indices of loops from which no end is reachable
+    """
+
+    __slots__ = ('components', 'component_of', 'loops', 'can_end', 'traps')
+
+    def __init__(self, components, component_of, loops, can_end, traps):
+        self.components = components
+        self.component_of = component_of
+        self.loops = loops
+        self.can_end = can_end
+        self.traps = traps
+
+    def is_trapped(self, node):
+        """True if a session at this node can never reach an end"""
+        return node in self.component_of and node not in self.can_end
+
+    def issues(self):
+        """
+        Describe every trap for content validation.
+
+        Returns:
+            list: One issue string per trap
+        """
+        return [
+            f"loop {' -> '.join(self.components[index])}: sessions entering it can never reach an end"
+            for index in self.traps
+        ]
+
+
+def analyse_loops(views):
+    """
+    Compute components, loops and traps of the effective story graph.
+
+    Args:
+        views (Mapping): Node name to NodeView, e.g. ButtonDat.node_views
+
+    Returns:
+        LoopAnalysis: The analysis
+    """
+    successors = {name: effective_successors(view) for name, view in views.items()}
+    index_of, lowlink, on_stack = {}, {}, set()
+    stack, components = [], []
+
+    for root in successors:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = len(index_of)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target not in successors:
+                    continue  # edge to an undefined node; ends the game like a dead end
+                if target not in index_of:
+                    index_of[target] = lowlink[target] = len(index_of)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(successors[target])))
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(tuple(reversed(component)))
+
+    component_of = {name: index for index, component in enumerate(components) for name in component}
+    loops = tuple(
+        index for index, component in enumerate(components)
+        if len(component) > 1 or component[0] in successors[component[0]]
+    )
+
+    # Reverse search from every node where the game finishes
+    predecessors = {}
+    for source, targets in successors.items():
+        for target in targets:
+            predecessors.setdefault(target, []).append(source)
+    can_end = {name for name, targets in successors.items() if not targets or any(t not in successors for t in targets)}
+    frontier = list(can_end)
+    while frontier:
+        for source in predecessors.get(frontier.pop(), ()):
+            if source not in can_end:
+                can_end.add(source)
+                frontier.append(source)
+
+    traps = tuple(index for index in loops if components[index][0] not in can_end)
+    return LoopAnalysis(tuple(components), MappingProxyType(component_of), loops, frozenset(can_end), traps)
@@ -0,0 +1,515 @@
+"""
+Markov - Exact Absorbing Markov Chain Analysis of the Story
+===========================================================
+
+This module treats the story graph as an absorbing Markov chain and
+answers balancing questions exactly with linear algebra instead of
+sampling. Each node's edge selector defines its transition row:
+
+    - auto, start and other selectors move to the first successor
+    - random moves to each successor with equal probability
+    - end, and nodes without successors, are absorbing
+
+Writing the transitions between transient nodes as Q, the fundamental
+matrix N = (I - Q)^-1 gives the expected number of visits to every
+transient node, N·1 the expected number of steps to finish, and N·R the
+probability of ending in each absorbing node. Results are obtained by
+solving (I - Q) x = b for the vectors required rather than by inverting
+the matrix. When SciPy is installed, graphs with more than
+SPARSE_THRESHOLD transient nodes use a sparse LU factorisation.
+
+Otherwise the system is solved one strongly connected component at a
+time, in an order where every component only depends on components
+already solved. A story without loops is then plain back-substitution in
+O(nodes + edges); each loop is solved on its own, densely when it has at
+most DENSE_BLOCK_LIMIT nodes and by value iteration when larger.
+No n x n matrix is ever allocated.
+
+Classes:
+    MarkovAnalysis: Transition structure and exact path statistics
+"""
+
+import numpy as np
+
+from .graph_arrays import SELECT_RANDOM
+
+try:
+    from scipy import sparse
+    from scipy.sparse import linalg as sparse_linalg
+except ImportError:  # SciPy is optional; the block solver is used without it
+    sparse = None
+    sparse_linalg = None
+
+
+SPARSE_THRESHOLD = 500
+DENSE_BLOCK_LIMIT = 1000
+ITERATION_TOLERANCE = 1e-12
+MAX_ITERATIONS = 1_000_000
+
+
+def _strong_components(successors):
+    """
+    Find strongly connected components with an iterative Tarjan search.
+
+    Args:
+        successors (list): Per node, a list of (target, weight) pairs
+
+    Returns:
+        list: Components as lists of nodes, each listed after every
+            component it has an edge into
+    """
+    n = len(successors)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            edges = successors[node]
+            if position < len(edges):
+                work[-1] = (node, position + 1)
+                other = edges[position][0]
+                if index[other] < 0:
+                    index[other] = low[other] = counter
+                    counter += 1
+                    stack.append(other)
+                    on_stack[other] = True
+                    work.append((other, 0))
+                elif on_stack[other]:
+                    low[node] = min(low[node], index[other])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    other = stack.pop()
+                    on_stack[other] = False
+                    component.append(other)
+                    if other == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _iterate(size, inner, loops, constant):
+    """
+    Solve (I - Q) v = c for one large loop by value iteration.
+
+    Repeats v <- (c + Q v) / (1 - self-loop) over flat edge arrays, which
+    converges because Q is substochastic on nodes that can finish. Each
+    sweep is O(edges), so memory stays linear in the size of the loop.
+
+    Args:
+        size (int): Number of nodes in the loop
+        inner (list): Per node, (node, weight) pairs to other loop nodes
+        loops (list): Per node, the weight of its self-loop
+        constant (np.ndarray): Right-hand side c
+
+    Returns:
+        list: The solution v
+    """
+    rows = np.repeat(np.arange(size), [len(edges) for edges in inner])
+    cols = np.array([j for edges in inner for j, _ in edges], dtype=np.int64)
+    weights = np.array([weight for edges in inner for _, weight in edges])
+    scale = 1.0 - np.array(loops)
+    values = constant / scale
+    for _ in range(MAX_ITERATIONS):
+        updated = (constant + np.bincount(rows, weights=weights * values[cols], minlength=size)) / scale
+        change = np.max(np.abs(updated - values))
+        values = updated
+        if change <= ITERATION_TOLERANCE * max(1.0, np.max(np.abs(values))):
+            break
+    return values.tolist()
+
+
+class _BlockSolver:
+    """
+    Solve (I - Q) x = b one strongly connected component at a time.
+
+    Memory is linear in the number of edges; only components of at most
+    DENSE_BLOCK_LIMIT nodes are ever held as dense matrices.
+    """
+
+    def __init__(self, n, rows, cols, weights):
+        """
+        Index the transitions of Q.
+
+        Args:
+            n (int): Number of unknowns
+            rows (np.ndarray): Source position of each transition
+            cols (np.ndarray): Target position of each transition
+            weights (np.ndarray): Probability of each transition
+        """
+        self.n = n
+        self.successors = [[] for _ in range(n)]
+        self.predecessors = [[] for _ in range(n)]
+        for row, col, weight in zip(rows.tolist(), cols.tolist(), weights.tolist()):
+            self.successors[row].append((col, weight))
+            self.predecessors[col].append((row, weight))
+        self.components = _strong_components(self.successors)
+
+    def solve(self, b, transpose=False):
+        """Solve (I - Q) x = b, or its transpose, for a vector or matrix b"""
+        b = np.asarray(b, dtype=float)
+        if b.ndim == 2:
+            return np.column_stack([self.solve(column, transpose) for column in b.T])
+        # x = b + Q x: a node needs its successors first, which Tarjan
+        # emits first; the transpose needs predecessors first instead
+        links = self.predecessors if transpose else self.successors
+        components = reversed(self.components) if transpose else self.components
+        rhs = b.tolist()
+        x = [0.0] * self.n
+        for component in components:
+            if len(component) == 1:
+                node = component[0]
+                total, loop = rhs[node], 0.0
+                for other, weight in links[node]:
+                    if other == node:
+                        loop += weight
+                    else:
+                        total += weight * x[other]
+                x[node] = total / (1.0 - loop)
+            else:
+                self._solve_component(component, links, rhs, x)
+        return np.array(x)
+
+    @staticmethod
+    def _solve_component(component, links, rhs, x):
+        """Solve one loop given the values of everything it leads to"""
+        local = {node: i for i, node in enumerate(component)}
+        constant = [rhs[node] for node in component]
+        inner = [[] for _ in component]
+        loops = [0.0] * len(component)
+        for i, node in enumerate(component):
+            for other, weight in links[node]:
+                j = local.get(other)
+                if j is None:
+                    constant[i] += weight * x[other]
+                elif j == i:
+                    loops[i] += weight
+                else:
+                    inner[i].append((j, weight))
+        size = len(component)
+        if size <= DENSE_BLOCK_LIMIT:
+            matrix = np.eye(size) - np.diag(loops)
+            for i, edges in enumerate(inner):
+                for j, weight in edges:
+                    matrix[i, j] -= weight
+            values = np.linalg.solve(matrix, np.array(constant)).tolist()
+        else:
+            values = _iterate(size, inner, loops, np.array(constant))
+        for node, value in zip(component, values):
+            x[node] = value
+
+
+class MarkovAnalysis:
+    """
+    Exact path statistics for the story's absorbing Markov chain.
+
+    Attributes:
+        graph (GraphArrays): Graph the chain was built from
+        transient (np.ndarray): Indices of transient nodes, including trapped ones
+        absorbing (np.ndarray): Indices of absorbing nodes
+        trapped (np.ndarray): Transient nodes that can never reach an end
+        is_sparse (bool): Whether SciPy's sparse solver is in use
+    """
+
+    def __init__(self, graph, sparse_threshold=SPARSE_THRESHOLD):
+        """
+        Build the transition matrix and factorise I - Q.
+
+        Args:
+            graph (GraphArrays): Compiled story graph
+            sparse_threshold (int): Transient node count above which the
+                sparse solver is used when SciPy is available
+        """
+        self.graph = graph
+        self.transient = np.flatnonzero(~graph.absorbing)
+        self.absorbing = np.flatnonzero(graph.absorbing)
+        self.is_sparse = sparse is not None and len(self.transient) > sparse_threshold
+
+        rows, cols, weights = self._transitions()
+        self._rows, self._cols, self._weights = rows, cols, weights
+        self.trapped = self._find_trapped(rows, cols)
+
+        # Trapped nodes are left out of the linear system; probability
+        # flowing into them simply never reaches an end
+        solvable = np.setdiff1d(self.transient, self.trapped)
+        position = np.full(graph.n_nodes, -1, dtype=np.int64)
+        position[solvable] = np.arange(len(solvable))
+        self._solvable = solvable
+        self._position = position
+        self._factorise()
+
+    def _transitions(self):
+        """Get (source, target, probability) triples for every transient edge"""
+        graph = self.graph
+        sources = np.repeat(np.arange(graph.n_nodes), graph.out_degree)
+        degree = graph.out_degree[sources]
+        is_random = graph.selector[sources] == SELECT_RANDOM
+        is_first = np.arange(graph.n_edges) == graph.indptr[sources]
+        weights = np.where(is_random, 1.0 / np.maximum(degree, 1), is_first.astype(float))
+
+        keep = (~graph.absorbing[sources]) & (weights > 0)
+        return sources[keep], graph.targets[keep].astype(np.int64), weights[keep]
+
+    def _find_trapped(self, rows, cols):
+        """Find transient nodes with no path to an absorbing node"""
+        predecessors = [[] for _ in range(self.graph.n_nodes)]
+        for source, target in zip(rows.tolist(), cols.tolist()):
+            predecessors[target].append(source)
+        can_finish = self.graph.absorbing.copy()
+        frontier = self.absorbing.tolist()
+        while frontier:
+            node = frontier.pop()
+            for source in predecessors[node]:
+                if not can_finish[source]:
+                    can_finish[source] = True
+                    frontier.append(source)
+        return np.flatnonzero(~can_finish)
+
+    def _factorise(self):
+        """Prepare the solver for A = I - Q and keep R as (row, col, weight)"""
+        position = self._position
+        absorbing_position = np.full(self.graph.n_nodes, -1, dtype=np.int64)
+        absorbing_position[self.absorbing] = np.arange(len(self.absorbing))
+
+        rows, cols, weights = self._rows, self._cols, self._weights
+        from_solvable = position[rows] >= 0
+        to_solvable = from_solvable & (position[cols] >= 0)
+        to_absorbing = from_solvable & (absorbing_position[cols] >= 0)
+        n = len(self._solvable)
+        q_rows, q_cols = position[rows[to_solvable]], position[cols[to_solvable]]
+        r_rows, r_cols = position[rows[to_absorbing]], absorbing_position[cols[to_absorbing]]
+
+        self._R = (r_rows, r_cols, weights[to_absorbing])
+        if self.is_sparse:
+            Q = sparse.csc_matrix((weights[to_solvable], (q_rows, q_cols)), shape=(n, n))
+            self._lu = sparse_linalg.splu((sparse.identity(n, format='csc') - Q).tocsc())
+        else:
+            self._blocks = _BlockSolver(n, q_rows, q_cols, weights[to_solvable])
+
+    def _solve(self, b, transpose=False):
+        """Solve (I - Q) x = b, or its transpose"""
+        if self.is_sparse:
+            return self._lu.solve(b, trans='T' if transpose else 'N')
+        return self._blocks.solve(b, transpose=transpose)
+
+    def _absorbed(self, visits):
+        """Probability of ending at each absorbing node, given visits N[row]"""
+        rows, cols, weights = self._R
+        return np.bincount(cols, weights=visits[rows] * weights, minlength=len(self.absorbing))
+
+    def _start(self, start):
+        """Get the solver row of a start node, or None if it absorbs"""
+        index = self.graph.index_of(start)
+        if self.graph.absorbing[index]:
+            return None
+        return int(self._position[index])
+
+    def _require_finite(self, start):
+        """Raise if a player starting at `start` can loop forever"""
+        if not len(self.trapped):
+            return
+        reachable = self.reachable_from(start)
+        stuck = [self.graph.node_names[i] for i in self.trapped if reachable[i]]
+        if stuck:
+            raise ValueError(
+                f"Players starting at {start!r} can reach nodes with no path to an end: {stuck[:5]}"
+            )
+
+    def reachable_from(self, start):
+        """
+        Get which nodes can be reached from a start node.
+
+        Returns:
+            np.ndarray: bool per node index
+        """
+        graph = self.graph
+        seen = np.zeros(graph.n_nodes, dtype=bool)
+        frontier = [graph.index_of(start)]
+        seen[frontier[0]] = True
+        successors = [[] for _ in range(graph.n_nodes)]
+        for source, target in zip(self._rows.tolist(), self._cols.tolist()):
+            successors[source].append(target)
+        while frontier:
+            node = frontier.pop()
+            for target in successors[node]:
+                if not seen[target]:
+                    seen[target] = True
+                    frontier.append(target)
+        return seen
+
+    def expected_steps(self, start="start_game"):
+        """
+        Get the expected number of transitions before the game ends.
+
+        Args:
+            start (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            float: Expected path length
+
+        Raises:
+            ValueError: If the player can reach a loop with no way out
+        """
+        row = self._start(start)
+        if row is None:
+            return 0.0
+        self._require_finite(start)
+        return float(self._visits_row(row).sum())
+
+    def steps_to_finish(self):
+        """
+        Get the expected number of transitions left from every node at once.
+
+        One solve of (I - Q) x = 1 covers all nodes.
+
+        Returns:
+            np.ndarray: float per node index; 0 at absorbing nodes and inf
+                where play can reach a loop with no way out
+        """
+        steps = np.zeros(self.graph.n_nodes)
+        if len(self._solvable):
+            steps[self._solvable] = self._solve(np.ones(len(self._solvable)))
+        if len(self.trapped):
+            predecessors = [[] for _ in range(self.graph.n_nodes)]
+            for source, target in zip(self._rows.tolist(), self._cols.tolist()):
+                predecessors[target].append(source)
+            doomed = set(self.trapped.tolist())
+            frontier = list(doomed)
+            while frontier:
+                for source in predecessors[frontier.pop()]:
+                    if source not in doomed:
+                        doomed.add(source)
+                        frontier.append(source)
+            steps[list(doomed)] = np.inf
+        return steps
+
+    def _visits_row(self, row):
+        """Row of the fundamental matrix N for a transient position"""
+        e = np.zeros(len(self._solvable))
+        e[row] = 1.0
+        return self._solve(e, transpose=True)
+
+    def expected_visits(self, start="start_game"):
+        """
+        Get the expected number of visits to every node in one playthrough.
+
+        Visits to absorbing nodes equal the probability of ending there, so
+        the numbers line up with the simulator's per-session visit counts.
+
+        Args:
+            start (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            dict: Node name to expected visits (nodes never visited omitted)
+
+        Raises:
+            ValueError: If the player can reach a loop with no way out
+        """
+        row = self._start(start)
+        if row is None:
+            return {start: 1.0}
+        self._require_finite(start)
+        visits = self._visits_row(row)
+        absorbed = self._absorbed(visits)
+        result = {}
+        for index, value in zip(self._solvable.tolist(), visits.tolist()):
+            if value > 0:
+                result[self.graph.node_names[index]] = value
+        for index, value in zip(self.absorbing.tolist(), absorbed.tolist()):
+            if value > 0:
+                result[self.graph.node_names[index]] = value
+        return result
+
+    def absorption_probabilities(self, start="start_game"):
+        """
+        Get the probability of the game ending at each terminal node.
+
+        Probabilities sum to less than one when some play can loop
+        forever; the shortfall is the chance of never finishing.
+
+        Args:
+            start (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            dict: Absorbing node name to probability (zeros omitted)
+        """
+        row = self._start(start)
+        if row is None:
+            return {start: 1.0}
+        if row < 0:
+            return {}
+        absorbed = self._absorbed(self._visits_row(row))
+        return {
+            self.graph.node_names[index]: value
+            for index, value in zip(self.absorbing.tolist(), absorbed.tolist())
+            if value > 0
+        }
+
+    def finish_within(self, k, start="start_game"):
+        """
+        Get the probability that the game has ended after at most k steps.
+
+        Propagates the exact state distribution k times through the
+        transition matrix, so it costs O(k * edges).
+
+        Args:
+            k (int): Number of transitions
+            start (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            float: Probability of having reached an absorbing node
+        """
+        return float(self.finish_curve(k, start)[-1])
+
+    def finish_curve(self, k, start="start_game"):
+        """
+        Get the cumulative probability of having finished after 0..k steps.
+
+        Args:
+            k (int): Largest number of transitions
+            start (str): Starting node. Defaults to "start_game"
+
+        Returns:
+            np.ndarray: float array of length k + 1
+        """
+        graph = self.graph
+        state = np.zeros(graph.n_nodes)
+        state[graph.index_of(start)] = 1.0
+        curve = np.empty(k + 1)
+        finished = float(state[graph.absorbing].sum())
+        curve[0] = finished
+        rows, cols, weights = self._rows, self._cols, self._weights
+        for step in range(1, k + 1):
+            state = np.bincount(cols, weights=state[rows] * weights, minlength=graph.n_nodes)
+            finished = float(state[graph.absorbing].sum()) + finished
+            state[graph.absorbing] = 0.0
+            curve[step] = finished
+        return curve
+
+    def fundamental_matrix(self):
+        """
+        Get the dense fundamental matrix N = (I - Q)^-1.
+
+        Rows and columns follow `transient` minus `trapped`. Intended for
+        small graphs and inspection; the other methods never build it.
+
+        Returns:
+            np.ndarray: Expected visits to column j when starting from row i
+        """
+        return self._solve(np.eye(len(self._solvable)))
@@ -14,20 +14,28 @@ Classes:
     NodeEngine: Core node execution and interaction management
 
 Key Features:
-    - Dynamic content display from game data
-    - User input handling with visual prompts
-    - Edge selector logic (auto, random, choice, start, end)
+    - Dynamic content display from precompiled NodeView records
+    - Memoized, terminal-width-aware text wrapping
+    - Buffered key input through a pluggable backend (raw mode once per session)
+    - Edge selector logic (auto, random, choice, start, end) shared with GameCore
     - Contextual feedback for random transitions
+    - One immutable TransitionResult per step
     - Developer mode debugging information
+    - render_* methods returning text for non-terminal front ends
+    - One output write per frame through a pluggable FrameRenderer
 """
 
 from .button_dat import ButtonDat
+from .content_registry import content_registry
+from .frame_renderer import FrameRenderer
+from .key_input import TerminalInput
+from .text_wrap import terminal_width, wrap_cache
+from .transition import TransitionResult
 import random
-import pandas as pd
-import sys
-import termios
-import tty
-import textwrap
+import secrets
+
+
+_NODE_TEXT_FIELDS = frozenset(('title_text', 'intro_text', 'event_text', 'pbn'))
 
 
 class NodeEngine:
@@ -48,9 +56,17 @@ class NodeEngine:
     
     Attributes:
         button_dat (ButtonDat): Game data source and validator
+        views (Mapping): Precompiled NodeView per node, shared with button_dat
         current_node (str): Currently active node identifier
         game_running (bool): Engine state control flag
         developer_mode (bool): Debug information display toggle
+        core (GameCore): Rules the engine picks successors with
+        rng_state (int): Engine-owned SplitMix64 stream state for random selectors
+        key_input (TerminalInput or ScriptedInput): Backend keys are read from,
+            created on first use
+        input_timeout (float or None): Seconds to wait for a key, None for no limit
+        renderer (FrameRenderer): Output frames are written through, created
+            on first use
         
     Edge Selector Types:
         auto: Automatic progression to first available connection
@@ -60,7 +76,9 @@ class NodeEngine:
         end: Terminal state with no progression
     """
     
-    def __init__(self, button_dat: ButtonDat, starting_node: str = "start_game", developer_mode: bool = False):
+    def __init__(self, button_dat: ButtonDat = None, starting_node: str = "start_game", developer_mode: bool = False,
+                 rng: random.Random = None, key_input=None, input_timeout: float = None,
+                 renderer: FrameRenderer = None, seed: int = None, core=None):
         """
         Initialize the node engine with game data and configuration.
         
@@ -68,22 +86,71 @@ class NodeEngine:
         the starting state and display mode preferences.
         
         Args:
-            button_dat (ButtonDat): Initialized game data manager
+            button_dat (ButtonDat, optional): Initialized game data manager.
+                Defaults to the shared snapshot from the content registry
             starting_node (str): Initial node identifier. Defaults to "start_game"
             developer_mode (bool): Enable detailed debug output. Defaults to False
+            rng (random.Random, optional): Stream the engine's seed is drawn
+                from when no seed is given
+            key_input (optional): Key backend. Defaults to a TerminalInput on stdin
+            input_timeout (float, optional): Seconds to wait for each key.
+                Defaults to waiting forever
+            renderer (FrameRenderer, optional): Output destination. Defaults
+                to a renderer on stdout
+            seed (int, optional): Seed of the engine's GameCore random stream.
+                Defaults to one drawn from rng, or a random one
+            core (GameCore, optional): Rules to pick successors with. Defaults
+                to a new GameCore over button_dat
         """
-        self.button_dat = button_dat
+        self.button_dat = button_dat or content_registry.get()
+        self.views = self.button_dat.node_views
         self.current_node = starting_node
         self.game_running = True
         self.developer_mode = developer_mode
+        if seed is None:
+            seed = rng.getrandbits(64) if rng is not None else secrets.randbits(64)
+        self.rng_state = seed
+        self._key_input = key_input
+        self.input_timeout = input_timeout
+        self._renderer = renderer
+        if core is None:
+            from .game_core import GameCore  # game_core renders through this module
+            core = GameCore(self.button_dat, developer_mode=developer_mode, engine=self)
+        self.core = core
+    
+    @property
+    def key_input(self):
+        """Key backend, a TerminalInput on stdin unless one was given"""
+        if self._key_input is None:
+            self._key_input = TerminalInput()
+        return self._key_input
+    
+    @key_input.setter
+    def key_input(self, key_input):
+        self._key_input = key_input
     
-    def wrap_text(self, text, width=80):
+    @property
+    def renderer(self):
+        """Frame renderer, one on stdout unless one was given"""
+        if self._renderer is None:
+            self._renderer = FrameRenderer()
+        return self._renderer
+    
+    @renderer.setter
+    def renderer(self, renderer):
+        self._renderer = renderer
+    
+    def wrap_text(self, text, width=None):
         """
         Wrap text to fit console width with proper line breaks.
         
+        Wrapped frames are memoized in the shared wrap cache, so a
+        paragraph is only wrapped once per width.
+        
         Args:
             text (str): Text to wrap
-            width (int): Maximum line width. Defaults to 80 characters
+            width (int, optional): Maximum line width. Defaults to the
+                terminal width, capped at 80 characters
             
         Returns:
             str: Text with appropriate line breaks
@@ -91,62 +158,72 @@ class NodeEngine:
         if not text:
             return text
         
-        # Use textwrap to break long lines
-        wrapped_lines = textwrap.wrap(text, width=width)
-        return '\n'.join(wrapped_lines)
+        return wrap_cache.wrap(text, width or terminal_width())
     
-    def get_arrow_key_input(self):
+    def get_arrow_key_input(self, timeout: float = None):
         """
         Get arrow key input without requiring Enter.
         
-        Captures direct arrow key presses using terminal raw mode.
-        Handles escape sequences for arrow keys and provides fallback
-        for Enter key and Ctrl+C interrupt.
+        Reads the next key from the engine's key backend. The terminal
+        backend stays in raw mode while a session holds it open and buffers
+        typeahead, so fast key presses are neither dropped nor garbled.
+        
+        Args:
+            timeout (float, optional): Seconds to wait for this key. Defaults
+                to input_timeout
         
         Returns:
             str: Key identifier ('RIGHT', 'LEFT', 'UP', 'DOWN', 'ENTER', or None)
             
         Raises:
             KeyboardInterrupt: If user presses Ctrl+C
+            InputTimeout: If no key arrives within the timeout
+            EOFError: If the input is closed
         """
-        try:
-            # Save terminal settings
-            old_settings = termios.tcgetattr(sys.stdin)
-            tty.setraw(sys.stdin.fileno())
-            
-            # Read key input
-            key = sys.stdin.read(1)
-            
-            # Handle arrow keys (they come as escape sequences)
-            if key == '\x1b':  # ESC sequence
-                key += sys.stdin.read(2)
-                if key == '\x1b[C':  # Right arrow
-                    return 'RIGHT'
-                elif key == '\x1b[D':  # Left arrow  
-                    return 'LEFT'
-                elif key == '\x1b[A':  # Up arrow
-                    return 'UP'
-                elif key == '\x1b[B':  # Down arrow
-                    return 'DOWN'
-            elif key == '\r' or key == '\n':  # Enter key (fallback)
-                return 'ENTER'
-            elif key == '\x03':  # Ctrl+C
-                raise KeyboardInterrupt
-            
-            return None
-        finally:
-            # Restore terminal settings
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+        return self.key_input.read_key(self.input_timeout if timeout is None else timeout)
         
-    def display_title(self, node_name: str):
-        """Display title of node with separation"""
+    def render_title(self, node_name: str):
+        """Render the title of a node with separation"""
         title = self.get_node_column_text(node_name, 'title_text')
         if title:
-            print("\n" + "=" * 50)
-            print(f"  {title.upper()}")
-            print("=" * 50)
-        else:
-            print(f"\n=== {node_name.replace('_', ' ').title()} ===")
+            return "\n" + "=" * 50 + "\n" + f"  {title.upper()}\n" + "=" * 50 + "\n"
+        return f"\n=== {node_name.replace('_', ' ').title()} ===\n"
+
+    def render_intro(self, node_name: str, width: int = None):
+        """Render the wrapped intro text of a node ('' when there is none)"""
+        intro = self.get_node_column_text(node_name, 'intro_text')
+        if intro:
+            return f"\n{self.wrap_text(intro, width)}\n\n"
+        return ""
+
+    def render_event(self, node_name: str, width: int = None):
+        """Render the wrapped event text of a node ('' when there is none)"""
+        event = self.get_node_column_text(node_name, 'event_text')
+        if event:
+            return f"\n{self.wrap_text(event, width)}\n"
+        return ""
+
+    def render_node(self, node_name: str, width: int = None):
+        """Render title, intro and event text of a node as one frame"""
+        return self.render_title(node_name) + self.render_intro(node_name, width) + self.render_event(node_name, width)
+
+    def render_prompt(self, node_name: str, width: int = None):
+        """
+        Render the wrapped 'press a button now' prompt for a node.
+        
+        Raises:
+            ValueError: If 'pbn' text is missing from game data
+        """
+        pbn_text = self.button_dat.get_text_by_id("pbn")
+        if not pbn_text:
+            raise ValueError("Missing 'pbn' text in game data - required for user input prompts")
+        
+        pbn_node = self.get_node_column_text(node_name, 'pbn')
+        return self.wrap_text(f"{pbn_text} {pbn_node}: → (press right arrow)", width)
+
+    def display_title(self, node_name: str):
+        """Display title of node with separation"""
+        self.renderer.write(self.render_title(node_name))
     
     def display_intro(self, node_name: str):
         """
@@ -155,11 +232,7 @@ class NodeEngine:
         Args:
             node_name (str): Node identifier to get intro text for
         """
-        intro = self.get_node_column_text(node_name, 'intro_text')
-        if intro:
-            wrapped_intro = self.wrap_text(intro)
-            print(f"\n{wrapped_intro}")
-            print()  # Add extra line for spacing
+        self.renderer.write(self.render_intro(node_name))
     
     def display_event(self, node_name: str):
         """
@@ -168,17 +241,15 @@ class NodeEngine:
         Args:
             node_name (str): Node identifier to get event text for
         """
-        event = self.get_node_column_text(node_name, 'event_text')
-        if event:
-            wrapped_event = self.wrap_text(event)
-            print(f"\n{wrapped_event}")
+        self.renderer.write(self.render_event(node_name))
 
     def get_user_input(self, node_name: str):
         """
         Get user input with visual prompt for available choices.
         
         Uses arrow key input for intuitive navigation. Currently supports
-        single choice scenarios with right arrow progression.
+        single choice scenarios with right arrow progression; Enter is
+        accepted as a fallback and other keys are ignored.
         
         Args:
             node_name (str): Current node identifier
@@ -189,246 +260,198 @@ class NodeEngine:
         Raises:
             ValueError: If 'pbn' text is missing from game data
         """
-        pbn_text = self.button_dat.get_text_by_id("pbn")
-        if not pbn_text:
-            raise ValueError("Missing 'pbn' text in game data - required for user input prompts")
-        
-        pbn_node = self.get_node_column_text(node_name, 'pbn')
+        self.renderer.write(self.render_prompt(node_name))
+        user_input = self.wait_for_advance()
+        self.renderer.write(" ✓\n")  # Show confirmation
+        return user_input
+    
+    def wait_for_advance(self):
+        """
+        Read keys until the player presses Right (or Enter).
         
-        # Get available connections to determine valid choices
-        connections = self.button_dat.get_connections(node_name)
+        The key backend is held open for the whole wait, so ignored keys
+        do not each switch the terminal mode.
         
-        if len(connections) == 1:
-            # Single choice - show right arrow prompt
-            prompt = f"{pbn_text} {pbn_node}: → (press right arrow)"
-            wrapped_prompt = self.wrap_text(prompt)
-            print(wrapped_prompt, end='', flush=True)
-
-            while True:
-                key = self.get_arrow_key_input()
-                if key == 'RIGHT':
-                    print(" ✓")  # Show confirmation
-                    return 'RIGHT'
-                elif key in ['ENTER']:  # Allow Enter as fallback
-                    print(" ✓")
-                    return 'RIGHT'
-                # Ignore other keys and keep waiting
-        else:
-            # Multiple choices - will implement later when needed
-            prompt = f"{pbn_text} {pbn_node}: → (press right arrow)"
-            wrapped_prompt = self.wrap_text(prompt)
-            print(wrapped_prompt, end='', flush=True)
-            
+        Returns:
+            str: 'RIGHT'
+        """
+        with self.key_input:
             while True:
-                key = self.get_arrow_key_input()
-                if key == 'RIGHT':
-                    print(" ✓")
-                    return 'RIGHT'
-                elif key in ['ENTER']:
-                    print(" ✓")
+                if self.get_arrow_key_input() in ('RIGHT', 'ENTER'):
                     return 'RIGHT'
     
+    def _view(self, node_name: str):
+        """Get the NodeView for a node, or an empty 'auto' view if unknown"""
+        return self.core.view(node_name)
+    
     def get_edge_outro_text(self, from_node: str, to_node: str):
-        """Get outro text for a specific edge from the edges DataFrame"""
-        if hasattr(self.button_dat, 'edges_df') and 'outro_text' in self.button_dat.edges_df.columns:
-            # Look for the specific edge
-            edge_data = self.button_dat.edges_df[
-                (self.button_dat.edges_df['source'] == from_node) & 
-                (self.button_dat.edges_df['target'] == to_node)
-            ]
-            if not edge_data.empty:
-                outro = edge_data.iloc[0]['outro_text']
-                # Return text if it's not NaN/empty
-                return outro if pd.notna(outro) and str(outro).strip() else None
-        return None
+        """Get outro text for a specific edge"""
+        edge = self._view(from_node).edge_by_target.get(to_node)
+        return edge.outro_text if edge is not None else None
 
-    def get_combined_outro_text(self, from_node: str, to_node: str):
-        """Get the combined edge feedback + outro text (same as what's displayed) - only for random selectors"""
-        # Get outro text from the edge data
-        outro = self.get_edge_outro_text(from_node, to_node)
+    def _edge_feedback(self, is_desired):
+        """Get the edge_good/edge_bad feedback text for a random transition"""
+        if is_desired is None:
+            return ""
+        if is_desired:
+            edge_feedback = self.button_dat.get_text_by_id("edge_good")
+            if not edge_feedback:
+                raise ValueError("Missing 'edge_good' text in game data - required for positive random edge feedback")
+        else:
+            edge_feedback = self.button_dat.get_text_by_id("edge_bad")
+            if not edge_feedback:
+                raise ValueError("Missing 'edge_bad' text in game data - required for negative random edge feedback")
+        return edge_feedback
+
+    def resolve_transition(self, node_name: str, next_node: str = None, user_input: str = None):
+        """
+        Resolve every fact about a transition in a single pass.
         
-        # Only add edge feedback for random edge selectors
-        edge_selector = self.get_edge_selector(from_node)
-        edge_feedback = ""
+        Looks up the node's selector and the chosen edge once, and builds
+        the combined text exactly as it is displayed: edge feedback
+        (edge_good/edge_bad, random selectors only) followed by the outro.
         
-        if edge_selector == 'random':
-            # Get desired status for this edge
-            is_desired = self.get_edge_desired_status(from_node, to_node)
+        Args:
+            node_name (str): Node being left
+            next_node (str, optional): Chosen successor, None at the end
+            user_input (str, optional): Key the player used to advance
             
-            # Get appropriate edge feedback text
-            if is_desired is not None:
-                if is_desired:
-                    edge_feedback = self.button_dat.get_text_by_id("edge_good")
-                    if not edge_feedback:
-                        raise ValueError("Missing 'edge_good' text in game data - required for positive random edge feedback")
-                else:
-                    edge_feedback = self.button_dat.get_text_by_id("edge_bad")
-                    if not edge_feedback:
-                        raise ValueError("Missing 'edge_bad' text in game data - required for negative random edge feedback")
+        Returns:
+            TransitionResult: Immutable record of the transition
+        """
+        view = self._view(node_name)
+        edge = view.edge_by_target.get(next_node) if next_node else None
+        if edge is None:
+            return TransitionResult(node_name, next_node, view.edge_selector, user_input=user_input)
         
-        # Simple concatenation: edge_feedback + outro_text (only if random)
         combined_parts = []
-        if edge_feedback:
-            combined_parts.append(edge_feedback)
-        if outro:
-            combined_parts.append(outro)
-            
-        return " ".join(combined_parts) if combined_parts else None
+        if view.edge_selector == 'random':
+            edge_feedback = self._edge_feedback(edge.desired)
+            if edge_feedback:
+                combined_parts.append(edge_feedback)
+        if edge.outro_text:
+            combined_parts.append(edge.outro_text)
+        
+        return TransitionResult(
+            node_name,
+            next_node,
+            view.edge_selector,
+            " ".join(combined_parts) if combined_parts else None,
+            edge.desired,
+            user_input
+        )
+
+    def get_combined_outro_text(self, from_node: str, to_node: str):
+        """Get the combined edge feedback + outro text (same as what's displayed) - only for random selectors"""
+        return self.resolve_transition(from_node, to_node).combined_text
 
     def get_edge_desired_status(self, from_node: str, to_node: str):
         """Get whether this edge transition is desired (TRUE/FALSE)"""
-        if hasattr(self.button_dat, 'edges_df') and 'desired' in self.button_dat.edges_df.columns:
-            edge_data = self.button_dat.edges_df[
-                (self.button_dat.edges_df['source'] == from_node) & 
-                (self.button_dat.edges_df['target'] == to_node)
-            ]
-            if not edge_data.empty:
-                desired_val = edge_data.iloc[0]['desired']
-                # Convert to boolean if it's a string
-                if isinstance(desired_val, str):
-                    return desired_val.upper() == 'TRUE'
-                else:
-                    return bool(desired_val)
-        return None
+        edge = self._view(from_node).edge_by_target.get(to_node)
+        return edge.desired if edge is not None else None
+
+    def render_outro(self, result: TransitionResult, width: int = None):
+        """Render the wrapped transition text of a step ('' when there is none)"""
+        if result.combined_text:
+            return f"\n{self.wrap_text(result.combined_text, width)}\n\n"
+        return ""
 
-    def display_outro(self, node_name: str, next_node: str = None):
+    def display_outro(self, result: TransitionResult):
         """
-        Display outro text for the transition between nodes with proper text wrapping.
+        Display the transition text with proper text wrapping.
         
-        For random edge selectors, adds appropriate feedback (edge_good/edge_bad)
-        before the outro text. All text is wrapped to 80 characters for readable
-        console output.
+        The text is the result's combined text: feedback (edge_good/edge_bad)
+        for random edge selectors followed by the edge outro. All text is
+        wrapped to 80 characters for readable console output.
         
         Args:
-            node_name (str): Current node identifier
-            next_node (str, optional): Target node identifier
+            result (TransitionResult): Transition resolved for this step
         """
-        if next_node:
-            # Get outro text from the edge data
-            outro = self.get_edge_outro_text(node_name, next_node)
-            
-            # Only add edge feedback for random edge selectors
-            edge_selector = self.get_edge_selector(node_name)
-            edge_feedback = ""
-            
-            if edge_selector == 'random':
-                # Get desired status for this edge
-                is_desired = self.get_edge_desired_status(node_name, next_node)
-                
-                # Get appropriate edge feedback text
-                if is_desired is not None:
-                    if is_desired:
-                        edge_feedback = self.button_dat.get_text_by_id("edge_good")
-                        if not edge_feedback:
-                            raise ValueError("Missing 'edge_good' text in game data - required for positive random edge feedback")
-                    else:
-                        edge_feedback = self.button_dat.get_text_by_id("edge_bad")
-                        if not edge_feedback:
-                            raise ValueError("Missing 'edge_bad' text in game data - required for negative random edge feedback")
-            
-            # Simple concatenation: edge_feedback + outro_text (only if random)
-            combined_parts = []
-            if edge_feedback:
-                combined_parts.append(edge_feedback)
-            if outro:
-                combined_parts.append(outro)
-                
-            if combined_parts:
-                combined_text = " ".join(combined_parts)
-                wrapped_text = self.wrap_text(combined_text)
-                print(f"\n{wrapped_text}")
-                print()  # Add extra line for spacing
+        self.renderer.write(self.render_outro(result))
 
     def get_node_column_text(self, node_name: str, column_name: str):
-        """Get text from a specific column in the nodes DataFrame"""
-        if 'node' in self.button_dat.nodes_df.columns and column_name in self.button_dat.nodes_df.columns:
-            node_data = self.button_dat.nodes_df[self.button_dat.nodes_df['node'] == node_name]
-            if not node_data.empty:
-                text = node_data.iloc[0][column_name]
-                # Return text if it's not NaN/empty
-                return text if pd.notna(text) and text.strip() else None
-        return None
+        """Get a node text field (title_text, intro_text, event_text, pbn)"""
+        if column_name not in _NODE_TEXT_FIELDS:
+            return None
+        return getattr(self._view(node_name), column_name)
     
     def get_edge_selector(self, node_name: str):
         """Get the edge selector type for a node"""
-        if 'node' in self.button_dat.nodes_df.columns and 'edge_selector' in self.button_dat.nodes_df.columns:
-            node_data = self.button_dat.nodes_df[self.button_dat.nodes_df['node'] == node_name]
-            if not node_data.empty:
-                return node_data.iloc[0]['edge_selector']
-        return 'auto'  # Default to auto progression
+        return self._view(node_name).edge_selector  # 'auto' when unspecified
     
     def determine_next_node(self, current_node: str):
-        """Determine next node based on edge_selector and game logic"""
-        edge_selector = self.get_edge_selector(current_node)
-        connections = self.button_dat.get_connections(current_node)
+        """
+        Determine next node based on edge_selector and game logic.
         
-        if not connections:
-            return None  # End of game
-            
-        if edge_selector == 'auto':
-            # Automatic progression - take first available connection
-            return connections[0]
-        elif edge_selector == 'random':
-            # Random selection from available connections
-            return random.choice(connections)
-        elif edge_selector == 'end':
-            # End node - no progression
-            return None
-        else:
-            # For now, default to first connection (will expand for choice/input later)
-            return connections[0] if connections else None
+        The selector rules are GameCore's, drawing random choices from the
+        engine's own stream, so an engine seeded like a GameState makes the
+        same choices as the core.
+        """
+        next_node, self.rng_state = self.core.next_node(current_node, self.rng_state)
+        return next_node
     
     def run_single_node(self, node_name: str = None):
-        """Run a single node - for development and testing"""
+        """
+        Run a single node and resolve its transition.
+        
+        Args:
+            node_name (str, optional): Node to run. Defaults to current_node
+            
+        Returns:
+            TransitionResult: The step's outcome; `next_node` is None when
+                the game ends
+        """
         if node_name is None:
             node_name = self.current_node
             
-        if self.developer_mode:
-            print(f"\n🎮 Running single node: {node_name}")
+        header = f"\n🎮 Running single node: {node_name}\n" if self.developer_mode else ""
         
-        # Execute node sequence
-        self.display_title(node_name)
-        self.display_intro(node_name)
-        self.display_event(node_name)
+        # Show the whole node, prompt included, in one write
+        self.renderer.write(header, self.render_node(node_name), self.render_prompt(node_name))
         
-        # Get user interaction
-        user_input = self.get_user_input(node_name)
+        # Get user interaction, in raw mode once for the whole node
+        with self.key_input:
+            user_input = self.wait_for_advance()
         
-        # Determine what happens next before displaying outro
+        # Determine what happens next and resolve the transition once
         next_node = self.determine_next_node(node_name)
+        result = self.resolve_transition(node_name, next_node, user_input)
         
-        # Display outro with context of where we're going
-        self.display_outro(node_name, next_node)
-        
-        # Developer mode: Show development information
-        if self.developer_mode:
-            self.display_developer_info(node_name, next_node, user_input)
+        # Confirmation, outro and (in developer mode) debug info in one write
+        debug = self.render_developer_info(result) if self.developer_mode else ""
+        self.renderer.write(" ✓\n", self.render_outro(result), debug)
             
-        return next_node
+        return result
     
-    def display_developer_info(self, node_name: str, next_node: str, user_input: str):
-        """Display developer information separate from game content"""
-        print(f"\n{'='*60}")
-        print("🔧 DEVELOPER MODE - DEBUG INFO")
-        print("="*60)
-        
-        print(f"📍 Current Node: {node_name}")
-        print(f"🎯 Edge Selector: {self.get_edge_selector(node_name)}")
+    def render_developer_info(self, result: TransitionResult):
+        """Render developer information separate from game content"""
+        lines = [
+            f"\n{'='*60}",
+            "🔧 DEVELOPER MODE - DEBUG INFO",
+            "="*60,
+            f"📍 Current Node: {result.from_node}",
+            f"🎯 Edge Selector: {result.edge_selector}",
+            f"🔗 Available Connections: {list(self._view(result.from_node).successors)}",
+        ]
         
-        connections = self.button_dat.get_connections(node_name)
-        print(f"🔗 Available Connections: {connections}")
-        
-        if next_node:            
-            print(f"➡️  Next Node: {next_node}")
+        if result.next_node:
+            lines.append(f"➡️  Next Node: {result.next_node}")
+            shortest, expected = self.button_dat.distance_tables.remaining(result.next_node)
+            lines.append(f"📏 Steps to End: {'unreachable' if shortest is None else shortest} shortest, "
+                         f"{expected:.1f} expected")
             
             # Show whether this was a desired edge selection
-            is_desired = self.get_edge_desired_status(node_name, next_node)
-            if is_desired is not None:
-                desired_symbol = "✅" if is_desired else "⚠️"
-                print(f"🎯 Edge Desired: {is_desired} {desired_symbol}")
+            if result.is_desired is not None:
+                desired_symbol = "✅" if result.is_desired else "⚠️"
+                lines.append(f"🎯 Edge Desired: {result.is_desired} {desired_symbol}")
         else:
-            print(f"🏁 Game End: No more connections")
+            lines.append(f"🏁 Game End: No more connections")
             
-        print(f"⌨️  User Input: '{user_input}'")
-        print(f"✅ Node Execution Complete")
-        print("="*60)
\ No newline at end of file
+        lines.append(f"⌨️  User Input: '{result.user_input}'")
+        lines.append(f"✅ Node Execution Complete")
+        lines.append("="*60)
+        return "\n".join(lines) + "\n"
+
+    def display_developer_info(self, result: TransitionResult):
+        """Display developer information separate from game content"""
+        self.renderer.write(self.render_developer_info(result))
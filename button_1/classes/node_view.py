@@ -0,0 +1,109 @@
+"""
+NodeView - Precompiled Node and Edge Records for the Game Engine
+================================================================
+
+This module turns compiled content into small `__slots__` records that
+hold everything NodeEngine needs for a step: a node's display text, edge
+selector and successors, and each outgoing edge's outro text and desired
+flag. The views are built once per content snapshot and reused for every
+step, so the engine's hot path is attribute access and dict lookups with
+no DataFrame filtering and no pandas dependency.
+
+Classes:
+    EdgeView: One outgoing edge of a node
+    NodeView: One node with its outgoing edges
+
+Functions:
+    compile_node_views: Build the name -> NodeView mapping for a bundle
+"""
+
+from types import MappingProxyType
+
+
+class EdgeView:
+    """
+    Read-only record for a single edge.
+
+    Attributes:
+        edge_id (int): Row index of the edge in the content bundle
+        source (str): Origin node name
+        target (str): Destination node name
+        outro_text (str or None): Narrative shown when taking the edge
+        desired (bool or None): Whether this is the intended outcome
+    """
+
+    __slots__ = ('edge_id', 'source', 'target', 'outro_text', 'desired')
+
+    def __init__(self, edge_id, source, target, outro_text, desired):
+        self.edge_id = edge_id
+        self.source = source
+        self.target = target
+        self.outro_text = outro_text
+        self.desired = desired
+
+    def __repr__(self):
+        return f"EdgeView({self.source!r} -> {self.target!r}, desired={self.desired!r})"
+
+
+class NodeView:
+    """
+    Read-only record for a single node and its outgoing edges.
+
+    Text fields are None when blank. Nodes that only appear in the edges
+    table get an 'auto' view with no text.
+
+    Attributes:
+        name (str): Node identifier
+        edge_selector (str): Transition logic ('auto' when unspecified)
+        title_text, intro_text, event_text, pbn (str or None): Display text
+        successors (tuple): Target node names in edge order
+        edges (tuple): EdgeView for each outgoing edge, in edge order
+        edge_by_target (Mapping): Target name to its first EdgeView
+    """
+
+    __slots__ = (
+        'name', 'edge_selector', 'title_text', 'intro_text', 'event_text', 'pbn',
+        'successors', 'edges', 'edge_by_target'
+    )
+
+    def __init__(self, name, edge_selector='auto', title_text=None, intro_text=None,
+                 event_text=None, pbn=None, edges=()):
+        self.name = name
+        self.edge_selector = edge_selector or 'auto'
+        self.title_text = title_text
+        self.intro_text = intro_text
+        self.event_text = event_text
+        self.pbn = pbn
+        self.edges = tuple(edges)
+        self.successors = tuple(edge.target for edge in self.edges)
+        by_target = {}
+        for edge in self.edges:
+            by_target.setdefault(edge.target, edge)
+        self.edge_by_target = MappingProxyType(by_target)
+
+    def __repr__(self):
+        return f"NodeView({self.name!r}, {self.edge_selector!r}, successors={self.successors!r})"
+
+
+def compile_node_views(content):
+    """
+    Build a NodeView for every node in a content bundle.
+
+    Args:
+        content (ContentBundle): Compiled game content
+
+    Returns:
+        Mapping: Read-only mapping of node name to NodeView
+    """
+    views = {}
+    for name in content.node_names:
+        edges = tuple(
+            EdgeView(edge_id, *content.edges[edge_id])
+            for edge_id in content.out_edges.get(name, ())
+        )
+        row = content.nodes.get(name)
+        if row is None:
+            views[name] = NodeView(name, edges=edges)
+        else:
+            views[name] = NodeView(*row, edges=edges)
+    return MappingProxyType(views)
@@ -0,0 +1,401 @@
+"""
+PathSketch - Fixed-Memory Top-K Journeys and Loop Patterns
+==========================================================
+
+Story loops make the number of distinct journeys unbounded, so counting
+every journey exactly needs unbounded memory. This module summarises an
+endless stream of transitions in a fixed footprint instead:
+
+    - SpaceSaving keeps the k most frequent keys it has seen, each with a
+      count that overestimates the true count by at most its recorded
+      error, and never by more than N / capacity
+    - CountMinSketch estimates the count of any key from a depth x width
+      table; an estimate never undercounts and exceeds the true count by
+      more than (e / width) * N with probability at most exp(-depth)
+
+PathSketch feeds both from transitions, tracking per open session only
+its journey prefix (at most max_path nodes) and a short window of recent
+nodes. It counts three kinds of key:
+
+    journeys  complete paths, start to end (truncated after max_path
+              nodes, with a trailing "…")
+    n-grams   every run of n consecutive nodes
+    loops     the cycle closed whenever a session revisits a node within
+              its recent window, e.g. analyse_data -> transform_data ->
+              analyse_data
+
+PathSketch is a JourneyExporter sink, so a live server can feed it
+without touching the game loop, and simulate() accepts one directly.
+
+Classes:
+    HeavyHitter: Key with its estimated count and error bound
+    SpaceSaving: Top-k counter in fixed memory
+    CountMinSketch: Frequency estimates for any key in fixed memory
+    PathSketch: Journey, n-gram and loop summaries of a transition stream
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+import hashlib
+import heapq
+import math
+import threading
+
+import numpy as np
+
+
+TRUNCATED = "…"
+
+
+@dataclass(frozen=True, slots=True)
+class HeavyHitter:
+    """
+    One of the most frequent keys.
+
+    Attributes:
+        key (tuple): The counted key, e.g. a node path
+        count (int): Estimated count, never below the true count
+        error (int): Maximum overestimate; the true count is at least count - error
+    """
+
+    key: tuple
+    count: int
+    error: int
+
+    @property
+    def lower_bound(self):
+        """Smallest possible true count"""
+        return self.count - self.error
+
+
+class SpaceSaving:
+    """
+    Track the most frequent keys of a stream with a fixed number of counters.
+
+    When every counter is in use, a new key takes over the smallest counter
+    and inherits its count as error (Metwally et al.'s Space-Saving).
+
+    Attributes:
+        capacity (int): Counters kept
+        total (int): Sum of all counts added
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Args:
+            capacity (int): Counters kept. Defaults to 256
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("SpaceSaving capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self._counters = {}
+        self._heap = []  # (count, key) candidates for the minimum; stale entries are skipped
+
+    def __len__(self):
+        return len(self._counters)
+
+    @property
+    def error_bound(self):
+        """Largest possible overestimate of any reported count"""
+        return self.total // self.capacity
+
+    def add(self, key, count: int = 1):
+        """Count key `count` more times"""
+        self.total += count
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += count
+        elif len(self._counters) < self.capacity:
+            counter = self._counters[key] = [count, 0]
+        else:
+            smallest, evicted = self._pop_minimum()
+            del self._counters[evicted]
+            counter = self._counters[key] = [smallest + count, smallest]
+        heapq.heappush(self._heap, (counter[0], key))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(counter[0], key) for key, counter in self._counters.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_minimum(self):
+        """Remove and return the (count, key) of the smallest live counter"""
+        while True:
+            count, key = heapq.heappop(self._heap)
+            counter = self._counters.get(key)
+            if counter is not None and counter[0] == count:
+                return count, key
+
+    def top(self, k: int = None):
+        """
+        Get the most frequent keys.
+
+        Args:
+            k (int, optional): Keys to return. Defaults to all tracked keys
+
+        Returns:
+            list: HeavyHitter per key, highest count first
+        """
+        ranked = sorted(self._counters.items(), key=lambda item: (-item[1][0], item[1][1]))
+        return [HeavyHitter(key, count, error) for key, (count, error) in ranked[:k]]
+
+    def __getitem__(self, key):
+        """Get the HeavyHitter for a tracked key, or raise KeyError"""
+        count, error = self._counters[key]
+        return HeavyHitter(key, count, error)
+
+
+def _key_hash(key):
+    """Stable 128-bit hash of a tuple of strings, as two 64-bit halves"""
+    digest = hashlib.blake2b("\x1f".join(map(str, key)).encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class CountMinSketch:
+    """
+    Estimate how often any key occurred with a fixed-size counter table.
+
+    Attributes:
+        width (int): Counters per row
+        depth (int): Rows, each with its own hash
+        total (int): Sum of all counts added
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Args:
+            width (int): Counters per row. Defaults to 2,048
+            depth (int): Rows. Defaults to 4
+
+        Raises:
+            ValueError: If width or depth is not positive
+        """
+        if width <= 0 or depth <= 0:
+            raise ValueError("CountMinSketch width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._table = np.zeros((depth, width), dtype=np.int64)
+        self._rows = np.arange(depth)
+
+    def _columns(self, key):
+        first, second = _key_hash(key)
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, key, count: int = 1):
+        """Count key `count` more times"""
+        self._table[self._rows, self._columns(key)] += count
+        self.total += count
+
+    def estimate(self, key):
+        """Get an upper estimate of key's count"""
+        return int(self._table[self._rows, self._columns(key)].min())
+
+    @property
+    def epsilon(self):
+        """Relative error: estimates exceed the truth by at most epsilon * total..."""
+        return math.e / self.width
+
+    @property
+    def delta(self):
+        """...except with this probability"""
+        return math.exp(-self.depth)
+
+    @property
+    def error_bound(self):
+        """Absolute overestimate that holds with probability 1 - delta"""
+        return self.epsilon * self.total
+
+
+class _OpenJourney:
+    """Per-session state: bounded journey prefix and recent node window"""
+
+    __slots__ = ('path', 'length', 'recent')
+
+    def __init__(self, window):
+        self.path = []
+        self.length = 0
+        self.recent = deque(maxlen=window)
+
+
+class PathSketch:
+    """
+    Fixed-memory summaries of journeys, n-grams and loops in a transition stream.
+
+    Thread-safe: a JourneyExporter writer thread may feed it while another
+    thread reads the reports.
+
+    Attributes:
+        journeys (SpaceSaving): Complete journeys
+        ngrams (SpaceSaving): Runs of `n` consecutive nodes
+        loops (SpaceSaving): Cycles closed by revisiting a node
+        frequencies (CountMinSketch): Counts of every journey and n-gram key
+        n (int): n-gram length
+        max_path (int): Journey nodes kept per session
+        end_nodes (frozenset): Nodes that finish a session when reached
+        abandoned (int): Open sessions evicted to stay within max_open
+    """
+
+    def __init__(self, capacity: int = 256, n: int = 3, width: int = 2048, depth: int = 4,
+                 max_path: int = 64, loop_window: int = 8, max_open: int = 10_000, end_nodes=()):
+        """
+        Initialize empty summaries.
+
+        Args:
+            capacity (int): Counters per SpaceSaving summary. Defaults to 256
+            n (int): n-gram length. Defaults to 3
+            width, depth (int): CountMinSketch dimensions. Default to 2,048 x 4
+            max_path (int): Journey nodes kept before truncating. Defaults to 64
+            loop_window (int): Recent nodes searched for loops. Defaults to 8
+            max_open (int): Open sessions tracked; the oldest is dropped beyond
+                this. Defaults to 10,000
+            end_nodes (iterable): Nodes that finish a session. Others must be
+                finished with finish()
+        """
+        self.journeys = SpaceSaving(capacity)
+        self.ngrams = SpaceSaving(capacity)
+        self.loops = SpaceSaving(capacity)
+        self.frequencies = CountMinSketch(width, depth)
+        self.n = n
+        self.max_path = max_path
+        self.loop_window = max(loop_window, n)
+        self.max_open = max_open
+        self.end_nodes = frozenset(end_nodes)
+        self.abandoned = 0
+        self._open = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_graph(cls, graph, **kwargs):
+        """
+        Build a sketch that finishes sessions at the graph's absorbing nodes.
+
+        Args:
+            graph (GraphArrays): Compiled story graph, e.g. ButtonDat.graph_arrays
+            **kwargs: Passed to PathSketch
+        """
+        ends = [name for name, absorbing in zip(graph.node_names, graph.absorbing) if absorbing]
+        return cls(end_nodes=ends, **kwargs)
+
+    @property
+    def open_sessions(self):
+        """Sessions with a journey in progress"""
+        return len(self._open)
+
+    def _add(self, session_id, from_node, to_node):
+        """Record one transition; callers hold the lock"""
+        journey = self._open.get(session_id)
+        if journey is None or from_node is None:
+            journey = self._open[session_id] = _OpenJourney(self.loop_window)
+            if len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+                self.abandoned += 1
+
+        recent = journey.recent
+        if to_node in recent:
+            nodes = tuple(recent)
+            start = len(nodes) - 1 - nodes[::-1].index(to_node)
+            self.loops.add(nodes[start:] + (to_node,))
+        recent.append(to_node)
+        if len(recent) >= self.n:
+            gram = tuple(recent)[-self.n:]
+            self.ngrams.add(gram)
+            self.frequencies.add(gram)
+
+        journey.length += 1
+        if journey.length <= self.max_path:
+            journey.path.append(to_node)
+        if to_node in self.end_nodes:
+            self._finish(session_id)
+
+    def _finish(self, session_id):
+        """Count a session's journey and forget it; callers hold the lock"""
+        journey = self._open.pop(session_id, None)
+        if journey is None:
+            return
+        key = tuple(journey.path) + ((TRUNCATED,) if journey.length > self.max_path else ())
+        self.journeys.add(key)
+        self.frequencies.add(key)
+
+    def add(self, session_id, from_node, to_node):
+        """
+        Record one transition. A transition from None starts a new journey.
+
+        Args:
+            session_id: Any hashable session identifier
+            from_node (str or None): Origin node
+            to_node (str): Destination node
+        """
+        with self._lock:
+            self._add(session_id, from_node, to_node)
+
+    def finish(self, session_id):
+        """Count a session's journey as complete"""
+        with self._lock:
+            self._finish(session_id)
+
+    def add_journey(self, nodes):
+        """Record a complete journey given as its node sequence"""
+        with self._lock:
+            session_id = object()
+            previous = None
+            for node in nodes:
+                self._add(session_id, previous, node)
+                previous = node
+            self._finish(session_id)
+
+    def write_batch(self, rows):
+        """JourneyExporter sink interface: record exported rows"""
+        with self._lock:
+            for session_id, _, from_node, to_node, *_ in rows:
+                self._add(session_id, from_node, to_node)
+
+    def close(self):
+        """JourneyExporter sink interface: nothing to release"""
+
+    def top_journeys(self, k: int = 10):
+        """Get the k most common complete journeys as HeavyHitters"""
+        with self._lock:
+            return self.journeys.top(k)
+
+    def top_ngrams(self, k: int = 10):
+        """Get the k most common n-grams as HeavyHitters"""
+        with self._lock:
+            return self.ngrams.top(k)
+
+    def top_loops(self, k: int = 10):
+        """Get the k most common loops as HeavyHitters"""
+        with self._lock:
+            return self.loops.top(k)
+
+    def estimate(self, nodes):
+        """
+        Estimate how often a journey or n-gram occurred, tracked or not.
+
+        Returns:
+            int: Upper estimate, within frequencies.error_bound with
+                probability 1 - frequencies.delta
+        """
+        with self._lock:
+            return self.frequencies.estimate(tuple(nodes))
+
+    def report(self, k: int = 5):
+        """
+        Format the most common journeys, loops and n-grams with error bounds.
+
+        Returns:
+            str: Multi-line report
+        """
+        sections = [
+            ("Journeys", self.top_journeys(k), self.journeys),
+            ("Loops", self.top_loops(k), self.loops),
+            (f"{self.n}-grams", self.top_ngrams(k), self.ngrams),
+        ]
+        lines = []
+        for title, hitters, summary in sections:
+            lines.append(f"{title} (total {summary.total}, counts overestimate by at most {summary.error_bound}):")
+            for hitter in hitters:
+                lines.append(f"  {hitter.count:>8} (≥{hitter.lower_bound})  {' → '.join(hitter.key)}")
+        return "\n".join(lines)
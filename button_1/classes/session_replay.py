@@ -0,0 +1,350 @@
+"""
+SessionReplay - Deterministic Session Recording and Headless Replay
+===================================================================
+
+This module captures real ButtonGame sessions and plays them back without
+a terminal. A recording is one compact JSON line holding everything that
+makes a session deterministic:
+
+    - a seed from which the game draws its GameCore random stream seed
+      (random edge selectors)
+    - every key the player pressed, one character per key
+    - the content hash of the snapshot the session was played on
+    - the node path and a SHA-256 digest of the transcript (each logged
+      transition's nodes, selector, text and desired flag)
+    - why the session ended, so sessions cut short by an idle timeout or
+      a time budget replay to the same point
+
+Keys are recorded by wrapping the game's key backend. Replaying feeds the
+recorded keys to a fresh ButtonGame seeded the same way through a
+ScriptedInput, renders into memory, and compares the transcript it
+produces with the recorded digest. Nothing waits on a terminal or touches
+stdout, so thousands of sessions replay in seconds after any engine or
+content change, from any thread.
+
+Classes:
+    SessionRecording: One recorded session
+    SessionRecorder: Create recordable games and append their recordings
+    ReplayResult: Outcome of replaying one recording
+    SessionReplayer: Headless replay and verification
+
+Functions:
+    load_recordings: Read recordings from a JSON-lines file
+    transcript_digest: Hash a game's journey log
+
+Usage:
+    python -m button_1.classes.session_replay BUNDLE_PATH RECORDINGS_PATH
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import hashlib
+import json
+import random
+import secrets
+import sys
+import threading
+import time
+
+from .button_game import ButtonGame
+from .content_registry import content_registry
+from .frame_renderer import FrameRenderer, MemorySink
+from .key_input import ScriptedInput, TerminalInput
+
+
+RECORDING_VERSION = 2
+
+# One character per key returned by NodeEngine.get_arrow_key_input
+KEY_CODES = {'RIGHT': 'R', 'LEFT': 'L', 'UP': 'U', 'DOWN': 'D', 'ENTER': 'E', None: '.'}
+KEY_NAMES = {code: key for key, code in KEY_CODES.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRecording:
+    """
+    Everything needed to replay and verify one session.
+
+    Attributes:
+        seed (int): Seed of the random.Random the game's 64-bit GameCore
+            (SplitMix64) seed is drawn from; replays derive it the same way
+        keys (str): Pressed keys, one KEY_CODES character each
+        content_hash (str): Content hash of the snapshot played
+        path (tuple): Node names visited, starting with start_game
+        digest (str): transcript_digest of the session's journey log
+        end_reason (str or None): ButtonGame.end_reason of the session
+        version (int): Recording format version
+    """
+
+    seed: int
+    keys: str
+    content_hash: str
+    path: tuple
+    digest: str
+    end_reason: str = None
+    version: int = RECORDING_VERSION
+
+    def to_json(self):
+        """Serialize to a single compact JSON line"""
+        record = asdict(self)
+        record['path'] = list(self.path)
+        return json.dumps(record, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, line):
+        """
+        Parse a recording written by to_json.
+
+        Version 1 recordings, which predate end_reason, are still read.
+
+        Raises:
+            ValueError: If the line uses an unsupported recording version
+        """
+        record = json.loads(line)
+        if record.get('version') not in (1, RECORDING_VERSION):
+            raise ValueError(f"Unsupported recording version: {record.get('version')!r}")
+        record['path'] = tuple(record['path'])
+        return cls(**record)
+
+
+def transcript_digest(game_path):
+    """
+    Hash a ButtonGame journey log.
+
+    Args:
+        game_path (list): ButtonGame.game_path entries
+
+    Returns:
+        str: Hex SHA-256 of the canonical JSON of every transition
+    """
+    rows = [
+        (step['from'], step['to'], step['edge_selector'], step['outro_text'], step['is_desired'])
+        for step in game_path
+    ]
+    return hashlib.sha256(json.dumps(rows, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def _journey(game_path):
+    """Get the node path from a journey log"""
+    return tuple(step['to'] for step in game_path)
+
+
+class _RecordingInput:
+    """Key backend wrapper that notes every key handed to the game"""
+
+    def __init__(self, key_input, codes):
+        self.key_input = key_input
+        self.codes = codes
+
+    def __enter__(self):
+        self.key_input.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self.key_input.__exit__(*exc_info)
+
+    def read_key(self, timeout: float = None):
+        key = self.key_input.read_key(timeout)
+        self.codes.append(KEY_CODES.get(key, '.'))
+        return key
+
+
+def load_recordings(path):
+    """
+    Read every recording from a JSON-lines file.
+
+    Args:
+        path (str or Path): Recordings file
+
+    Returns:
+        list: SessionRecording per non-empty line
+    """
+    with open(path, encoding='utf-8') as handle:
+        return [SessionRecording.from_json(line) for line in handle if line.strip()]
+
+
+class SessionRecorder:
+    """
+    Create games whose sessions are recorded, and append the recordings.
+
+    Attributes:
+        path (Path): JSON-lines file recordings are appended to
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the recorder.
+
+        Args:
+            path (str or Path): JSON-lines file to append recordings to
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def new_game(self, button_dat=None, developer_mode: bool = False, seed: int = None, key_input=None,
+                 **kwargs):
+        """
+        Create a ButtonGame whose key presses and random draws are recorded.
+
+        Args:
+            button_dat (ButtonDat, optional): Game data. Defaults to the shared snapshot
+            developer_mode (bool): Enable developer output. Defaults to False
+            seed (int, optional): Recording seed the game's GameCore seed is
+                drawn from. A random seed is chosen when omitted
+            key_input (optional): Key backend to record. Defaults to a
+                TerminalInput on stdin
+            **kwargs: Passed to ButtonGame (renderer, idle_timeout,
+                max_steps, max_seconds, ...)
+
+        Returns:
+            ButtonGame: Game ready to play; pass it to finish() afterwards
+        """
+        seed = secrets.randbits(32) if seed is None else seed
+        keys = []
+        recording_input = _RecordingInput(key_input or TerminalInput(), keys)
+        game = ButtonGame(developer_mode=developer_mode, button_dat=button_dat, rng=random.Random(seed),
+                          key_input=recording_input, **kwargs)
+        game._recording = (seed, keys)
+        return game
+
+    def finish(self, game):
+        """
+        Build the recording for a finished game and append it to the file.
+
+        Args:
+            game (ButtonGame): Game created by new_game
+
+        Returns:
+            SessionRecording: The recording that was written
+        """
+        seed, keys = game._recording
+        recording = SessionRecording(
+            seed=seed,
+            keys=''.join(keys),
+            content_hash=game.game_data.content.content_hash,
+            path=_journey(game.game_path),
+            digest=transcript_digest(game.game_path),
+            end_reason=game.end_reason,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write(recording.to_json() + '\n')
+        return recording
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    """
+    Outcome of replaying one recording.
+
+    Attributes:
+        recording (SessionRecording): Recording that was replayed
+        ok (bool): Whether the transcript matched the recording
+        path (tuple): Node path produced by the replay
+        content_changed (bool): Whether the content hash differs from the recording
+        diverged_at (int or None): Index into path of the first differing node
+        error (str or None): Why the replay stopped early, if it did
+    """
+
+    recording: SessionRecording
+    ok: bool
+    path: tuple
+    content_changed: bool
+    diverged_at: int = None
+    error: str = None
+
+
+class SessionReplayer:
+    """
+    Replay recorded sessions headlessly and verify their transcripts.
+
+    Attributes:
+        button_dat (ButtonDat): Game data the sessions are replayed on
+    """
+
+    def __init__(self, button_dat=None):
+        """
+        Initialize the replayer.
+
+        Args:
+            button_dat (ButtonDat, optional): Game data. Defaults to the shared snapshot
+        """
+        self.button_dat = button_dat or content_registry.get()
+
+    def replay(self, recording: SessionRecording):
+        """
+        Replay one recording with no terminal input or output.
+
+        Args:
+            recording (SessionRecording): Session to replay
+
+        Returns:
+            ReplayResult: Whether the replay reproduced the recorded transcript
+        """
+        # A session cut short by a clock or step limit ends where its keys
+        # run out: with a read timeout set, an exhausted script times out
+        cut_short = recording.end_reason not in (None, 'end')
+        game = ButtonGame(
+            button_dat=self.button_dat, rng=random.Random(recording.seed),
+            key_input=ScriptedInput(KEY_NAMES.get(code) for code in recording.keys),
+            renderer=FrameRenderer(MemorySink()), idle_timeout=1 if cut_short else None,
+        )
+        error = None
+        try:
+            game.play_full_game()
+        except EOFError:
+            error = "Replay needed more keys than were recorded"
+
+        path = _journey(game.game_path)
+        ok = error is None and transcript_digest(game.game_path) == recording.digest
+        diverged_at = None
+        if not ok:
+            diverged_at = next(
+                (i for i, (want, got) in enumerate(zip(recording.path, path)) if want != got),
+                min(len(path), len(recording.path))
+            )
+        return ReplayResult(
+            recording=recording,
+            ok=ok,
+            path=path,
+            content_changed=recording.content_hash != self.button_dat.content.content_hash,
+            diverged_at=diverged_at,
+            error=error,
+        )
+
+    def replay_all(self, recordings):
+        """
+        Replay many recordings.
+
+        Args:
+            recordings (iterable): SessionRecording objects
+
+        Returns:
+            list: ReplayResult per recording, in order
+        """
+        return [self.replay(recording) for recording in recordings]
+
+
+def main(argv=None):
+    """Replay a recordings file against a content bundle and report failures"""
+    from .button_dat import ButtonDat
+
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Usage: python -m button_1.classes.session_replay BUNDLE_PATH RECORDINGS_PATH")
+        return 2
+    replayer = SessionReplayer(ButtonDat.from_bundle(args[0]))
+    started = time.perf_counter()
+    results = replayer.replay_all(load_recordings(args[1]))
+    elapsed = time.perf_counter() - started
+
+    failures = [result for result in results if not result.ok]
+    for result in failures:
+        where = result.error or f"diverged at step {result.diverged_at}"
+        stale = " (content changed since recording)" if result.content_changed else ""
+        print(f"❌ seed {result.recording.seed}: {where}{stale}")
+    print(f"{len(results) - len(failures)}/{len(results)} sessions replayed identically in {elapsed:.2f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+SessionSnapshot - Compact Binary Snapshot and Resume of a Game Session
+======================================================================
+
+This module saves a ButtonGame mid-session as a few hundred bytes and
+restores it later, in another process if need be. A snapshot holds only
+what the session itself owns:
+
+    - the content hash of the snapshot it was played on
+    - the current node and the GameCore random stream state
+    - the journey log as raw edge ids plus its small side table
+    - the session id and developer mode flag
+
+Nothing is taken from DataFrames; the content itself is not copied, and
+restoring checks that the live content has the same hash. Layout:
+
+    header  magic "BSNP", version, flags, content hash (32 bytes),
+            random state, steps, payload length, CRC-32 of the payload
+    payload marshal of (node, session_id, journey snapshot)
+
+SnapshotStore parks idle sessions as files and rehydrates them on demand,
+for hosting many players with few sessions in memory. Session ids are
+used as file names, so the store only accepts ids made of letters,
+digits, '_' and '-'.
+
+Classes:
+    SnapshotError: Raised for unreadable or incompatible snapshots
+    SnapshotStore: Directory of parked sessions keyed by session id
+
+Functions:
+    snapshot_game: Serialize a game to bytes
+    restore_game: Rebuild a game from bytes
+"""
+
+from pathlib import Path
+import marshal
+import os
+import re
+import struct
+import zlib
+
+from .button_game import ButtonGame
+from .content_registry import content_registry
+from .game_core import GameState
+from .journey_log import JourneyLog
+
+
+SNAPSHOT_MAGIC = b"BSNP"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sBB32sQQII")
+_FLAG_DEVELOPER = 1
+_MASK64 = (1 << 64) - 1
+_SESSION_ID = re.compile(r"[A-Za-z0-9_-]+")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is corrupt, unsupported or for other content"""
+
+
+def snapshot_game(game: ButtonGame):
+    """
+    Serialize a game session.
+
+    Args:
+        game (ButtonGame): Game to snapshot, started or not
+
+    Returns:
+        bytes: The snapshot
+    """
+    state = game.state
+    if state is None:
+        state = GameState(game.current_node, game.seed & _MASK64)
+    payload = marshal.dumps((state.node, game.session_id, game.game_path.snapshot()))
+    flags = _FLAG_DEVELOPER if game.developer_mode else 0
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, bytes.fromhex(game.game_data.content.content_hash),
+        state.rng, state.steps, len(payload), zlib.crc32(payload)
+    )
+    return header + payload
+
+
+def restore_game(data, button_dat=None, **kwargs):
+    """
+    Rebuild a game session from a snapshot.
+
+    Args:
+        data (bytes): Value returned by snapshot_game
+        button_dat (ButtonDat, optional): Content to resume on. Defaults to
+            the shared snapshot from the content registry
+        **kwargs: Passed to ButtonGame (key_input, renderer, exporter,
+            max_history, ...)
+
+    Returns:
+        ButtonGame: Game whose play_full_game() continues the session
+
+    Raises:
+        SnapshotError: If the snapshot is corrupt, uses an unsupported
+            version, or was taken on different content
+    """
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Session snapshot is truncated")
+    magic, version, flags, digest, rng, steps, length, crc = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a session snapshot (bad magic)")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported session snapshot version {version}; expected {SNAPSHOT_VERSION}")
+    payload = data[_HEADER.size:_HEADER.size + length]
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise SnapshotError("Session snapshot is corrupt (checksum mismatch)")
+
+    button_dat = button_dat or content_registry.get()
+    if button_dat.content.content_hash != digest.hex():
+        raise SnapshotError("Session snapshot was taken on different game content")
+
+    node, session_id, journey = marshal.loads(payload)
+    exporter = kwargs.pop('exporter', None)  # the start entry was exported already
+    game = ButtonGame(
+        developer_mode=bool(flags & _FLAG_DEVELOPER), button_dat=button_dat, session_id=session_id, **kwargs
+    )
+    try:
+        game.game_path = JourneyLog.restore(game.engine, journey, max_history=kwargs.get('max_history'))
+    except ValueError as exc:
+        raise SnapshotError(str(exc)) from None
+    game.exporter = exporter
+    game.seed = rng
+    game.engine.rng_state = rng  # single-node runs continue the same stream
+    game.state = GameState(node, rng, steps)
+    game.current_node = node if node is not None else game.game_path[-1]['to']
+    game.game_running = node is not None
+    return game
+
+
+class SnapshotStore:
+    """
+    Park sessions as snapshot files and rehydrate them on demand.
+
+    Attributes:
+        directory (Path): Where snapshot files are kept
+    """
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str or Path): Directory for snapshot files, created if missing
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, session_id):
+        """
+        Get the snapshot file for a session id.
+
+        Raises:
+            ValueError: If the id is not a plain name that stays inside the store
+        """
+        if not isinstance(session_id, str) or not _SESSION_ID.fullmatch(session_id):
+            raise ValueError(f"Invalid session id {session_id!r}; use letters, digits, '_' and '-'")
+        return self.directory / f"{session_id}.bsnp"
+
+    def __contains__(self, session_id):
+        try:
+            return self._path(session_id).exists()
+        except ValueError:
+            return False
+
+    def park(self, game: ButtonGame):
+        """
+        Write a game's snapshot, replacing any earlier one atomically.
+
+        Returns:
+            Path: The snapshot file
+
+        Raises:
+            ValueError: If the game's session id cannot be used as a file name
+        """
+        path = self._path(game.session_id)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(snapshot_game(game))
+        os.replace(temporary, path)
+        return path
+
+    def rehydrate(self, session_id, button_dat=None, discard: bool = True, **kwargs):
+        """
+        Restore a parked session.
+
+        Args:
+            session_id (str): Session to restore
+            button_dat (ButtonDat, optional): Content to resume on
+            discard (bool): Remove the snapshot file once restored. Defaults to True
+            **kwargs: Passed to restore_game
+
+        Returns:
+            ButtonGame: The restored game
+
+        Raises:
+            KeyError: If no session with that id is parked
+            ValueError: If the session id cannot be used as a file name
+            SnapshotError: If the snapshot cannot be restored
+        """
+        path = self._path(session_id)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise KeyError(f"No parked session {session_id!r}") from None
+        game = restore_game(data, button_dat, **kwargs)
+        if discard:
+            path.unlink()
+        return game
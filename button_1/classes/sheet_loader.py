@@ -0,0 +1,138 @@
+"""
+SheetLoader - Concurrent Google Sheets Tab Loading
+==================================================
+
+This module loads several Google Sheets tabs at once instead of one after
+the other. Every tab is fetched through its own ButtonDf scraper on a
+bounded thread pool, and all scrapers share a single RateLimiter so that
+bursts of requests stay within what the export endpoint tolerates.
+
+A cold start therefore costs roughly one round trip rather than the sum
+of every tab's round trip plus fixed sleeps between them.
+
+Classes:
+    RateLimiter: Thread-safe token bucket shared between scrapers
+    SheetLoader: Bounded thread pool loader with per-tab timings
+
+Key Features:
+    - Parallel fetching of all requested tabs
+    - Shared rate limiting in place of hard-coded delays
+    - Per-tab load timings for startup diagnostics
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from .button_df import ButtonDf
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how quickly requests are issued.
+
+    The bucket starts full, so a burst of up to `burst` requests goes out
+    immediately; after that requests are spaced to `rate` per second.
+    A single instance is meant to be shared by every scraper in a process.
+
+    Attributes:
+        rate (float): Sustained requests per second
+        burst (int): Maximum number of requests issued back to back
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 3):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate (float): Sustained requests per second. Defaults to 2.0
+            burst (int): Bucket capacity. Defaults to 3 (one per core tab)
+        """
+        if rate <= 0:
+            raise ValueError("RateLimiter rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SheetLoader:
+    """
+    Load several sheet tabs concurrently on a bounded thread pool.
+
+    Each tab is fetched by a ButtonDf scraper running in a worker thread.
+    All scrapers share the loader's RateLimiter, and the wall time spent on
+    each tab is recorded in `timings` once loading finishes.
+
+    Attributes:
+        max_workers (int): Upper bound on simultaneous fetches
+        rate_limiter (RateLimiter): Limiter shared by all scrapers
+        data_urls (dict): Optional per-tab URL overrides
+        cache (SheetCache): On-disk cache passed to every scraper
+        timings (dict): Seconds taken per tab by the most recent load
+    """
+
+    def __init__(self, max_workers: int = 3, rate_limiter: RateLimiter = None, data_urls: dict = None, cache=None):
+        """
+        Initialize the loader.
+
+        Args:
+            max_workers (int): Thread pool size. Defaults to 3
+            rate_limiter (RateLimiter, optional): Shared limiter. A new one
+                is created when omitted
+            data_urls (dict, optional): Mapping of tab name to CSV URL, used
+                instead of the Google Sheets export URL (e.g. a local mirror)
+            cache (SheetCache, optional): On-disk cache shared by the scrapers.
+                Defaults to the process-wide cache
+        """
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.data_urls = data_urls or {}
+        self.cache = cache
+        self.timings = {}
+
+    def _load_one(self, sheet_name):
+        """Fetch a single tab and return its scraper with the time it took"""
+        started = time.perf_counter()
+        scraper = ButtonDf(
+            sheet_name,
+            data_url=self.data_urls.get(sheet_name),
+            rate_limiter=self.rate_limiter,
+            cache=self.cache
+        )
+        return scraper, time.perf_counter() - started
+
+    def load(self, sheet_names):
+        """
+        Fetch all requested tabs concurrently.
+
+        Args:
+            sheet_names (list): Tab names understood by ButtonDf
+
+        Returns:
+            dict: Mapping of tab name to its loaded ButtonDf scraper
+
+        Raises:
+            Exception: The first error raised by any tab's scraper
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {name: pool.submit(self._load_one, name) for name in sheet_names}
+            scrapers = {}
+            self.timings = {}
+            for name, future in futures.items():
+                scrapers[name], self.timings[name] = future.result()
+        return scrapers
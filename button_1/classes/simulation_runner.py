@@ -0,0 +1,147 @@
+"""
+SimulationRunner - Reproducible Simulation Across a Process Pool
+================================================================
+
+This module shards a large batch of simulated playthroughs across worker
+processes. The batch is cut into fixed-size chunks and chunk `i` always
+draws from the `i`-th child of `SeedSequence(seed)`, so every chunk has
+its own independent random stream that does not depend on which worker
+runs it. Per-chunk results are merged in chunk order (path lengths are
+concatenated, visit and transition counts are summed as integers), which
+makes the merged result bit-identical for a given seed whatever the
+number of workers.
+
+Each worker receives the compiled GraphArrays once, when the pool starts,
+rather than with every chunk.
+
+Classes:
+    SimulationRunner: Chunked, seeded simulation on a process pool
+
+Functions:
+    run_simulation: One-shot convenience wrapper around SimulationRunner
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+
+from .simulator import SimulationResult, simulate
+
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+_worker_graph = None
+
+
+def _init_worker(graph):
+    """Keep the story graph in the worker process for every chunk"""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _run_chunk(sessions, seed_sequence, start, max_steps, graph=None):
+    """Simulate one chunk with its own random stream"""
+    result = simulate(
+        graph if graph is not None else _worker_graph,
+        sessions, start=start, max_steps=max_steps,
+        rng=np.random.default_rng(seed_sequence)
+    )
+    return result.path_lengths, result.finished, result.visit_counts, result.edge_counts
+
+
+class SimulationRunner:
+    """
+    Run simulated playthroughs in reproducible chunks on a process pool.
+
+    Attributes:
+        graph (GraphArrays): Compiled story graph
+        workers (int): Number of worker processes (1 runs in-process)
+        chunk_size (int): Sessions per chunk; part of the reproducibility
+            contract, so changing it changes the sampled sessions
+    """
+
+    def __init__(self, graph, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the runner.
+
+        Args:
+            graph (GraphArrays): Compiled story graph
+            workers (int, optional): Worker processes. Defaults to the CPU count
+            chunk_size (int): Sessions per chunk. Defaults to 65,536
+        """
+        if chunk_size <= 0:
+            raise ValueError("SimulationRunner chunk_size must be positive")
+        self.graph = graph
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def _chunks(self, sessions, seed):
+        """Split a batch into (size, SeedSequence) pairs"""
+        count = -(-sessions // self.chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(count)
+        sizes = [self.chunk_size] * (count - 1) + [sessions - self.chunk_size * (count - 1)] if count else []
+        return list(zip(sizes, seeds))
+
+    def run(self, sessions: int, seed: int, start: str = "start_game", max_steps: int = 1000):
+        """
+        Simulate a batch of sessions.
+
+        Args:
+            sessions (int): Number of sessions
+            seed (int): Root seed; the same seed always gives the same result
+            start (str): Starting node name. Defaults to "start_game"
+            max_steps (int): Transitions after which a session is cut off
+
+        Returns:
+            SimulationResult: Merged outcome of every chunk
+        """
+        self.graph.index_of(start)  # fail fast on unknown start nodes
+        chunks = self._chunks(sessions, seed)
+
+        if self.workers == 1 or len(chunks) <= 1:
+            parts = [_run_chunk(size, seq, start, max_steps, self.graph) for size, seq in chunks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(self.graph,)
+            ) as pool:
+                futures = [pool.submit(_run_chunk, size, seq, start, max_steps) for size, seq in chunks]
+                parts = [future.result() for future in futures]
+
+        return self._merge(parts)
+
+    def _merge(self, parts):
+        """Combine per-chunk arrays in chunk order"""
+        graph = self.graph
+        if not parts:
+            empty = np.zeros(0, dtype=np.int64)
+            return SimulationResult(
+                graph, empty, empty.astype(bool),
+                np.zeros(graph.n_nodes, dtype=np.int64), np.zeros(graph.n_edges, dtype=np.int64)
+            )
+        return SimulationResult(
+            graph,
+            np.concatenate([part[0] for part in parts]),
+            np.concatenate([part[1] for part in parts]),
+            np.sum([part[2] for part in parts], axis=0),
+            np.sum([part[3] for part in parts], axis=0),
+        )
+
+
+def run_simulation(graph, sessions: int, seed: int, workers: int = None, **kwargs):
+    """
+    Simulate a batch of sessions on a process pool.
+
+    Args:
+        graph (GraphArrays): Compiled story graph
+        sessions (int): Number of sessions
+        seed (int): Root seed
+        workers (int, optional): Worker processes. Defaults to the CPU count
+        **kwargs: start and max_steps, passed to SimulationRunner.run
+
+    Returns:
+        SimulationResult: Merged outcome
+    """
+    return SimulationRunner(graph, workers=workers).run(sessions, seed, **kwargs)
@@ -0,0 +1,222 @@
+"""
+Simulator - Headless, Vectorized Monte Carlo Playthroughs
+=========================================================
+
+This module plays the story without a terminal. Every simulated session
+is one slot in a NumPy array of current nodes; each step advances all
+live sessions at once using the GraphArrays form of the story, following
+the same edge selector rules as NodeEngine:
+
+    - auto, start and other selectors take the first outgoing edge
+    - random picks an outgoing edge uniformly
+    - end, or a node without outgoing edges, finishes the session
+
+The result summarises path lengths, per-node visits and how often desired
+and undesired edges were taken, which is enough to answer balancing
+questions about loops such as report_analytics -> source_data.
+
+Classes:
+    SimulationResult: Aggregated outcome of a batch of sessions
+
+Functions:
+    simulate: Run a batch of sessions over a story graph
+
+Usage:
+    python -m button_1.classes.simulator BUNDLE_PATH [SESSIONS] [SEED]
+"""
+
+import sys
+
+import numpy as np
+
+from .graph_arrays import SELECT_RANDOM
+
+
+class SimulationResult:
+    """
+    Aggregated outcome of a batch of simulated sessions.
+
+    Attributes:
+        graph (GraphArrays): Graph the sessions were played on
+        path_lengths (np.ndarray): Transitions taken by each session
+        finished (np.ndarray): bool, True where a session reached an end
+        visit_counts (np.ndarray): Visits per node index, including starts
+        edge_counts (np.ndarray): Traversals per CSR edge position
+    """
+
+    def __init__(self, graph, path_lengths, finished, visit_counts, edge_counts):
+        self.graph = graph
+        self.path_lengths = path_lengths
+        self.finished = finished
+        self.visit_counts = visit_counts
+        self.edge_counts = edge_counts
+
+    @property
+    def sessions(self):
+        """Number of simulated sessions"""
+        return len(self.path_lengths)
+
+    @property
+    def completion_rate(self):
+        """Fraction of sessions that reached an end within the step limit"""
+        return float(self.finished.mean()) if self.sessions else 0.0
+
+    def length_distribution(self):
+        """
+        Get the distribution of path lengths.
+
+        Returns:
+            np.ndarray: Count of sessions for each path length (index)
+        """
+        return np.bincount(self.path_lengths)
+
+    def visits_by_node(self):
+        """Get visit counts keyed by node name"""
+        return dict(zip(self.graph.node_names, self.visit_counts.tolist()))
+
+    def edge_traversals(self):
+        """Get traversal counts keyed by (source, target)"""
+        counts = {}
+        for position in np.flatnonzero(self.edge_counts):
+            label = self.graph.edge_label(position)
+            counts[label] = counts.get(label, 0) + int(self.edge_counts[position])
+        return counts
+
+    def _taken_with_flag(self, flag):
+        """Traversals of edges whose desired flag equals `flag`"""
+        return int(self.edge_counts[self.graph.desired == flag].sum())
+
+    @property
+    def desired_rate(self):
+        """Fraction of all traversals that took a desired edge"""
+        total = int(self.edge_counts.sum())
+        return self._taken_with_flag(1) / total if total else 0.0
+
+    @property
+    def undesired_rate(self):
+        """Fraction of all traversals that took an undesired edge"""
+        total = int(self.edge_counts.sum())
+        return self._taken_with_flag(0) / total if total else 0.0
+
+    def summary(self):
+        """Get headline statistics as a dictionary"""
+        lengths = self.path_lengths
+        return {
+            'sessions': self.sessions,
+            'completion_rate': self.completion_rate,
+            'mean_length': float(lengths.mean()) if self.sessions else 0.0,
+            'median_length': float(np.median(lengths)) if self.sessions else 0.0,
+            'p95_length': float(np.percentile(lengths, 95)) if self.sessions else 0.0,
+            'max_length': int(lengths.max()) if self.sessions else 0,
+            'desired_rate': self.desired_rate,
+            'undesired_rate': self.undesired_rate,
+        }
+
+
+def simulate(graph, sessions, start="start_game", max_steps=1000, seed=None, rng=None, sketch=None):
+    """
+    Play a batch of sessions from a start node until each one ends.
+
+    Args:
+        graph (GraphArrays): Compiled story graph
+        sessions (int): Number of sessions to simulate
+        start (str): Starting node name. Defaults to "start_game"
+        max_steps (int): Transitions after which a session is cut off.
+            Defaults to 1000
+        seed (int, optional): Seed for a fresh NumPy generator
+        rng (np.random.Generator, optional): Generator to draw from; takes
+            precedence over seed
+        sketch (PathSketch, optional): Receives every simulated transition
+            and each finished or cut-off journey. All sessions are open at
+            once, so keep sessions within the sketch's max_open. Costs a
+            Python call per transition, so expect a much slower run
+
+    Returns:
+        SimulationResult: Aggregated outcome
+
+    Raises:
+        KeyError: If the start node is not in the graph
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    start_index = graph.index_of(start)
+
+    path_lengths = np.zeros(sessions, dtype=np.int64)
+    finished = np.zeros(sessions, dtype=bool)
+    visit_counts = np.zeros(graph.n_nodes, dtype=np.int64)
+    edge_counts = np.zeros(graph.n_edges, dtype=np.int64)
+    visit_counts[start_index] += sessions
+    names = graph.node_names
+    if sketch is not None:
+        for session in range(sessions):
+            sketch.add(session, None, start)
+
+    if graph.absorbing[start_index]:
+        finished[:] = True
+        if sketch is not None:
+            for session in range(sessions):
+                sketch.finish(session)
+        return SimulationResult(graph, path_lengths, finished, visit_counts, edge_counts)
+
+    # Live sessions only: their ids and current node indices
+    live = np.arange(sessions)
+    current = np.full(sessions, start_index, dtype=np.int32)
+    random_nodes = graph.selector == SELECT_RANDOM
+
+    for step in range(1, max_steps + 1):
+        if not len(live):
+            break
+        position = graph.indptr[current]
+        is_random = random_nodes[current]
+        if is_random.any():
+            degree = graph.out_degree[current[is_random]]
+            position[is_random] += (rng.random(len(degree)) * degree).astype(np.int64)
+
+        edge_counts += np.bincount(position, minlength=graph.n_edges)
+        if sketch is not None:
+            for session, source, target in zip(live.tolist(), current.tolist(), graph.targets[position].tolist()):
+                sketch.add(session, names[source], names[target])
+        current = graph.targets[position]
+        visit_counts += np.bincount(current, minlength=graph.n_nodes)
+
+        done = graph.absorbing[current]
+        if done.any():
+            ended = live[done]
+            if sketch is not None:
+                for session in ended.tolist():
+                    sketch.finish(session)
+            path_lengths[ended] = step
+            finished[ended] = True
+            live = live[~done]
+            current = current[~done]
+
+    path_lengths[live] = max_steps
+    if sketch is not None:
+        for session in live.tolist():
+            sketch.finish(session)  # cut off sessions count as they stand
+    return SimulationResult(graph, path_lengths, finished, visit_counts, edge_counts)
+
+
+def main(argv=None):
+    """Simulate sessions over a compiled content bundle and print a summary"""
+    from button_common.content_bundle import load_bundle
+    from .graph_arrays import compile_graph_arrays
+    from .simulation_runner import run_simulation
+
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) not in (1, 2, 3):
+        print("Usage: python -m button_1.classes.simulator BUNDLE_PATH [SESSIONS] [SEED]")
+        return 2
+    sessions = int(args[1]) if len(args) >= 2 else 100_000
+    seed = int(args[2]) if len(args) == 3 else 0
+    result = run_simulation(compile_graph_arrays(load_bundle(args[0])), sessions, seed)
+
+    for key, value in result.summary().items():
+        print(f"{key:>16}: {value:.3f}" if isinstance(value, float) else f"{key:>16}: {value}")
+    print("\nEdge traversals per session:")
+    for (source, target), count in sorted(result.edge_traversals().items(), key=lambda item: -item[1]):
+        print(f"  {source} → {target}: {count / sessions:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
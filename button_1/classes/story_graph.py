@@ -6,9 +6,9 @@ This module provides comprehensive visualization and analysis capabilities
 for the text-based adventure game's narrative structure. It creates network
 graphs that reveal the story's branching paths, decision points, and cycles.
 
-The StoryGraph class extends ButtonDat to provide NetworkX-based graph
-visualization with sophisticated styling and layout options optimized
-for narrative flow analysis.
+The StoryGraph class wraps a shared ButtonDat snapshot to provide
+NetworkX-based graph visualization with sophisticated styling and layout
+options optimized for narrative flow analysis.
 
 Classes:
     StoryGraph: Network visualization of game narrative structure
@@ -20,6 +20,7 @@ Key Features:
     - Professional styling with "murky chic" color palette
     - Flexible layout algorithms (spring, hierarchical, etc.)
     - High-resolution PNG export capabilities
+    - Exact expected path length and ending probabilities (Markov analysis)
 
 Visualization Elements:
     - Node colors indicate edge selector types (auto, random, choice, etc.)
@@ -31,8 +32,9 @@ Visualization Elements:
 import networkx as nx
 import matplotlib.pyplot as plt 
 from .button_dat import ButtonDat
+from .content_registry import content_registry
 
-class StoryGraph(ButtonDat):
+class StoryGraph:
     """
     Network graph visualization of the game's narrative structure.
     
@@ -46,10 +48,12 @@ class StoryGraph(ButtonDat):
     provides clear directional flow indicators to show how players move
     through the narrative space.
     
-    Inherits from:
-        ButtonDat: Provides access to edges, nodes, and text data
+    Data queries (edges_df, get_all_nodes, graph_arrays, ...) are answered
+    by the shared ButtonDat snapshot, so its lazily built views and tables
+    exist once per process however many graphs are drawn from it.
     
     Attributes:
+        button_dat (ButtonDat): Shared content snapshot the graph is drawn from
         graph (nx.DiGraph): NetworkX directed graph of narrative structure
         
     Color Coding:
@@ -63,34 +67,48 @@ class StoryGraph(ButtonDat):
         - Dim gray: Unknown/other node types
     """
     
-    def __init__(self):
+    def __init__(self, button_dat: ButtonDat = None):
         """
         Initialize graph with data loading and NetworkX construction.
         
-        Loads all game data via ButtonDat parent class, then constructs
-        a NetworkX directed graph from the edges DataFrame for visualization
+        Holds a reference to an existing ButtonDat snapshot (the
+        process-wide one from the content registry unless given) instead
+        of loading everything again, then constructs a
+        NetworkX directed graph from the edges DataFrame for visualization
         and analysis purposes.
         
         The resulting graph structure can be used for pathfinding, cycle
         detection, narrative analysis, and visual representation of the
         complete game flow.
+        
+        Args:
+            button_dat (ButtonDat, optional): Loaded game data to share.
+                Defaults to the shared snapshot from the content registry
         """
-        super().__init__()
+        self.button_dat = button_dat or content_registry.get()
+        
         # Create directed graph from edges DataFrame
         self.graph = nx.from_pandas_edgelist(
-            self.edges_df,
+            self.button_dat.edges_df,
             source='source',
             target='target',
             create_using=nx.DiGraph
         )
 
+    def __getattr__(self, name):
+        """Answer data attributes and methods from the shared snapshot"""
+        button_dat = self.__dict__.get('button_dat')
+        if button_dat is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(button_dat, name)
+
     def _get_node_colors(self):
         """
         Generate sophisticated node colors based on edge_selector attributes.
         
         Implements a "murky chic" color palette using professional earth tones
         to distinguish different node types while maintaining visual coherence.
-        Colors are mapped to edge_selector values from the nodes DataFrame.
+        Colors are mapped to edge_selector values from the node index.
         
         Returns:
             list: Color strings for each node in graph order
@@ -119,17 +137,10 @@ class StoryGraph(ButtonDat):
         
         node_colors = []
         for node in self.graph.nodes():
-            # Look up the edge_selector for this node in nodes_df
-            if 'node' in self.nodes_df.columns and 'edge_selector' in self.nodes_df.columns:
-                node_data = self.nodes_df[self.nodes_df['node'] == node]
-                if not node_data.empty:
-                    edge_selector = node_data.iloc[0]['edge_selector']
-                    color = color_map.get(edge_selector, default_color)
-                    node_colors.append(color)
-                else:
-                    node_colors.append(default_color)
-            else:
-                node_colors.append(default_color)
+            # Look up the edge_selector for this node in the node index
+            row = self.content.nodes.get(node)
+            edge_selector = row[1] if row is not None else None
+            node_colors.append(color_map.get(edge_selector, default_color))
         
         return node_colors
 
@@ -225,6 +236,52 @@ class StoryGraph(ButtonDat):
         
         return stats
 
+    @property
+    def markov(self):
+        """
+        Get the exact Markov chain analysis of the story.
+        
+        Built on first access from the snapshot's graph arrays, so it
+        reflects the content this graph was created from.
+        
+        Returns:
+            MarkovAnalysis: Expected steps, visits, absorption and
+                finish-within-k probabilities
+        """
+        analysis = self.__dict__.get('_markov')
+        if analysis is None:
+            from .markov import MarkovAnalysis
+            analysis = self._markov = MarkovAnalysis(self.graph_arrays)
+        return analysis
+
+    def get_path_stats(self, start: str = "start_game", horizons=(10, 25, 50, 100)):
+        """
+        Get exact path statistics for a playthrough starting at a node.
+        
+        Args:
+            start (str): Starting node. Defaults to "start_game"
+            horizons (tuple): Step counts to report finish probabilities for
+            
+        Returns:
+            dict: expected_steps, expected_visits, absorption and finish_within
+        """
+        markov = self.markov
+        stats = {
+            'expected_steps': markov.expected_steps(start),
+            'expected_visits': markov.expected_visits(start),
+            'absorption': markov.absorption_probabilities(start),
+            'finish_within': {k: markov.finish_within(k, start) for k in horizons},
+        }
+        
+        print("\n=== Expected Playthrough ===")
+        print(f"Expected steps from {start}: {stats['expected_steps']:.2f}")
+        for node, probability in stats['absorption'].items():
+            print(f"Ends at {node}: {probability:.1%}")
+        for k, probability in stats['finish_within'].items():
+            print(f"Finished within {k} steps: {probability:.1%}")
+        
+        return stats
+
     def save_graph(self):
         # Save with tight bounding box to ensure everything fits
         plt.savefig("button_1/vis/graph.png", bbox_inches="tight", dpi=300)
@@ -0,0 +1,217 @@
+"""
+TextWrap - Memoized, Terminal-Aware Text Wrapping
+=================================================
+
+This module wraps narrative text for the console once and reuses the
+result. The same intro, event and outro paragraphs are shown every time a
+player passes through a node, so wrapped frames are kept in a bounded LRU
+cache keyed by the text and the layout (width and indents). Content
+strings are interned when a bundle is loaded, so a repeat lookup usually
+hits on object identity before any string comparison.
+
+The wrap width follows the real terminal, capped at 80 columns. It is
+measured once and re-measured after the window is resized (SIGWINCH).
+The width is part of every cache key, so frames wrapped at the old width
+stay valid and are simply aged out by the LRU.
+
+Classes:
+    WrapCache: Bounded LRU cache of wrapped text
+
+Functions:
+    terminal_width: Current wrap width for the attached terminal
+    frame_texts: Yield the paragraphs a set of node views will display
+    prewarm_views: Wrap a snapshot's paragraphs ahead of time
+
+Module Attributes:
+    wrap_cache: The process-wide cache used by the game classes
+    COMMON_WIDTHS: Widths pre-wrapped at content load
+"""
+
+from collections import OrderedDict
+import shutil
+import signal
+import textwrap
+import threading
+
+
+MAX_WIDTH = 80
+MIN_WIDTH = 20
+COMMON_WIDTHS = (80, 72, 60)
+
+
+class WrapCache:
+    """
+    Thread-safe LRU cache of wrapped paragraphs.
+
+    Attributes:
+        maxsize (int): Maximum number of wrapped frames kept
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that had to call textwrap
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of wrapped frames. Defaults to 4096
+        """
+        if maxsize <= 0:
+            raise ValueError("WrapCache maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def wrap(self, text, width, initial_indent="", subsequent_indent=""):
+        """
+        Wrap text to a width, reusing an earlier result when available.
+
+        Produces the same output as `textwrap.fill` with the given indents.
+
+        Args:
+            text (str): Paragraph to wrap
+            width (int): Maximum line width
+            initial_indent (str): Prefix for the first line
+            subsequent_indent (str): Prefix for the remaining lines
+
+        Returns:
+            str: Wrapped text joined with newlines
+        """
+        key = (text, width, initial_indent, subsequent_indent)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return frame
+
+        frame = '\n'.join(textwrap.wrap(
+            text, width=width, initial_indent=initial_indent, subsequent_indent=subsequent_indent
+        ))
+        with self._lock:
+            self.misses += 1
+            self._frames[key] = frame
+            if len(self._frames) > self.maxsize:
+                self._frames.popitem(last=False)
+        return frame
+
+    def clear(self):
+        """Drop every cached frame"""
+        with self._lock:
+            self._frames.clear()
+
+
+wrap_cache = WrapCache()
+
+_width = None
+_resize_handler_installed = False
+
+
+def _on_resize(signum, frame):
+    """
+    SIGWINCH handler: forget the measured width.
+
+    Only rebinds a module global. The handler runs on the main thread
+    between bytecodes, possibly while `WrapCache.wrap` holds the cache
+    lock, so it must not touch the cache.
+    """
+    global _width
+    _width = None
+
+
+def _install_resize_handler():
+    """Listen for window resizes when it is safe to take over SIGWINCH"""
+    global _resize_handler_installed
+    _resize_handler_installed = True
+    if not hasattr(signal, 'SIGWINCH') or threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGWINCH) in (signal.SIG_DFL, None):
+        signal.signal(signal.SIGWINCH, _on_resize)
+
+
+def terminal_width(max_width: int = MAX_WIDTH):
+    """
+    Get the wrap width for the attached terminal.
+
+    Measured once, then cached until the window is resized. Falls back to
+    80 columns when there is no terminal.
+
+    Args:
+        max_width (int): Upper bound on the width. Defaults to 80
+
+    Returns:
+        int: Terminal width clamped to [20, max_width]
+    """
+    global _width
+    if not _resize_handler_installed:
+        _install_resize_handler()
+    if _width is None:
+        _width = shutil.get_terminal_size((MAX_WIDTH, 24)).columns
+    return max(MIN_WIDTH, min(max_width, _width))
+
+
+def frame_texts(views, edge_good=None, edge_bad=None):
+    """
+    Yield every paragraph a set of node views will display.
+
+    Covers intro and event text, and each edge's transition text with the
+    edge_good/edge_bad feedback that random selectors put in front of it.
+
+    Args:
+        views (Mapping): Node name to NodeView
+        edge_good (str, optional): Feedback text for desired random edges
+        edge_bad (str, optional): Feedback text for undesired random edges
+
+    Yields:
+        str: Paragraph text
+    """
+    for view in views.values():
+        if view.intro_text:
+            yield view.intro_text
+        if view.event_text:
+            yield view.event_text
+        for edge in view.edges:
+            parts = []
+            if view.edge_selector == 'random' and edge.desired is not None:
+                feedback = edge_good if edge.desired else edge_bad
+                if feedback:
+                    parts.append(feedback)
+            if edge.outro_text:
+                parts.append(edge.outro_text)
+            if parts:
+                yield " ".join(parts)
+
+
+def prewarm_views(views, edge_good=None, edge_bad=None, widths=COMMON_WIDTHS, cache=None):
+    """
+    Wrap a snapshot's paragraphs at the common widths ahead of play.
+
+    Uses at most half of the cache, leaving room for frames wrapped at the
+    live terminal width.
+
+    Args:
+        views (Mapping): Node name to NodeView
+        edge_good (str, optional): Feedback text for desired random edges
+        edge_bad (str, optional): Feedback text for undesired random edges
+        widths (tuple): Widths to wrap at. Defaults to COMMON_WIDTHS
+        cache (WrapCache, optional): Target cache. Defaults to wrap_cache
+
+    Returns:
+        int: Number of frames wrapped
+    """
+    if cache is None:
+        cache = wrap_cache
+    budget = cache.maxsize // 2
+    count = 0
+    for text in frame_texts(views, edge_good, edge_bad):
+        for width in widths:
+            if count >= budget:
+                return count
+            cache.wrap(text, width)
+            count += 1
+    return count
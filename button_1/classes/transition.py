@@ -0,0 +1,43 @@
+"""
+TransitionResult - Outcome of Running a Single Node
+===================================================
+
+This module defines the immutable record NodeEngine returns for every node
+it runs. The engine resolves the edge selector, the chosen edge, its
+desired flag and the combined feedback + outro text once per step; the
+outro display, the developer info and ButtonGame's journey log all read
+from the same record instead of looking the facts up again.
+
+Classes:
+    TransitionResult: Frozen record of one step's transition
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionResult:
+    """
+    Everything decided while running one node.
+
+    Attributes:
+        from_node (str): Node that was run
+        next_node (str or None): Chosen successor, None when the game ends
+        edge_selector (str): Transition logic of from_node
+        combined_text (str or None): Edge feedback (random selectors only)
+            followed by the edge's outro text, None when there is nothing to show
+        is_desired (bool or None): Desired flag of the chosen edge
+        user_input (str or None): Key the player used to advance
+    """
+
+    from_node: str
+    next_node: str = None
+    edge_selector: str = 'auto'
+    combined_text: str = None
+    is_desired: bool = None
+    user_input: str = None
+
+    @property
+    def is_end(self):
+        """True when the step did not lead to another node"""
+        return self.next_node is None
@@ -0,0 +1,159 @@
+"""
+Shared fixtures for the button_1 test suite.
+
+Most tests in this package load live content from Google Sheets. The
+fixtures here provide a small offline copy of the story (same nodes,
+selectors and loops as the live sheet) for tests that must not depend on
+network access.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import threading
+import time
+
+import pytest
+from button_common import sheet_cache
+from button_common.sheet_cache import SheetCache
+
+
+STORY_CSV = {
+    'edges': (
+        "source,target,outro_text,desired\n"
+        "start_game,welcome,You begin your career in data.,True\n"
+        "welcome,onboarding,You proceed to onboarding.,True\n"
+        "onboarding,initiate_project,Well done for completing onboarding.,True\n"
+        "initiate_project,source_data,You are ready to source the data.,True\n"
+        "source_data,transform_data,You find clearly-marked tables.,True\n"
+        "transform_data,analyse_data,You architect a clean data lineage.,True\n"
+        "analyse_data,report_analytics,You build dashboards that answer the question.,True\n"
+        "report_analytics,decision_maker,You present your findings with flair.,True\n"
+        "report_analytics,source_data,A stakeholder mentions a data source nobody told you about.,False\n"
+        "decision_maker,initiate_project,The analysis doesn't answer the question posed.,False\n"
+        "analyse_data,transform_data,Your analysis shows duplicates and missingness.,False\n"
+        "decision_maker,end,Leadership declare the results satisfactory. There is no cake.,True\n"
+        "end,summary,,True\n"
+    ),
+    'nodes': (
+        "node,edge_selector,title_text,intro_text,event_text,pbn\n"
+        "start_game,start,PRESS A BUTTON NOW,Explore the lived experience of working in data.,,to enter the world of data\n"
+        "welcome,auto,Welcome!,Welcome to your first day at TechCo!,,to proceed to onboarding\n"
+        "onboarding,auto,Onboarding,Welcome to onboarding at TechCo!,,to complete onboarding\n"
+        "initiate_project,auto,A question that needs answering,An executive has a question.,,to consult stakeholders\n"
+        "source_data,auto,Source the data,The data warehouse is home to hundreds of databases.,,to dive into the warehouse\n"
+        "transform_data,auto,Shape the data,You are ready to transform the data.,,to architect a data lineage\n"
+        "analyse_data,random,Analyse the data,\"Finally, the fun part!\",,to build visualisations\n"
+        "report_analytics,random,Report your findings,The big day has arrived!,,to report your findings\n"
+        "decision_maker,random,Decision maker assessment,You receive a calendar invite.,,to meet with your manager\n"
+        "end,end,End game,The project ends in a whimper.,,to reflect on your time at TechCo\n"
+        "summary,end,Your TechCo experience,,,\n"
+    ),
+    'text': (
+        "id_text,text_type,text_context,text\n"
+        "pbn,generic,input,Press a button now\n"
+        "edge_good,edge,edge_selector,This step went as expected.\n"
+        "edge_bad,edge,edge_selector,\"Oh, no! Something isn't quite right.\"\n"
+    ),
+}
+
+
+class _SheetHandler(BaseHTTPRequestHandler):
+    """Serve STORY_CSV tabs at /<tab>.csv after an injected delay"""
+
+    server_state = None
+
+    def do_GET(self):
+        state = self.server_state
+        with state.lock:
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            time.sleep(state.latency)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+        state.hits.append(self.path)
+        body = state.tabs.get(self.path.strip('/').removesuffix('.csv'))
+        if body is None:
+            self.send_error(404)
+            return
+        payload = body.encode('utf-8')
+        etag = f'"{hashlib.sha256(payload).hexdigest()[:16]}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SheetServer:
+    """
+    Handle on a running stand-in server.
+
+    Attributes:
+        tabs (dict): Tab name to CSV text currently served (editable)
+        hits (list): Request paths received, in order
+        latency (float): Delay in seconds added to every request
+        max_in_flight (int): Most requests seen inside the delay at once
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.tabs = dict(STORY_CSV)
+        self.hits = []
+        self.latency = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def urls(self, latency=0.0):
+        """Set the injected latency and return tab URLs for ButtonDat(data_urls=...)"""
+        self.latency = latency
+        return {name: f"{self.base_url}/{name}.csv" for name in self.tabs}
+
+
+@pytest.fixture
+def sheet_server(tmp_path, monkeypatch):
+    """
+    Local HTTP stand-in for the Google Sheets CSV export.
+
+    The process-wide sheet cache is redirected to a temporary directory for
+    the duration of the test so nothing leaks into the user's cache.
+    """
+    monkeypatch.setattr(sheet_cache, '_default_cache', SheetCache(tmp_path / 'cache'))
+    handler = type('SheetHandler', (_SheetHandler,), {})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    state = SheetServer(f"http://127.0.0.1:{server.server_address[1]}")
+    handler.server_state = state
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def story_dir(tmp_path):
+    """Directory holding STORY_CSV as edges.csv, nodes.csv and text.csv"""
+    data_dir = tmp_path / 'story'
+    data_dir.mkdir()
+    for name, body in STORY_CSV.items():
+        (data_dir / f"{name}.csv").write_text(body, encoding='utf-8')
+    return data_dir
+
+
+@pytest.fixture
+def story_dat(story_dir):
+    """ButtonDat backed by STORY_CSV, compiled without any network access"""
+    from button_1.classes.button_dat import ButtonDat
+    from button_common.content_bundle import compile_csv_dir
+    return ButtonDat.from_content(compile_csv_dir(story_dir))
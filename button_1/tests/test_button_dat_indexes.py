@@ -0,0 +1,49 @@
+from button_1.classes.button_dat import ButtonDat
+from button_common.content_bundle import compile_content
+
+
+def _chain_content(n_nodes):
+    """Synthetic story: a chain of n nodes where every node also loops back one step"""
+    nodes = [{'node': f"n{i}", 'edge_selector': 'random', 'title_text': f"Node {i}"} for i in range(n_nodes)]
+    edges = [{'source': f"n{i}", 'target': f"n{i + 1}", 'desired': 'TRUE'} for i in range(n_nodes - 1)]
+    edges += [{'source': f"n{i}", 'target': f"n{i - 1}", 'desired': 'FALSE'} for i in range(1, n_nodes - 1)]
+    text = [{'id_text': 'pbn', 'text': 'Press a button now'}]
+    return compile_content(edges, nodes, text)
+
+
+class TestButtonDatIndexes:
+    """Test suite for ButtonDat's hash-indexed queries"""
+
+    def test_queries_match_content(self, story_dat):
+        """Test indexed answers against the story content"""
+        assert story_dat.get_connections('report_analytics') == ['decision_maker', 'source_data'], "Connections should keep edge order"
+        assert story_dat.get_connections('summary') == [], "Terminal nodes should have no connections"
+        assert story_dat.get_node_info('analyse_data')['edge_selector'] == 'random', "Node info should be a row dict"
+        assert story_dat.get_node_info('nonexistent_node') is None, "Unknown nodes should return None"
+        assert story_dat.get_text_by_id('edge_bad') == "Oh, no! Something isn't quite right.", "Text should be found by id"
+        assert story_dat.get_text_by_id('missing') is None, "Unknown text ids should return None"
+        assert sorted(story_dat.get_all_nodes()) == sorted(story_dat.content.node_names), "All nodes should come from the index"
+
+    def test_results_are_copies(self, story_dat):
+        """Test that callers cannot mutate the shared index"""
+        story_dat.get_connections('start_game').append('hacked')
+        story_dat.get_node_info('start_game')['edge_selector'] = 'hacked'
+
+        assert story_dat.get_connections('start_game') == ['welcome'], "Connections should be unaffected"
+        assert story_dat.get_node_info('start_game')['edge_selector'] == 'start', "Node info should be unaffected"
+
+    def test_queries_never_scan_tables(self):
+        """Test that queries are answered from the indexes, not the DataFrames"""
+        game_data = ButtonDat.from_content(_chain_content(20000))
+        game_data.edges_df = game_data.nodes_df = game_data.text_df = None
+
+        assert game_data.get_connections('n19998') == ['n19999', 'n19997'], "Connections should come from the index"
+        assert game_data.get_node_info('n12345')['title_text'] == "Node 12345", "Node info should come from the index"
+        assert game_data.get_text_by_id('pbn') == "Press a button now", "Text should come from the index"
+
+    def test_sheet_loaded_data_is_indexed(self, sheet_server):
+        """Test that data loaded from sheets builds the same indexes"""
+        game_data = ButtonDat(data_urls=sheet_server.urls())
+
+        assert game_data.get_connections('decision_maker') == ['initiate_project', 'end'], "Sheet data should be indexed"
+        assert game_data.validate_data() is None, "Clean story data should validate"
@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+import pytest
+from button_1.classes.button_dat import ButtonDat
+from button_common.content_bundle import (
+    SCHEMA_VERSION, ContentBundle, compile_content, compile_csv_dir, load_bundle
+)
+
+
+class TestContentBundle:
+    """Test suite for compiled content bundles"""
+
+    def test_compile_resolves_adjacency(self, story_dir):
+        """Test that successors and outgoing edges are pre-resolved"""
+        bundle = compile_csv_dir(story_dir)
+
+        assert bundle.successors['report_analytics'] == ('decision_maker', 'source_data'), "Successors should keep edge order"
+        assert len(bundle.out_edges['decision_maker']) == 2, "decision_maker should have two outgoing edges"
+        assert 'summary' not in bundle.successors, "summary should have no successors"
+        assert bundle.text_by_id['pbn'] == "Press a button now", "Text should be indexed by id"
+        assert bundle.nodes['summary'][2] == "Your TechCo experience", "Node rows should be indexed by name"
+        assert bundle.nodes['summary'][3] is None, "Blank cells should become None"
+
+    def test_round_trip_preserves_content(self, story_dir, tmp_path):
+        """Test that writing and loading yields identical content"""
+        bundle = compile_csv_dir(story_dir)
+        path = tmp_path / 'content.bundle'
+        bundle.write(path)
+        loaded = load_bundle(path)
+
+        assert loaded.content_hash == bundle.content_hash, "Content hash should survive a round trip"
+        assert loaded.edges == bundle.edges, "Edges should survive a round trip"
+        assert loaded.schema_version == SCHEMA_VERSION, "Schema version should be recorded"
+
+    def test_strings_are_interned(self, story_dir, tmp_path):
+        """Test that repeated strings share one object after loading"""
+        path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(path)
+        loaded = load_bundle(path)
+
+        source_data_refs = [edge[1] for edge in loaded.edges if edge[1] == 'source_data']
+        assert source_data_refs[0] is source_data_refs[1], "Repeated node names should be interned"
+        assert loaded.nodes['source_data'][0] is source_data_refs[0], "Node rows should share interned names"
+
+    def test_rejects_corrupt_or_foreign_bundles(self, story_dir):
+        """Test integrity and version checks"""
+        data = bytearray(compile_csv_dir(story_dir).to_bytes())
+
+        corrupt = bytes(data[:-1]) + bytes([data[-1] ^ 0xFF])
+        with pytest.raises(ValueError, match="corrupt"):
+            ContentBundle.from_bytes(corrupt)
+
+        future = bytes(data[:4]) + (SCHEMA_VERSION + 1).to_bytes(2, 'little') + bytes(data[6:])
+        with pytest.raises(ValueError, match="schema"):
+            ContentBundle.from_bytes(future)
+
+        with pytest.raises(ValueError, match="magic"):
+            ContentBundle.from_bytes(b"PK" + bytes(data[2:]))
+
+    def test_compile_reports_invalid_rows(self):
+        """Test that validation collects every problem"""
+        with pytest.raises(ValueError) as excinfo:
+            compile_content(
+                edges=[{'source': 'a', 'target': '', 'desired': 'maybe'}],
+                nodes=[{'node': 'a'}, {'node': 'a'}],
+                text=[{'id_text': 'pbn', 'text': 'Press'}],
+            )
+        message = str(excinfo.value)
+        assert "blank source or target" in message, "Blank targets should be reported"
+        assert "duplicate node 'a'" in message, "Duplicate nodes should be reported"
+
+    def test_button_dat_loads_bundle(self, story_dir, tmp_path):
+        """Test that ButtonDat can be backed by a bundle"""
+        path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(path)
+        game_data = ButtonDat.from_bundle(path)
+
+        assert game_data.content is not None, "Bundle-backed data should expose its content"
+        assert not game_data.edges_df.empty, "DataFrames should be materialized on demand"
+        assert game_data.get_connections('decision_maker') == ['initiate_project', 'end'], "Queries should work on bundle data"
+
+    def test_bundle_load_does_not_import_pandas(self, story_dir, tmp_path):
+        """Test that loading a bundle at runtime never imports pandas"""
+        path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(path)
+        script = (
+            "import sys\n"
+            "from button_1.classes.button_dat import ButtonDat\n"
+            f"data = ButtonDat.from_bundle({str(path)!r})\n"
+            "assert data.content.successors['start_game'] == ('welcome',)\n"
+            "assert 'pandas' not in sys.modules, 'pandas was imported'\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,89 @@
+import importlib
+import threading
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.content_registry import ContentRegistry, content_registry
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.story_graph import StoryGraph
+from button_common.content_bundle import compile_csv_dir
+
+
+class TestContentRegistry:
+    """Test suite for the process-wide content registry"""
+
+    def test_source_loaded_once(self, sheet_server):
+        """Test that repeated and concurrent gets share one load"""
+        registry = ContentRegistry()
+        urls = sheet_server.urls(latency=0.1)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get(data_urls=urls))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(result is results[0] for result in results), "Every caller should get the same snapshot"
+        assert registry.get(data_urls=urls) is results[0], "Later gets should reuse the snapshot"
+        assert registry.load_count == 1, "The source should be loaded once"
+        assert len(sheet_server.hits) == 3, "Each tab should be fetched once"
+
+    def test_invalidate_forces_reload(self, sheet_server):
+        """Test explicit invalidation"""
+        registry = ContentRegistry()
+        urls = sheet_server.urls()
+        first = registry.get(data_urls=urls)
+
+        assert registry.invalidate(data_urls=urls) is True, "Invalidation should drop the snapshot"
+        assert registry.invalidate(data_urls=urls) is False, "Nothing left to drop"
+        assert registry.get(data_urls=urls) is not first, "A fresh snapshot should be loaded"
+        assert registry.load_count == 2, "Invalidated source should be loaded again"
+
+    def test_invalidate_during_load_discards_it(self, monkeypatch, tmp_path):
+        """Test that a load racing an invalidation does not keep its stale snapshot"""
+        registry_module = importlib.import_module('button_1.classes.content_registry')
+        registry = ContentRegistry()
+        bundle_path = str(tmp_path / 'content.bundle')
+
+        class Snapshot:
+            distance_tables = None
+
+            def __init__(self, **kwargs):
+                if registry.load_count == 0:
+                    registry.invalidate(bundle_path=bundle_path)
+
+        monkeypatch.setattr(registry_module, 'ButtonDat', Snapshot)
+        stale = registry.get(bundle_path=bundle_path)
+        fresh = registry.get(bundle_path=bundle_path)
+
+        assert fresh is not stale, "The snapshot loaded across an invalidation should not be kept"
+        assert registry.get(bundle_path=bundle_path) is fresh, "The reload should be kept"
+        assert registry.load_count == 2, "Both loads should be counted"
+
+    def test_game_components_share_snapshot(self, story_dir, tmp_path, monkeypatch):
+        """Test that ButtonGame, NodeEngine and StoryGraph share data by reference"""
+        bundle_path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(bundle_path)
+        monkeypatch.setenv("BUTTON_CONTENT_BUNDLE", str(bundle_path))
+        content_registry.clear()
+        try:
+            menu_game = ButtonGame()
+            played_game = ButtonGame(developer_mode=True)
+            engine = NodeEngine()
+            story = StoryGraph()
+
+            assert played_game.game_data is menu_game.game_data, "Games should share one snapshot"
+            assert engine.button_dat is menu_game.game_data, "NodeEngine should use the shared snapshot"
+            assert story.edges_df is menu_game.game_data.edges_df, "StoryGraph should share tables by reference"
+            assert story.graph.number_of_edges() == len(story.edges_df), "Graph should be built from shared edges"
+        finally:
+            content_registry.clear()
+
+    def test_story_graphs_share_lazy_caches(self, story_dat):
+        """Test that StoryGraph delegates to its snapshot instead of copying it"""
+        first, second = StoryGraph(story_dat), StoryGraph(story_dat)
+
+        assert first.button_dat is story_dat, "The graph should hold the snapshot itself"
+        assert first.node_views is second.node_views is story_dat.node_views, "Views should be built once"
+        assert first.distance_tables is story_dat.distance_tables, "Tables should live on the snapshot"
+        assert '_graph_arrays' not in vars(first), "No snapshot cache should be copied onto the graph"
@@ -0,0 +1,103 @@
+import random
+import time
+
+from button_1.classes.content_validator import ContentValidator
+from button_common.content_bundle import compile_content
+
+TEXT = [{'id_text': 'pbn', 'text': 'Press'}, {'id_text': 'edge_good', 'text': 'Good'},
+        {'id_text': 'edge_bad', 'text': 'Bad'}]
+
+
+def _content(edges, selectors, text=TEXT):
+    """Compile (source, target) edges and {node: selector} rows"""
+    return compile_content(
+        [{'source': s, 'target': t, 'desired': 'TRUE'} for s, t in edges],
+        [{'node': name, 'edge_selector': selector} for name, selector in selectors.items()],
+        text,
+    )
+
+
+def _chain(n_nodes):
+    """Edges and selectors of a start_game -> n1 -> ... -> end chain"""
+    names = ["start_game"] + [f"n{i}" for i in range(1, n_nodes - 1)] + ["end"]
+    edges = list(zip(names, names[1:]))
+    selectors = dict.fromkeys(names, 'auto')
+    selectors["start_game"], selectors["end"] = 'start', 'end'
+    return edges, selectors
+
+
+class TestContentValidator:
+    """Test suite for full and incremental content validation"""
+
+    def test_story_is_clean(self, story_dat):
+        """Test that the offline story has no issues"""
+        assert ContentValidator().validate(story_dat.content) == [], "The story should validate cleanly"
+        assert story_dat.validate_data() is None, "validate_data should include the graph checks"
+
+    def test_every_issue_kind(self):
+        """Test that each authoring mistake is reported"""
+        content = _content(
+            [("start_game", "a"), ("a", "ghost"), ("b", "end"), ("orphan", "end")],
+            {"start_game": 'random', "a": 'sometimes', "b": 'auto', "end": 'end', "orphan": 'auto', "stuck": 'auto'},
+            text=TEXT[:1],
+        )
+        issues = ContentValidator().validate(content)
+
+        assert issues == [
+            "text id 'edge_good' is missing",
+            "text id 'edge_bad' is missing",
+            "edge a -> ghost: target node 'ghost' is not in the nodes table",
+            "node 'a': unknown edge_selector 'sometimes'",
+            "node 'start_game': 'random' selector with a single successor",
+            "node 'stuck': no outgoing edges but edge_selector is 'auto', not 'end'",
+            "node 'b': not reachable from 'start_game'",
+            "node 'end': not reachable from 'start_game'",
+            "node 'orphan': not reachable from 'start_game'",
+            "node 'stuck': not reachable from 'start_game'",
+        ], "Every issue should be listed, global ones first"
+
+    def test_incremental_updates_match_full_validation(self):
+        """Test that random edits give the same issues as validating from scratch"""
+        rng = random.Random(4)
+        edges, selectors = _chain(30)
+        validator = ContentValidator()
+        validator.validate(_content(edges, selectors))
+        names = list(selectors) + ["ghost"]
+
+        for _ in range(200):
+            edit = rng.random()
+            if edit < 0.4 or not edges:
+                edges.append((rng.choice(names), rng.choice(names)))
+            elif edit < 0.7:
+                edges.pop(rng.randrange(len(edges)))
+            elif edit < 0.85:
+                selectors[rng.choice(names)] = rng.choice(['auto', 'random', 'end', 'odd'])
+            else:
+                selectors.pop(rng.choice(list(selectors)), None)
+            content = _content(edges, selectors)
+            assert validator.update(content) == ContentValidator().validate(content), \
+                "Incremental issues should match a full validation"
+
+    def test_large_story_updates_are_local(self):
+        """Test that one edit to a 50k-node story re-checks only its neighbourhood"""
+        edges, selectors = _chain(50_000)
+        validator = ContentValidator()
+        start = time.perf_counter()
+        assert validator.validate(_content(edges, selectors)) == [], "The chain should be clean"
+        full_time = time.perf_counter() - start
+
+        edges.append(("n100", "ghost"))
+        updated = _content(edges, selectors)
+        start = time.perf_counter()
+        issues = validator.update(updated)
+        update_time = time.perf_counter() - start
+
+        assert issues == ["edge n100 -> ghost: target node 'ghost' is not in the nodes table"], \
+            "Only the new edge should be reported"
+        assert validator.checked == 1, "Only the changed node should be re-checked"
+        assert update_time < full_time, f"Update took {update_time:.3f}s vs {full_time:.3f}s for a full pass"
+
+        selectors["ghost"] = 'end'
+        assert validator.update(_content(edges, selectors), changed=["ghost"]) == [], \
+            "Defining the target should clear the issue via its predecessor"
+        assert validator.checked == 2, "The new node and its predecessor should be re-checked"
@@ -0,0 +1,105 @@
+import math
+import random
+import time
+
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.content_registry import ContentRegistry
+from button_1.classes.distance_tables import UNREACHABLE
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.markov import MarkovAnalysis
+from button_common.content_bundle import compile_content, compile_csv_dir
+
+TEXT = [{'id_text': 'pbn', 'text': 'Press'}, {'id_text': 'edge_good', 'text': 'Good'},
+        {'id_text': 'edge_bad', 'text': 'Bad'}]
+
+
+def _button_dat(edges, selectors):
+    """ButtonDat over (source, target) edges and {node: selector} rows"""
+    return ButtonDat.from_content(compile_content(
+        [{'source': s, 'target': t, 'desired': 'TRUE'} for s, t in edges],
+        [{'node': name, 'edge_selector': selector} for name, selector in selectors.items()],
+        TEXT,
+    ))
+
+
+def _game(button_dat, **kwargs):
+    """Quiet game that always presses RIGHT"""
+    return ButtonGame(button_dat=button_dat, rng=random.Random(1), key_input=ScriptedInput(['RIGHT'] * 1000),
+                      renderer=FrameRenderer(MemorySink()), **kwargs)
+
+
+class TestDistanceTables:
+    """Test suite for precomputed steps-to-end tables"""
+
+    def test_story_distances(self, story_dat):
+        """Test shortest and expected steps for the offline story"""
+        tables = story_dat.distance_tables
+
+        assert tables.remaining("end") == (0, 0.0) and tables.remaining("summary") == (0, 0.0), \
+            "Finishing nodes should be zero steps from the end"
+        assert tables.remaining("decision_maker")[0] == 1, "decision_maker links straight to the end"
+        assert tables.remaining("start_game")[0] == 9, "The story's shortest route has 9 transitions"
+        assert math.isclose(tables.remaining("start_game")[1], MarkovAnalysis(story_dat.graph_arrays).expected_steps()), \
+            "Expected steps should match the Markov analysis"
+        assert story_dat.distance_tables is tables, "The tables should be computed once per snapshot"
+        assert tables.targets == ("end", "summary"), "Distances should be measured to either finishing node"
+
+    def test_registry_defers_the_solve(self, story_dir, tmp_path):
+        """Test that loads build the shortest table and leave the Markov solve for later"""
+        bundle_path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(bundle_path)
+        snapshot = ContentRegistry().get(bundle_path=str(bundle_path))
+        tables = vars(snapshot).get('_distance_tables')
+
+        assert tables is not None, "The tables should be built during the load"
+        assert tables._expected is None, "Expected steps should not be solved during the load"
+        assert tables.remaining("start_game") == (9, 31.0), "Expected steps should be solved on first use"
+        assert tables.expected is tables.expected, "The solve should run once"
+
+    def test_unreachable_and_trapped_nodes(self):
+        """Test that nodes which can never finish are marked"""
+        button_dat = _button_dat(
+            [("start_game", "a"), ("a", "end"), ("start_game", "c"), ("c", "c"), ("c", "end")],
+            {"start_game": 'random', "a": 'auto', "c": 'auto', "end": 'end'},
+        )
+        tables = button_dat.distance_tables
+
+        assert tables.remaining("a") == (1, 1.0), "a takes its only edge to the end"
+        assert tables.remaining("c") == (None, math.inf), "c always loops back to itself"
+        assert tables.shortest[button_dat.graph_arrays.index_of("c")] == UNREACHABLE, "The array should hold the marker"
+        assert tables.remaining("start_game") == (2, math.inf), "A random start may fall into the trap"
+        assert tables.progress("c", 3) is None, "There is no progress to show in a trap"
+
+    def test_progress_is_shown(self, story_dat):
+        """Test the progress bar and developer line during play"""
+        quiet = _game(story_dat)
+        quiet.play_full_game()
+        game = _game(story_dat, show_progress=True, developer_mode=True)
+        game.play_full_game()
+        output = game.engine.renderer.sink.getvalue()
+
+        assert "📈 [" not in quiet.engine.renderer.sink.getvalue(), "Progress should be off by default"
+        assert "📈 [█░░░░░░░░░░░░░░░░░░░] about 30 steps to go" in output, "A bar should follow the first step"
+        assert "📏 Steps to End: 8 shortest, 30.0 expected" in output, "Developer info should show the distances"
+
+    def test_large_graph_is_linear(self):
+        """Test that a 50k-node story is tabulated quickly and looked up in O(1)"""
+        names = ["start_game"] + [f"n{i}" for i in range(1, 49_999)] + ["end"]
+        selectors = dict.fromkeys(names, 'auto')
+        selectors["start_game"], selectors["end"] = 'start', 'end'
+        button_dat = _button_dat(list(zip(names, names[1:])), selectors)
+
+        start = time.perf_counter()
+        tables = button_dat.distance_tables
+        tables.expected
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for name in names[::100]:
+            tables.remaining(name)
+        lookup_time = (time.perf_counter() - start) / len(names[::100])
+
+        assert tables.remaining("start_game") == (49_999, 49_999.0), "The chain's length should be exact"
+        assert build_time < 5.0, f"Building took {build_time:.2f}s"
+        assert lookup_time < 1e-4, f"A lookup took {lookup_time * 1e6:.1f}µs"
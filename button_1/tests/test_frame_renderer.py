@@ -0,0 +1,69 @@
+import io
+import socket
+
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import BinarySink, FrameRenderer, MemorySink, SocketSink, StreamSink
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.node_engine import NodeEngine
+
+
+class TestSinks:
+    """Test suite for frame destinations"""
+
+    def test_memory_sink_and_counters(self):
+        """Test that parts become one write and are counted in bytes"""
+        sink = MemorySink()
+        renderer = FrameRenderer(sink)
+
+        renderer.write("Title\n", "", "Go →")
+        renderer.write("", "")
+        renderer.write(" ✓\n")
+
+        assert sink.frames == ["Title\nGo →", " ✓\n"], "Each call should be one frame; empty frames are skipped"
+        assert renderer.writes == 2, "Only non-empty frames count as writes"
+        assert renderer.bytes_written == len(sink.getvalue().encode('utf-8')), "Bytes should be counted encoded"
+
+    def test_stream_and_binary_sinks(self):
+        """Test text streams and binary writers with newline translation"""
+        text, binary = io.StringIO(), io.BytesIO()
+        FrameRenderer(StreamSink(text)).write("a\n", "b ✓\n")
+        renderer = FrameRenderer(BinarySink(binary, newline="\r\n"))
+        renderer.write("a\n", "b ✓\n")
+
+        assert text.getvalue() == "a\nb ✓\n", "Text stream should get the frame as is"
+        assert binary.getvalue() == "a\r\nb ✓\r\n".encode('utf-8'), "Binary sink should encode and translate"
+        assert renderer.bytes_written == len(binary.getvalue()), "Translated bytes should be counted"
+
+    def test_socket_sink(self):
+        """Test frames sent over a socket"""
+        left, right = socket.socketpair()
+        with left, right:
+            FrameRenderer(SocketSink(left)).write("one\n", "two\n")
+            assert right.recv(1024) == b"one\r\ntwo\r\n", "Socket should receive one CRLF frame"
+
+
+class TestFrameRendering:
+    """Test suite for frame-at-a-time game output"""
+
+    def test_game_writes_once_per_step(self, story_dat):
+        """Test that a full game makes one write per node"""
+        sink = MemorySink()
+        game = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 200), renderer=FrameRenderer(sink))
+        game.play_full_game()
+
+        steps = len(game.game_path)  # every logged transition plus the final step from the end node
+        assert len(sink.frames) == steps + 1, "One write for the start node and one per step"
+        assert sink.frames[0].endswith("arrow)") and "Thanks for playing!" in sink.frames[-1], \
+            "Each frame should end with its prompt; the last one carries the summary"
+
+    def test_single_node_writes(self, story_dat):
+        """Test that running a single node writes the node and its outcome once each"""
+        sink = MemorySink()
+        engine = NodeEngine(story_dat, developer_mode=True, key_input=ScriptedInput([None, 'RIGHT']),
+                            renderer=FrameRenderer(sink))
+        result = engine.run_single_node('welcome')
+
+        assert len(sink.frames) == 2, "Node frame and transition frame should be separate single writes"
+        assert "WELCOME!" in sink.frames[0] and sink.frames[0].endswith("arrow)"), "Node and prompt go together"
+        assert sink.frames[1].startswith(" ✓\n") and f"Next Node: {result.next_node}" in sink.frames[1], \
+            "Outro and developer info go together"
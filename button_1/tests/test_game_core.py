@@ -0,0 +1,137 @@
+import dataclasses
+import itertools
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.game_core import GameCore, GameState
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.node_engine import NodeEngine
+
+
+def _play(core, seed):
+    """Press RIGHT until the game ends and return (frames, states)"""
+    frames, state = core.start(seed)
+    frames, states = list(frames), [state]
+    while not state.done:
+        step_frames, state = core.step(state, 'RIGHT')
+        frames.extend(step_frames)
+        states.append(state)
+    return frames, states
+
+
+class TestGameCore:
+    """Test suite for the pure step function"""
+
+    def test_state_is_immutable_and_compact(self, story_dat):
+        """Test that states are frozen slot records"""
+        _, state = GameCore(story_dat, width=80).start(seed=1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            state.node = 'end'
+        assert not hasattr(state, '__dict__'), "States should not carry a per-instance dict"
+        assert (state.node, state.steps, state.last) == ('start_game', 0, None), "Start state should be fresh"
+        assert state.nodes_visited == 1, "The start node should count as visited"
+
+    def test_other_keys_do_not_advance(self, story_dat):
+        """Test that non-advancing keys return the same state and no frames"""
+        core = GameCore(story_dat, width=80)
+        _, state = core.start(seed=1)
+
+        for key in ('LEFT', 'UP', None, 'QUIT'):
+            assert core.step(state, key) == ((), state), f"{key!r} should not advance"
+            assert core.step(state, key)[1] is state, "The same state object should come back"
+        frames, after = core.step(state, 'ENTER')
+        assert after.node == 'welcome' and frames, "ENTER should advance like RIGHT"
+
+    def test_steps_are_deterministic_and_pure(self, story_dat):
+        """Test that a state fully determines its future"""
+        core = GameCore(story_dat, width=80)
+        first = _play(core, seed=11)
+        assert first == _play(GameCore(story_dat, width=80), seed=11), "Same seed should replay exactly"
+
+        fork = next(s for s in first[1] if s.node == 'report_analytics')
+        assert core.step(fork, 'RIGHT') == core.step(fork, 'RIGHT'), "Stepping a state must not change it"
+        assert len({tuple(s.node for s in _play(core, seed)[1]) for seed in range(30)}) > 1, "Seeds should vary routes"
+
+    def test_random_selector_is_uniform(self, story_dat):
+        """Test edge choice frequencies at a random node"""
+        core = GameCore(story_dat, width=80)
+        counts = {}
+        for seed in range(4000):
+            _, state = core.step(GameState('report_analytics', seed), 'RIGHT')
+            counts[state.node] = counts.get(state.node, 0) + 1
+
+        assert set(counts) == {'decision_maker', 'source_data'}, "Only successors should be chosen"
+        assert abs(counts['decision_maker'] / 4000 - 0.5) < 0.05, f"Choice should be uniform: {counts}"
+
+    def test_frames_match_engine_rendering(self, story_dat):
+        """Test that frames are exactly what the engine renders"""
+        core = GameCore(story_dat, width=60, developer_mode=True)
+        engine = NodeEngine(story_dat)
+        _, state = core.start(seed=3)
+        frames, state = core.step(state, 'RIGHT')
+        result = state.last
+
+        assert frames[0] == " ✓\n" + engine.render_outro(result, 60) + engine.render_developer_info(result), \
+            "Transition frame should hold the outro and developer info"
+        assert frames[1].endswith(engine.render_node('welcome', 60) + engine.render_prompt('welcome', 60)), \
+            "Node frame should hold the node text and prompt"
+        assert core.step(GameState('end', 0), 'RIGHT')[1].done, "The end node should finish the game"
+
+    def test_terminal_game_is_an_adapter(self, story_dat, monkeypatch, capsys):
+        """Test that the terminal game prints the core's frames and nothing else but the summary"""
+        presses = itertools.cycle(['LEFT', 'RIGHT'])
+        game = ButtonGame(button_dat=story_dat)
+        monkeypatch.setattr(game.engine, 'get_arrow_key_input', lambda: next(presses))
+        game.play_full_game()
+        output = capsys.readouterr().out
+
+        frames, states = _play(GameCore(story_dat), game.seed)
+        assert output == "".join(frames) + game.render_game_summary(), "Output should be the core's frames"
+        assert [step['to'] for step in game.game_path] == [s.node for s in states[:-1]], "Log should follow the core"
+
+    def test_frames_are_shared(self, story_dat):
+        """Test that in-process steps reuse rendered frames"""
+        core = GameCore(story_dat, width=80)
+        _play(core, seed=0)  # render every frame once
+        _, state = core.start(seed=0)
+        first_frames, _ = core.step(state, 'RIGHT')
+
+        assert core.step(core.start(seed=5)[1], 'RIGHT')[0] is first_frames, "Frames should be shared, not rebuilt"
+
+    def test_results_report_the_key_pressed(self, story_dat):
+        """Test that shared transitions still record the key of each step"""
+        core = GameCore(story_dat, width=80)
+        developer = GameCore(story_dat, width=80, developer_mode=True)
+        _, state = core.start(seed=0)
+        _, by_enter = core.step(state, 'ENTER')
+        _, by_right = core.step(state, 'RIGHT')
+        enter_frames, _ = developer.step(developer.start(seed=0)[1], 'ENTER')
+
+        assert (by_enter.last.user_input, by_right.last.user_input) == ('ENTER', 'RIGHT'), "Each step should keep its key"
+        assert by_enter.last.next_node == by_right.last.next_node, "Both keys should take the same edge"
+        assert "User Input: 'ENTER'" in enter_frames[0], "Developer info should show the key pressed"
+
+    def test_front_ends_share_selector_rules(self, story_dat):
+        """Test that single-node runs and full games pick the same path from a seed"""
+        full = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 1000),
+                          renderer=FrameRenderer(MemorySink()))
+        full.play_full_game()
+        single = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 1000),
+                            renderer=FrameRenderer(MemorySink()))
+        single.seed = single.engine.rng_state = full.seed
+        path, node = ['start_game'], 'start_game'
+        while (node := single.play_single_node(node)) is not None:
+            path.append(node)
+
+        assert path == [step['to'] for step in full.game_path][:len(path)], "Both front ends should take one path"
+        assert len(path) == len(full.game_path), "Both should end at the same node"
+
+    def test_core_does_not_touch_the_terminal(self, story_dat):
+        """Test that a core's rendering engine never creates a key backend or stdout renderer"""
+        core = GameCore(story_dat, width=80)
+        _play(core, seed=2)
+
+        assert core._engine._key_input is None and core._engine._renderer is None, "No terminal I/O should be set up"
+        assert core._engine.core is core, "The engine should pick successors with this core"
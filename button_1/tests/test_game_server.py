@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.game_server import TELNET_CHARACTER_MODE, GameServer, TelnetKeyDecoder
+
+
+PROMPT = b"arrow)"  # end of the prompt, which may be wrapped
+THANKS = b"Thanks for playing!"
+
+
+async def _play_session(port, key=b"\x1b[C", delay=0):
+    """Connect, advance through every prompt and return the transcript"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    transcript = b""
+    while THANKS not in transcript:
+        chunk = await reader.read(65536)
+        if not chunk:
+            break
+        transcript += chunk
+        if transcript.endswith(PROMPT):
+            await asyncio.sleep(delay)
+            writer.write(key)
+            await writer.drain()
+    writer.close()
+    assert transcript.startswith(TELNET_CHARACTER_MODE), "Server should negotiate character mode"
+    return transcript[len(TELNET_CHARACTER_MODE):].decode('utf-8')
+
+
+def _run(story_dat, scenario, **kwargs):
+    """Run a scenario coroutine against a server on a free port"""
+    async def main():
+        server = await GameServer(story_dat, host='127.0.0.1', port=0, **kwargs).start()
+        try:
+            return server, await scenario(server)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+class TestTelnetKeyDecoder:
+    """Test suite for socket key decoding"""
+
+    def test_arrows_enter_and_quit(self):
+        """Test the key sequences players send"""
+        decoder = TelnetKeyDecoder()
+        keys = decoder.feed(b"\x1b[C\x1b[D\x1bOA\r\n\r\x00\nxq\x03")
+        assert keys == ['RIGHT', 'LEFT', 'UP', 'ENTER', 'ENTER', 'ENTER', None, 'QUIT', 'QUIT'], "Keys should decode"
+
+    def test_split_sequences_and_negotiation(self):
+        """Test sequences split across reads and telnet option bytes"""
+        decoder = TelnetKeyDecoder()
+        assert decoder.feed(b"\xff\xfb\x01\x1b") == [], "Negotiation is skipped, partial ESC is held"
+        assert decoder.feed(b"[") == [], "Still incomplete"
+        assert decoder.feed(b"C\xff\xfa\x1f\x00\x50\xff\xf0\r") == ['RIGHT', 'ENTER'], "Sequence completes"
+        assert decoder.feed(b"\n\x1b[B") == ['DOWN'], "LF after CR is part of the same Enter"
+
+
+class TestGameServer:
+    """Test suite for the asyncio multi-session server"""
+
+    def test_full_session_over_socket(self, story_dat):
+        """Test that a socket player can finish the game"""
+        server, transcript = _run(story_dat, lambda server: _play_session(server.port))
+
+        assert "PRESS A BUTTON NOW" in transcript, "First node title should be sent"
+        assert "Your Journey Through the Data Science World" in transcript, "Summary should be sent"
+        assert "\r\n" in transcript and "\n" not in transcript.replace("\r\n", ""), "Lines should end in CRLF"
+        assert server.total_sessions == 1 and server.steps >= 9, "Server should count the session's steps"
+        assert server.writes == server.steps + 1, "Each step should go out in a single write"
+        assert server.bytes_sent == len(transcript.encode('utf-8')), "Every byte sent should be counted"
+
+    def test_enter_key_and_quit(self, story_dat):
+        """Test line-mode Enter and leaving early"""
+        async def scenario(server):
+            transcript = await _play_session(server.port, key=b"\n")
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            await reader.readuntil(PROMPT)
+            writer.write(b"q")
+            goodbye = await reader.read()
+            return transcript, goodbye
+
+        server, (transcript, goodbye) = _run(story_dat, scenario)
+        assert THANKS.decode() in transcript, "Enter should advance like the right arrow"
+        assert b"Goodbye!" in goodbye, "q should end the session"
+        assert server.active_sessions == 0, "Closed sessions should be released"
+
+    def test_many_concurrent_sessions(self, story_dat):
+        """Test idle and active players sharing one snapshot"""
+        async def scenario(server):
+            idle = [await asyncio.open_connection('127.0.0.1', server.port) for _ in range(200)]
+            await asyncio.sleep(0.05)
+            peak = server.active_sessions
+            transcripts = await asyncio.gather(*(_play_session(server.port) for _ in range(100)))
+            for _, writer in idle:
+                writer.close()
+            return peak, transcripts
+
+        server, (peak, transcripts) = _run(story_dat, scenario)
+
+        assert peak == 200, "Idle players should all be connected at once"
+        assert all(THANKS.decode() in t for t in transcripts), "Every active player should finish"
+        assert len({t for t in transcripts}) > 1, "Sessions should have independent random streams"
+        assert server.mean_step_seconds < 1e-3, f"Mean step took {server.mean_step_seconds * 1e6:.0f}µs"
+
+    def test_session_budgets(self, story_dat):
+        """Test that step and time budgets end sessions with a reason"""
+        async def scenario(server):
+            played = await _play_session(server.port)
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            idle = await asyncio.wait_for(reader.read(), 5)  # never presses a key
+            writer.close()
+            return played, idle[len(TELNET_CHARACTER_MODE):].decode('utf-8')
+
+        server, (played, idle) = _run(story_dat, scenario, max_steps=3, max_seconds=0.3)
+
+        assert "step limit" in played and THANKS.decode() in played, "The step budget should end the game"
+        assert "time limit" in idle and THANKS.decode() in idle, "The time budget should end an idle session"
+        assert server.end_reasons == {'step_budget': 1, 'time_budget': 1}, "End reasons should be counted"
+
+    def test_idle_timeout(self, story_dat, monkeypatch):
+        """Test that a silent client is dropped after the idle timeout, not the time budget"""
+        def fail(*args, **kwargs):
+            raise AssertionError("Sessions should not build a ButtonGame")
+        monkeypatch.setattr(ButtonGame, '__init__', fail)
+
+        async def scenario(server):
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            transcript = await asyncio.wait_for(reader.read(), 5)  # never presses a key
+            writer.close()
+            return transcript[len(TELNET_CHARACTER_MODE):].decode('utf-8')
+
+        server, transcript = _run(story_dat, scenario, idle_timeout=0.2, max_seconds=60)
+
+        assert "No key pressed" in transcript and THANKS.decode() in transcript, "The idle timeout should end the game"
+        assert server.end_reasons == {'idle_timeout': 1}, "The end reason should be the idle timeout"
+
+    def test_time_budget_spans_steps(self, story_dat):
+        """Test that the time budget counts from the session start, not the last key"""
+        server, transcript = _run(story_dat, lambda server: _play_session(server.port, delay=0.15), max_seconds=0.5)
+
+        assert "time limit" in transcript and THANKS.decode() in transcript, "An active player should run out of time"
+        assert 2 <= server.steps < 9, f"The session should end mid-game, after {server.steps} steps"
+        assert server.end_reasons == {'time_budget': 1}, "The end reason should be the time budget"
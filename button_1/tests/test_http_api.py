@@ -0,0 +1,176 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.http_api import StepApi, TokenError, make_server
+from button_1.classes.key_input import ScriptedInput
+from button_common.content_bundle import compile_content
+
+
+SECRET = b"test-secret"
+
+
+def _play(api, seed, keys=('RIGHT',)):
+    """Play a whole session through the API, cycling through keys"""
+    response = api.start(seed)
+    responses = [response]
+    i = 0
+    while not response['done']:
+        response = api.step(response['token'], keys[i % len(keys)])
+        responses.append(response)
+        i += 1
+    return responses
+
+
+@pytest.fixture
+def http_api(story_dat):
+    """Serve a StepApi on a free port for the duration of a test"""
+    server = make_server(StepApi(story_dat, secret=SECRET), host='127.0.0.1', port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _request(url, body=None, headers=None):
+    """Send a request and return (status, headers, decoded JSON or None)"""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, headers=headers or {}, method='POST' if data else 'GET')
+    try:
+        with urllib.request.urlopen(request) as response:
+            raw = response.read()
+            return response.status, response.headers, json.loads(raw) if raw else None
+    except urllib.error.HTTPError as error:
+        raw = error.read()
+        return error.code, error.headers, json.loads(raw) if raw else None
+
+
+class TestStepApi:
+    """Test suite for the stateless step logic"""
+
+    def test_session_reaches_the_end(self, story_dat):
+        """Test a full playthrough driven only by tokens"""
+        responses = _play(StepApi(story_dat, secret=SECRET), seed=1)
+        path = [r['node'] for r in responses]
+
+        assert path[0] == 'start_game' and path[-2] == 'end' and path[-1] is None, "Session should run to the end"
+        assert "Thanks for playing!" in responses[-1]['frame'], "The final frame should close the game"
+        assert responses[1]['transition']['from'] == 'start_game', "Transitions should be reported"
+
+    def test_end_summary_matches_the_terminal(self, story_dat):
+        """Test that the HTTP end frame counts nodes like the terminal game"""
+        responses = _play(StepApi(story_dat, secret=SECRET), seed=3)
+        game = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 1000),
+                          renderer=FrameRenderer(MemorySink()))
+        game.seed = game.engine.rng_state = 3
+        game.play_full_game()
+        terminal_end = game.render_game_summary().rstrip("\n").rsplit("\n", 2)[-2:]
+
+        assert [r['node'] for r in responses][:-1] == [step['to'] for step in game.game_path], "Both should take one path"
+        assert responses[-1]['frame'].rstrip("\n").rsplit("\n", 2)[-2:] == terminal_end, \
+            "The HTTP end frame should close with the terminal's summary lines"
+
+    def test_any_worker_can_serve_any_step(self, story_dat):
+        """Test that workers sharing a secret are interchangeable and deterministic"""
+        workers = [StepApi(story_dat, secret=SECRET) for _ in range(3)]
+        response = workers[0].start(seed=7)
+        alternated = [response]
+        for i in range(200):
+            if response['done']:
+                break
+            response = workers[i % 3].step(response['token'], 'RIGHT')
+            alternated.append(response)
+
+        assert alternated == _play(workers[1], seed=7), "Worker choice must not change the session"
+
+    def test_other_keys_do_not_advance(self, story_dat):
+        """Test that non-advancing keys keep the token unchanged"""
+        api = StepApi(story_dat, secret=SECRET)
+        start = api.start(seed=3)
+        stay = api.step(start['token'], 'LEFT')
+
+        assert stay['token'] == start['token'] and stay['node'] == 'start_game', "LEFT should not move"
+        assert _play(api, 3, keys=('LEFT', 'ENTER', None))[-1]['node'] is None, "ENTER advances like RIGHT"
+
+    def test_forged_and_foreign_tokens_rejected(self, story_dat, story_dir):
+        """Test signature, format and content checks"""
+        api = StepApi(story_dat, secret=SECRET)
+        token = api.start(seed=1)['token']
+        payload, signature = token.split('.')
+
+        with pytest.raises(TokenError, match="signature"):
+            StepApi(story_dat, secret=b"other").step(token, 'RIGHT')
+        with pytest.raises(TokenError, match="signature"):
+            api.step(payload[:-2] + "AA." + signature, 'RIGHT')
+        with pytest.raises(TokenError, match="Malformed"):
+            api.step("not-a-token", 'RIGHT')
+
+        other_content = StepApi(story_dat, secret=SECRET)
+        other_content.content_tag = "0" * 12
+        with pytest.raises(TokenError, match="different game content"):
+            other_content.step(token, 'RIGHT')
+
+    def test_journey_digest_tracks_path(self, story_dat):
+        """Test that different routes end with different digests"""
+        api = StepApi(story_dat, secret=SECRET)
+        final = {}
+        for seed in range(20):
+            responses = _play(api, seed)
+            route = tuple(r['node'] for r in responses)
+            final[route] = api.decode_token(responses[-1]['token'])[1]
+
+        assert len(set(final.values())) == len(final), "Each distinct route should have its own digest"
+
+
+class TestStepHttp:
+    """Test suite for the HTTP transport"""
+
+    def test_start_and_step_over_http(self, http_api):
+        """Test the JSON endpoints"""
+        status, _, start = _request(f"{http_api}/start", {'seed': 2})
+        status_step, _, step = _request(f"{http_api}/step", {'token': start['token'], 'key': 'RIGHT'})
+
+        assert status == 200 and start['node'] == 'start_game', "Start should return the first node"
+        assert status_step == 200 and step['node'] == 'welcome', "Step should advance"
+
+    def test_errors(self, http_api):
+        """Test status codes for bad requests"""
+        assert _request(f"{http_api}/step", {'token': 'x.y', 'key': 'RIGHT'})[0] == 403, "Bad tokens are forbidden"
+        assert _request(f"{http_api}/step", {'key': 'RIGHT'})[0] == 400, "Missing token is a bad request"
+        assert _request(f"{http_api}/nodes/nowhere")[0] == 404, "Unknown nodes are not found"
+        for body in ([], 1, "seed"):
+            status, _, error = _request(f"{http_api}/start", body)
+            assert status == 400 and "object" in error['error'], f"A {type(body).__name__} body is a bad request"
+
+    def test_node_names_are_url_decoded(self):
+        """Test that escaped node names in the path are found"""
+        button_dat = ButtonDat.from_content(compile_content(
+            [{'source': 'start_game', 'target': 'data review'}, {'source': 'data review', 'target': 'end'}],
+            [{'node': 'start_game', 'edge_selector': 'start'}, {'node': 'data review', 'edge_selector': 'auto'},
+             {'node': 'end', 'edge_selector': 'end'}],
+            [{'id_text': 'pbn', 'text': 'Press'}],
+        ))
+        server = make_server(StepApi(button_dat, secret=SECRET), host='127.0.0.1', port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            status, _, body = _request(f"http://127.0.0.1:{server.server_address[1]}/nodes/data%20review?v=1")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert status == 200 and body['node'] == 'data review', "The path segment should be unquoted"
+
+    def test_node_frames_carry_etags(self, http_api):
+        """Test conditional requests for static node frames"""
+        status, headers, body = _request(f"{http_api}/nodes/welcome")
+        etag = headers['ETag']
+        status_cached, _, cached = _request(f"{http_api}/nodes/welcome", headers={'If-None-Match': etag})
+
+        assert status == 200 and "WELCOME!" in body['frame'], "Node frame should be served"
+        assert status_cached == 304 and cached is None, "Matching ETag should return 304 with no body"
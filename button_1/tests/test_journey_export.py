@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.journey_export import BufferSink, JourneyExporter, JsonlSink, ParquetSink, open_sink
+from button_1.classes.key_input import ScriptedInput
+
+
+def _play(story_dat, exporter, seed):
+    """Play one scripted game that exports its journey"""
+    game = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 500),
+                      exporter=exporter, session_id=f"s{seed}")
+    game.play_full_game()
+    return game
+
+
+class _BlockedSink(BufferSink):
+    """Buffer sink whose writes wait until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write_batch(self, rows):
+        self.release.wait()
+        super().write_batch(rows)
+
+
+class _SlowSink(BufferSink):
+    """Buffer sink that takes a while per batch"""
+
+    def write_batch(self, rows):
+        time.sleep(0.05)
+        super().write_batch(rows)
+
+
+class TestJourneyExporter:
+    """Test suite for background journey export"""
+
+    def test_game_streams_its_journey(self, story_dat, capsys):
+        """Test that every logged transition is exported in order"""
+        sink = BufferSink()
+        with JourneyExporter(sink) as exporter:
+            game = _play(story_dat, exporter, 1)
+        capsys.readouterr()
+
+        rows = list(sink.rows)
+        assert [(r[0], r[1], r[2], r[3]) for r in rows] == [
+            ("s1", i, step['from'], step['to']) for i, step in enumerate(game.game_path)
+        ], "Rows should mirror the journey log"
+        assert rows[-1][5] is True and rows[0][4] == 'start', "Selector and desired flag should be exported"
+
+    def test_jsonl_batches(self, story_dat, tmp_path, capsys):
+        """Test JSON-lines export of many games in few writes"""
+        path = tmp_path / 'journeys.jsonl'
+        with JourneyExporter(open_sink(path), batch_size=256) as exporter:
+            games = [_play(story_dat, exporter, seed) for seed in range(20)]
+        capsys.readouterr()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == sum(len(game.game_path) for game in games) == exporter.written, "Every row is written"
+        assert exporter.batches < len(lines) / 10, "Rows should be written in batches"
+        assert set(lines[0]) == {'session_id', 'step', 'from_node', 'to_node', 'edge_selector', 'is_desired',
+                                 'timestamp'}, "Rows should carry the documented fields"
+
+    def test_submit_never_waits(self):
+        """Test that a stuck sink neither blocks nor grows memory without bound"""
+        sink = _BlockedSink()
+        exporter = JourneyExporter(sink, batch_size=10, max_queue=100)
+        results = []
+        submitter = threading.Thread(
+            target=lambda: results.extend(exporter.submit("s", i, "a", "b", "auto", True) for i in range(5000))
+        )
+        submitter.start()
+        submitter.join(timeout=30)
+        finished = not submitter.is_alive()
+        sink.release.set()
+        exporter.close()
+        accepted = sum(results)
+
+        assert finished, "Submitting should finish while the sink is stuck; the game loop must not wait"
+        assert accepted <= 100 + 10 + 1, "Only the queue and one batch in hand should hold rows"
+        assert exporter.dropped == 5000 - accepted > 0, "Overflow should be dropped and counted"
+        assert exporter.written == accepted, "Accepted rows should all be written"
+
+    def test_flush_interval_and_flush(self):
+        """Test that partial batches go out on time and on flush"""
+        sink = BufferSink()
+        exporter = JourneyExporter(sink, batch_size=1000, flush_interval=0.05)
+        exporter.submit("s", 0, None, "start_game", "start", None)
+        deadline = time.monotonic() + 2
+        while not sink.rows and time.monotonic() < deadline:
+            time.sleep(0.01)
+        exporter.submit("s", 1, "start_game", "welcome", "start", True)
+        flushed = exporter.flush(timeout=2)
+
+        assert len(sink.rows) == 2 and flushed, "Both rows should be written without filling a batch"
+        exporter.close()
+        assert not any(t.name == "journey-exporter" and t.is_alive() for t in threading.enumerate()), \
+            "Writer thread should stop on close"
+
+    def test_flush_and_submit_after_close(self):
+        """Test that a closed exporter neither hangs on flush nor queues rows"""
+        sink = BufferSink()
+        exporter = JourneyExporter(sink)
+        exporter.submit("s", 0, None, "start_game", "start", None)
+        exporter.close()
+
+        assert exporter.flush(timeout=0) is True, "Flushing a closed exporter should succeed without waiting"
+        assert not exporter.submit("s", 1, "start_game", "welcome", "auto", None), "Late rows should be dropped"
+        assert (exporter.submitted, exporter.dropped, len(sink.rows)) == (1, 1, 1), "Late rows should be counted"
+
+    def test_counters_under_concurrent_submits(self):
+        """Test that rows from many threads are all accounted for"""
+        sink = _SlowSink()
+        exporter = JourneyExporter(sink, batch_size=50, max_queue=200)
+
+        def session(n):
+            for i in range(2000):
+                exporter.submit(f"s{n}", i, "a", "b", "auto", None)
+        threads = [threading.Thread(target=session, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        exporter.close()
+
+        assert exporter.submitted + exporter.dropped == 16_000, "Every submit should be counted once"
+        assert exporter.written == exporter.submitted == len(sink.rows), "Every accepted row should be written"
+
+    def test_close_races_submits(self):
+        """Test that no accepted row is lost when close runs during submits"""
+        sink = BufferSink()
+        exporter = JourneyExporter(sink, batch_size=50)
+        started = threading.Barrier(5)
+
+        def session(n):
+            started.wait()
+            for i in range(5000):
+                exporter.submit(f"s{n}", i, "a", "b", "auto", None)
+        threads = [threading.Thread(target=session, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        exporter.close()
+        for thread in threads:
+            thread.join()
+
+        assert exporter.submitted + exporter.dropped == 20_000, "Every submit should be counted once"
+        assert exporter.written == exporter.submitted == len(sink.rows), "Accepted rows should never be dropped"
+
+    def test_sink_errors_surface_on_close(self, tmp_path):
+        """Test that a failing sink is reported rather than blocking the game"""
+        sink = JsonlSink(tmp_path / 'journeys.jsonl')
+        sink.write_batch = lambda rows: 1 / 0
+        exporter = JourneyExporter(sink)
+        assert exporter.submit("s", 0, None, "start_game", "start", None), "Submit should still succeed"
+        with pytest.raises(ZeroDivisionError):
+            exporter.close()
+
+    def test_buffer_sink_is_bounded(self):
+        """Test that an in-memory buffer can keep only recent rows"""
+        sink = BufferSink(maxlen=100)
+        with JourneyExporter(sink, batch_size=64) as exporter:
+            for i in range(10_000):
+                exporter.submit("s", i, "a", "b", "auto", None)
+        assert len(sink.rows) == 100 and sink.rows[-1][1] == 9999, "Only the newest rows should be kept"
+
+    def test_parquet_row_groups(self, tmp_path):
+        """Test Parquet export in row groups"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / 'journeys.parquet'
+        with JourneyExporter(ParquetSink(path, row_group_size=100), batch_size=30) as exporter:
+            for i in range(250):
+                exporter.submit("s", i, "a", "b", "auto", i % 2 == 0)
+        parquet = pq.ParquetFile(path)
+
+        assert parquet.metadata.num_rows == 250, "Every row should be written"
+        assert parquet.num_row_groups == 3, "Rows should be grouped by row_group_size"
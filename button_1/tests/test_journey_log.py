@@ -0,0 +1,89 @@
+import sys
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.journey_log import JourneyLog
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.node_engine import NodeEngine
+
+
+LOOP = [('report_analytics', 'source_data'), ('source_data', 'transform_data'),
+        ('transform_data', 'analyse_data'), ('analyse_data', 'report_analytics')]
+
+
+def _log_loop(log, engine, times):
+    """Log the report -> source loop `times` times, as the game would"""
+    for _ in range(times):
+        for source, target in LOOP:
+            result = engine.resolve_transition(source, target)
+            log.append(source, target, result.edge_selector, result.combined_text, result.is_desired)
+
+
+class TestJourneyLog:
+    """Test suite for the edge id journey log"""
+
+    def test_entries_read_back_as_logged(self, story_dat, capsys):
+        """Test that a played journey reads back like the old list of dicts"""
+        game = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT'] * 500))
+        game.play_full_game()
+        capsys.readouterr()
+        engine = NodeEngine(story_dat)
+        expected = [{'from': None, 'to': 'start_game', 'edge_selector': 'start', 'outro_text': None, 'is_desired': None}]
+        for step in game.game_path[1:]:
+            result = engine.resolve_transition(step['from'], step['to'])
+            expected.append({'from': result.from_node, 'to': result.next_node, 'edge_selector': result.edge_selector,
+                             'outro_text': result.combined_text, 'is_desired': result.is_desired})
+
+        assert list(game.game_path) == expected, "Entries should resolve to the content's transition details"
+        assert game.game_path[-1] == expected[-1] and game.game_path[:2] == expected[:2], "Indexing and slicing"
+        assert game.game_path.nodes() == [e['to'] for e in expected], "nodes() should list the path"
+        assert len(game.game_path._side) == 1, "Only the start entry should need the side table"
+
+    def test_hand_logged_entries_are_verbatim(self, story_dat):
+        """Test that entries differing from content are kept exactly"""
+        log = JourneyLog(NodeEngine(story_dat))
+        log.append("node_a", "node_b", "auto", "Custom text", True)
+        log.append("welcome", "onboarding", "auto", "Edited outro", None)
+        log.append("welcome", "onboarding", "auto", "You proceed to onboarding.", True)
+
+        assert log[0] == {'from': "node_a", 'to': "node_b", 'edge_selector': "auto",
+                          'outro_text': "Custom text", 'is_desired': True}, "Unknown edges are stored verbatim"
+        assert log[1]['outro_text'] == "Edited outro", "Changed details should not be replaced by content"
+        assert log[-1]['outro_text'] == "You proceed to onboarding." and len(log._side) == 2, \
+            "Matching content edges should be stored as ids"
+        with pytest.raises(IndexError):
+            log[3]
+
+    def test_history_cap(self, story_dat):
+        """Test that a capped log keeps only recent entries"""
+        engine = NodeEngine(story_dat)
+        log = JourneyLog(engine, max_history=10)
+        log.append(None, 'report_analytics', 'start')
+        _log_loop(log, engine, 100)
+
+        assert len(log) == 10 and log.total == 401 and log.dropped == 391, "Only ten entries should be kept"
+        assert [e['from'] for e in log[-4:]] == [source for source, _ in LOOP], "The newest entries are kept"
+        assert len(log._ids) <= 20 and not log._side, "Dropped entries should be released"
+        with pytest.raises(ValueError):
+            JourneyLog(engine, max_history=0)
+
+    def test_capped_summary(self, story_dat):
+        """Test the summary of a game whose early history was dropped"""
+        game = ButtonGame(button_dat=story_dat, max_history=5)
+        _log_loop(game.game_path, game.engine, 3)
+        summary = game.render_game_summary(80)
+
+        assert "… 7 earlier steps not kept" in summary, "Dropped steps should be mentioned"
+        assert "\n10. Source Data → Transform Data" in summary, "Kept steps keep their step numbers"
+        assert "Total nodes visited: 13" in summary, "The total should include dropped steps"
+
+    def test_bytes_per_step(self, story_dat):
+        """Test that a long looping session costs a few bytes per step"""
+        engine = NodeEngine(story_dat)
+        log = JourneyLog(engine)
+        _log_loop(log, engine, 25_000)
+
+        assert log.itemsize == 2, "Small stories should use 2-byte slots"
+        assert sys.getsizeof(log._ids) / log.total < 3, "Memory per step should stay within a few bytes"
+        assert log[-1]["outro_text"] == "This step went as expected. You build dashboards that answer the question.", \
+            "Text is still resolved on demand"
@@ -0,0 +1,113 @@
+import random
+import time
+
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.journey_export import JourneyExporter, open_sink
+from button_1.classes.journey_queries import FunnelStage, JourneyQueries
+from button_1.classes.journey_store import SqliteSink
+from button_1.classes.key_input import ScriptedInput
+
+
+def _rows(session_id, nodes, desired=None):
+    """Build exported rows for a session visiting nodes in order"""
+    desired = desired or [True] * len(nodes)
+    rows, previous = [], None
+    for step, (node, is_desired) in enumerate(zip(nodes, desired)):
+        rows.append((session_id, step, previous, node, "auto", is_desired, 1000.0 + step))
+        previous = node
+    return rows
+
+
+class TestSqliteSink:
+    """Test suite for the SQLite journey sink"""
+
+    def test_exported_games_are_stored(self, story_dat, tmp_path):
+        """Test that games exported through a SqliteSink land in the database"""
+        path = tmp_path / "journeys.sqlite"
+        games = []
+        with JourneyExporter(open_sink(path)) as exporter:
+            for seed in range(5):
+                game = ButtonGame(button_dat=story_dat, rng=random.Random(seed), exporter=exporter,
+                                  key_input=ScriptedInput(['RIGHT'] * 500), renderer=FrameRenderer(MemorySink()),
+                                  session_id=f"s{seed}")
+                game.play_full_game()
+                games.append(game)
+
+        with JourneyQueries(path) as queries:
+            assert queries.session_count() == 5, "Every session should be stored"
+            funnel = queries.funnel(["start_game", "end"])
+            assert funnel[-1].sessions == 5, "Every scripted game should reach the end"
+            visits = queries._connection.execute("SELECT count(*) FROM transitions").fetchone()[0]
+        assert visits == sum(game.game_path.total for game in games), "Every transition should be stored"
+
+    def test_duplicate_rows_are_ignored(self, tmp_path):
+        """Test that re-exporting a session does not double count it"""
+        sink = SqliteSink(tmp_path / "journeys.db")
+        rows = _rows("a", ["start_game", "welcome", "onboarding"])
+        sink.write_batch(rows)
+        sink.write_batch(rows[1:] + _rows("b", ["start_game"]))
+        sink.close()
+
+        with JourneyQueries(tmp_path / "journeys.db") as queries:
+            sessions = dict(queries._connection.execute("SELECT session_id, transitions FROM sessions"))
+            last = queries._connection.execute("SELECT last_node FROM sessions WHERE session_id = 'a'").fetchone()
+        assert sessions == {"a": 3, "b": 1}, "Session counts should reflect stored rows only"
+        assert last == ("onboarding",), "The last node should be the latest step"
+
+    def test_insert_throughput(self, tmp_path):
+        """Test that batched inserts sustain tens of thousands of rows per second"""
+        sink = SqliteSink(tmp_path / "journeys.db")
+        nodes = ["source_data", "transform_data", "analyse_data", "report_analytics"] * 25
+        batches = [_rows(f"s{i}", nodes) for i in range(500)]
+
+        start = time.perf_counter()
+        for rows in batches:
+            sink.write_batch(rows)
+        elapsed = time.perf_counter() - start
+        sink.close()
+
+        rate = 500 * len(nodes) / elapsed
+        assert rate > 20_000, f"Expected over 20k transitions per second, got {rate:,.0f}"
+
+
+class TestJourneyQueries:
+    """Test suite for journey analytics queries"""
+
+    def test_funnel_loops_and_edges(self, tmp_path):
+        """Test funnels, loop counts and desired ratios on known sessions"""
+        sink = SqliteSink(tmp_path / "journeys.db")
+        sink.write_batch(
+            _rows("a", ["transform_data", "analyse_data", "report_analytics"])
+            + _rows("b", ["transform_data", "analyse_data", "transform_data", "analyse_data", "report_analytics"],
+                    [True, True, False, True, True])
+            + _rows("c", ["transform_data", "analyse_data", "transform_data"], [True, True, False])
+        )
+
+        with JourneyQueries(tmp_path / "journeys.db") as queries:
+            assert queries.funnel(["transform_data", "analyse_data", "report_analytics"]) == [
+                FunnelStage("transform_data", 3, 1.0),
+                FunnelStage("analyse_data", 3, 1.0),
+                FunnelStage("report_analytics", 2, 2 / 3),
+            ], "Funnel should count sessions reaching each stage in order"
+            assert queries.loop_counts() == {"transform_data": (2, 2), "analyse_data": (1, 1)}, \
+                "Loop counts should be repeat visits and the sessions repeating"
+            ratios = queries.edge_ratios()
+        sink.close()
+
+        assert ratios[("analyse_data", "transform_data")] == (0, 2, 0.0), "Bounces back should be undesired"
+        assert ratios[("analyse_data", "report_analytics")] == (2, 0, 1.0), "Reports should be desired"
+
+    def test_unknown_desired_flags(self, tmp_path):
+        """Test edges whose desired flag was exported as NULL"""
+        sink = SqliteSink(tmp_path / "journeys.db")
+        sink.write_batch(
+            _rows("a", ["start_game", "welcome", "onboarding"], [None, None, None])
+            + _rows("b", ["start_game", "welcome", "onboarding"], [None, None, False])
+        )
+        with JourneyQueries(tmp_path / "journeys.db") as queries:
+            ratios = queries.edge_ratios()
+        sink.close()
+
+        assert ratios[("start_game", "welcome")] == (0, 0, None), "Edges with no known flag should have no share"
+        assert ratios[("welcome", "onboarding")] == (0, 1, 0.0), "Unknown flags should not count either way"
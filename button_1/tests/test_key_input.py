@@ -0,0 +1,173 @@
+import os
+import termios
+import threading
+import time
+
+import pytest
+from button_1.classes import key_input
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.key_input import InputTimeout, KeyDecoder, ScriptedInput, TerminalInput
+from button_1.classes.node_engine import NodeEngine
+
+
+RIGHT = b"\x1b[C"
+
+
+@pytest.fixture
+def pipe():
+    """A readable file object and the write end of a pipe"""
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, 'rb', buffering=0)
+    yield reader, write_fd
+    reader.close()
+    try:
+        os.close(write_fd)
+    except OSError:
+        pass
+
+
+class TestKeyDecoder:
+    """Test suite for incremental key decoding"""
+
+    def test_sequences_split_across_reads(self):
+        """Test that partial escape sequences complete on the next feed"""
+        decoder = KeyDecoder()
+
+        assert decoder.feed(b"\x1b") == [] and decoder.pending, "A lone ESC should wait for more bytes"
+        assert decoder.feed(b"[") == [], "ESC [ should still wait"
+        assert decoder.feed(b"Cx\r\n\x1bOD") == ['RIGHT', None, 'ENTER', 'LEFT'], "Keys should decode in order"
+        assert decoder.feed(b"\x03q\xff") == ['QUIT', None, None], "Only Ctrl+C quits on a terminal"
+
+    def test_flush_abandons_pending_escape(self):
+        """Test that flushing turns a pending ESC into one unknown key"""
+        decoder = KeyDecoder()
+        decoder.feed(b"\x1b")
+
+        assert decoder.flush() == [None], "Abandoned ESC should become None"
+        assert decoder.flush() == [] and not decoder.pending, "Nothing should remain"
+
+
+class TestTerminalInput:
+    """Test suite for the buffered terminal backend"""
+
+    def test_typeahead_is_buffered(self, pipe):
+        """Test that a burst of keys is read in order without losses"""
+        reader, write_fd = pipe
+        os.write(write_fd, RIGHT * 200 + b"\r" + b"\x1b[A")
+        backend = TerminalInput(reader)
+
+        with backend:
+            keys = [backend.read_key() for _ in range(202)]
+
+        assert keys == ['RIGHT'] * 200 + ['ENTER', 'UP'], "Every buffered key should be returned"
+
+    def test_timeouts_and_lone_escape(self, pipe):
+        """Test idle timeouts and the lone ESC grace period"""
+        reader, write_fd = pipe
+        backend = TerminalInput(reader, escape_timeout=0.02)
+
+        with backend:
+            started = time.monotonic()
+            with pytest.raises(InputTimeout):
+                backend.read_key(timeout=0.05)
+            waited = time.monotonic() - started
+
+            os.write(write_fd, b"\x1b")
+            lone = backend.read_key(timeout=1)
+
+            os.write(write_fd, b"\x1b[")
+            threading.Timer(0.005, os.write, (write_fd, b"C")).start()
+            split = backend.read_key(timeout=1)
+
+        assert 0.04 < waited < 1, f"Timeout should be honoured, waited {waited:.3f}s"
+        assert lone is None, "A lone ESC should resolve to an unknown key"
+        assert split == 'RIGHT', "A sequence split within the grace period should still decode"
+
+    def test_interrupt_and_end_of_input(self, pipe):
+        """Test Ctrl+C and closed input"""
+        reader, write_fd = pipe
+        os.write(write_fd, b"\x03")
+        backend = TerminalInput(reader)
+
+        with pytest.raises(KeyboardInterrupt):
+            backend.read_key()
+        os.close(write_fd)
+        with pytest.raises(EOFError):
+            backend.read_key()
+
+    def test_raw_mode_entered_once_per_session(self, monkeypatch):
+        """Test that a session switches the tty mode once and restores it"""
+        master, slave = os.openpty()
+        stream = os.fdopen(slave, 'rb', buffering=0)
+        original = termios.tcgetattr(slave)
+        calls = []
+        tcsetattr = termios.tcsetattr
+        monkeypatch.setattr(key_input.termios, 'tcsetattr', lambda *args: calls.append(args) or tcsetattr(*args))
+        try:
+            os.write(master, RIGHT * 5)
+            backend = TerminalInput(stream)
+            with backend:
+                keys = [backend.read_key(timeout=1) for _ in range(5)]
+                raw = termios.tcgetattr(slave)
+            restored = termios.tcgetattr(slave)
+        finally:
+            stream.close()
+            os.close(master)
+
+        assert keys == ['RIGHT'] * 5, "Keys should be read through the pty"
+        assert len(calls) == 2, f"Mode should be set and restored once, not per key: {len(calls)} calls"
+        assert not raw[3] & (termios.ICANON | termios.ECHO), "Line mode and echo should be off in a session"
+        assert restored == original, "The original mode should be restored"
+
+    def test_single_node_enters_raw_mode_once(self, story_dat, monkeypatch):
+        """Test that waiting through ignored keys outside a game switches the mode once"""
+        master, slave = os.openpty()
+        stream = os.fdopen(slave, 'rb', buffering=0)
+        calls = []
+        tcsetattr = termios.tcsetattr
+        monkeypatch.setattr(key_input.termios, 'tcsetattr', lambda *args: calls.append(args) or tcsetattr(*args))
+        try:
+            os.write(master, b"\x1b[D" * 3 + b"x" + RIGHT)
+            engine = NodeEngine(story_dat, key_input=TerminalInput(stream), renderer=FrameRenderer(MemorySink()))
+            result = engine.run_single_node('welcome')
+        finally:
+            stream.close()
+            os.close(master)
+
+        assert result.next_node == 'onboarding' and result.user_input == 'RIGHT', "Right should advance the node"
+        assert len(calls) == 2, f"Mode should be set and restored once, not per key: {len(calls)} calls"
+
+
+class TestScriptedInput:
+    """Test suite for tty-free scripted input"""
+
+    def test_script_drives_a_full_game(self, story_dat, capsys):
+        """Test that a game runs to the end on scripted keys"""
+        script = ScriptedInput(['LEFT', None] + ['RIGHT'] * 200)
+        game = ButtonGame(button_dat=story_dat, key_input=script)
+        game.play_full_game()
+
+        assert game.game_path[-1]['to'] == 'end' and not game.game_running, "Game should reach the end"
+        assert "Thanks for playing!" in capsys.readouterr().out, "Summary should be shown"
+        assert script.reads == len(game.game_path) + 2, "Each step should read exactly the keys it needs"
+
+    def test_idle_timeout_ends_game(self, story_dat, capsys):
+        """Test that an idle player is timed out"""
+        game = ButtonGame(button_dat=story_dat, key_input=ScriptedInput(['RIGHT', 'RIGHT']), idle_timeout=5)
+        game.play_full_game()
+        output = capsys.readouterr().out
+
+        assert len(game.game_path) == 3 and not game.game_running, "Game should stop where the player went idle"
+        assert "No key pressed" in output and "Thanks for playing!" in output, "Timeout should be reported"
+
+    def test_from_bytes_and_exhaustion(self):
+        """Test decoding raw bytes and the end of a script"""
+        script = ScriptedInput.from_bytes(RIGHT + b"\r\x1b")
+
+        assert [script.read_key(), script.read_key(), script.read_key()] == ['RIGHT', 'ENTER', None], \
+            "Bytes should decode like the terminal backend"
+        with pytest.raises(EOFError):
+            script.read_key()
+        with pytest.raises(KeyboardInterrupt):
+            ScriptedInput(['QUIT']).read_key()
@@ -0,0 +1,123 @@
+import random
+import time
+
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.loop_analysis import analyse_loops
+from button_1.classes.node_view import compile_node_views
+from button_common.content_bundle import compile_content
+
+TEXT = [{'id_text': 'pbn', 'text': 'Press'}, {'id_text': 'edge_good', 'text': 'Good'},
+        {'id_text': 'edge_bad', 'text': 'Bad'}]
+
+
+def _button_dat(edges, selectors):
+    """ButtonDat over (source, target) edges and {node: selector} rows"""
+    return ButtonDat.from_content(compile_content(
+        [{'source': s, 'target': t, 'desired': 'TRUE'} for s, t in edges],
+        [{'node': name, 'edge_selector': selector} for name, selector in selectors.items()],
+        TEXT,
+    ))
+
+
+# a and b loop until b randomly picks end or c; c is an 'auto' node whose first edge is itself
+TRAP_EDGES = [("start_game", "a"), ("a", "b"), ("b", "a"), ("b", "end"), ("b", "c"), ("c", "c"), ("c", "end")]
+TRAP_SELECTORS = {"start_game": 'start', "a": 'auto', "b": 'random', "c": 'auto', "end": 'end'}
+
+
+def _game(button_dat, keys, **kwargs):
+    """Quiet game with scripted keys"""
+    return ButtonGame(button_dat=button_dat, rng=random.Random(1), key_input=ScriptedInput(keys),
+                      renderer=FrameRenderer(MemorySink()), **kwargs)
+
+
+class TestLoopAnalysis:
+    """Test suite for SCC loop analysis"""
+
+    def test_story_loops_can_end(self, story_dat):
+        """Test that the story's loops form one component with a way out"""
+        analysis = story_dat.loop_analysis
+        loops = [set(analysis.components[i]) for i in analysis.loops]
+
+        assert loops == [{'initiate_project', 'source_data', 'transform_data', 'analyse_data',
+                          'report_analytics', 'decision_maker'}], "The story's loops should share one component"
+        assert analysis.traps == () and analysis.can_end >= set(story_dat.get_all_nodes()) - {'summary'}, \
+            "Every played node should be able to reach an end"
+        assert story_dat.loop_analysis is analysis, "The analysis should be computed once per snapshot"
+
+    def test_traps_follow_the_effective_graph(self):
+        """Test that only edges the game can take count, so auto loops trap"""
+        button_dat = _button_dat(TRAP_EDGES, TRAP_SELECTORS)
+        analysis = button_dat.loop_analysis
+        traps = {analysis.components[i] for i in analysis.traps}
+
+        assert traps == {("c",)}, "c always takes its first edge, back to itself"
+        assert not analysis.is_trapped("b") and analysis.is_trapped("c"), "Random b can end, but c can never leave"
+        assert "loop c: sessions entering it can never reach an end" in button_dat.validate_data(), \
+            "Traps should be reported by validate_data"
+
+    def test_deep_graph_does_not_recurse(self):
+        """Test that a long chain and a long cycle are handled iteratively"""
+        names = [f"n{i}" for i in range(20_000)]
+        edges = list(zip(names, names[1:] + names[:1]))
+        views = compile_node_views(compile_content(
+            [{'source': s, 'target': t} for s, t in edges],
+            [{'node': name, 'edge_selector': 'auto'} for name in names], TEXT,
+        ))
+        analysis = analyse_loops(views)
+        assert len(analysis.components) == 1 and analysis.traps == (0,), "One cycle with no way out"
+
+
+class TestSessionBudget:
+    """Test suite for ButtonGame's runaway-session guards"""
+
+    def test_trapped_session_ends(self):
+        """Test that entering a loop with no way out ends the game"""
+        button_dat = _button_dat(TRAP_EDGES, TRAP_SELECTORS)
+        games = []
+        for seed in range(20):
+            game = ButtonGame(button_dat=button_dat, rng=random.Random(seed), key_input=ScriptedInput(['RIGHT'] * 1000),
+                              renderer=FrameRenderer(MemorySink()))
+            game.play_full_game()
+            games.append(game)
+        trapped = [game for game in games if game.end_reason == 'trapped']
+
+        assert {game.end_reason for game in games} == {'end', 'trapped'}, "Sessions should either end or be stopped"
+        assert all(game.state.node == "c" and game.state.steps < 100 for game in trapped), \
+            "Trapped sessions should stop on entering c"
+        assert "never ends" in trapped[0].engine.renderer.sink.getvalue(), "The player should be told why"
+
+    def test_step_budget(self, story_dat):
+        """Test that a step budget ends a long session cleanly"""
+        game = _game(story_dat, ['RIGHT'] * 1000, max_steps=5)
+        game.play_full_game()
+
+        assert game.end_reason == 'step_budget' and game.state.steps == 5, "Play should stop after 5 steps"
+        assert game.engine.renderer.sink.getvalue().endswith("Thanks for playing!\n"), "The summary should follow"
+
+    def test_time_budget_bounds_waiting(self, story_dat):
+        """Test that a time budget also ends a session waiting for input"""
+        class SlowInput(ScriptedInput):
+            def read_key(self, timeout=None):
+                time.sleep(min(timeout, 0.05))
+                return super().read_key(timeout)
+
+        game = ButtonGame(button_dat=story_dat, key_input=SlowInput(['RIGHT'] * 1000),
+                          renderer=FrameRenderer(MemorySink()), max_seconds=0.2)
+        started = time.monotonic()
+        game.play_full_game()
+
+        assert game.end_reason == 'time_budget', "The session should run out of time"
+        assert time.monotonic() - started < 1.0, "The budget should be enforced promptly"
+
+    def test_normal_and_idle_endings(self, story_dat):
+        """Test the end reasons of a finished and an idle session"""
+        finished = _game(story_dat, ['RIGHT'] * 1000)
+        finished.play_full_game()
+        idle = _game(story_dat, ['RIGHT'] * 2, idle_timeout=1)
+        idle.play_full_game()
+
+        assert finished.end_reason == 'end', "A completed game should end normally"
+        assert idle.end_reason == 'idle_timeout', "An exhausted script should look idle"
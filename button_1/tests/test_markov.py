@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from button_1.classes import markov as markov_module
+from button_1.classes.graph_arrays import compile_graph_arrays
+from button_1.classes.markov import MarkovAnalysis
+from button_1.classes.simulator import simulate
+from button_1.classes.story_graph import StoryGraph
+from button_common.content_bundle import compile_content
+
+
+def _graph(edges, selectors):
+    """Compile a small graph from (source, target) rows and node selectors"""
+    return compile_graph_arrays(compile_content(
+        [{'source': s, 'target': t} for s, t in edges],
+        [{'node': name, 'edge_selector': selector} for name, selector in selectors.items()],
+        [{'id_text': 'pbn', 'text': 'Press a button now'}],
+    ))
+
+
+RETRY = _graph(
+    [('start_game', 'try'), ('try', 'win'), ('try', 'lose'), ('try', 'start_game')],
+    {'start_game': 'start', 'try': 'random', 'win': 'end', 'lose': 'end'}
+)
+
+
+class TestMarkovAnalysis:
+    """Test suite for exact absorbing Markov chain analysis"""
+
+    def test_retry_loop_closed_form(self):
+        """Test a loop whose answers are known in closed form"""
+        analysis = MarkovAnalysis(RETRY)
+
+        # Each attempt is two steps and ends with probability 2/3
+        assert analysis.expected_steps() == pytest.approx(3.0), "Expected steps should be 2 / (2/3)"
+        assert analysis.absorption_probabilities() == pytest.approx({'win': 0.5, 'lose': 0.5}), "Both endings equally likely"
+        assert analysis.expected_visits()['try'] == pytest.approx(1.5), "try is visited 1 / (2/3) times"
+        assert analysis.finish_within(1) == 0.0, "No game ends after one step"
+        assert analysis.finish_within(2) == pytest.approx(2 / 3), "Two thirds end on the first attempt"
+        assert analysis.finish_within(4) == pytest.approx(1 - 1 / 9), "Only a double retry is still playing"
+
+    def test_fundamental_matrix(self):
+        """Test N = (I - Q)^-1 on the retry loop"""
+        N = MarkovAnalysis(RETRY).fundamental_matrix()
+        assert np.allclose(N, [[1.5, 1.5], [0.5, 1.5]]), "Fundamental matrix should match the hand calculation"
+
+    def test_sparse_and_block_solvers_agree(self, story_dat):
+        """Test that both solvers give the same answers"""
+        blocks = MarkovAnalysis(story_dat.graph_arrays)
+        sparse = MarkovAnalysis(story_dat.graph_arrays, sparse_threshold=0)
+
+        assert sparse.is_sparse and not blocks.is_sparse, "Threshold should pick the solver"
+        assert sparse.expected_steps() == pytest.approx(blocks.expected_steps()), "Expected steps should agree"
+        assert sparse.expected_visits() == pytest.approx(blocks.expected_visits()), "Expected visits should agree"
+
+    def test_block_solver_without_scipy(self, story_dat, monkeypatch):
+        """Test that the analysis works when SciPy is unavailable"""
+        monkeypatch.setattr(markov_module, 'sparse', None)
+        analysis = MarkovAnalysis(story_dat.graph_arrays, sparse_threshold=0)
+        assert not analysis.is_sparse, "The block solver should be used without SciPy"
+        assert analysis.absorption_probabilities() == pytest.approx({'end': 1.0}), "Story always ends at end"
+        assert analysis.expected_steps() == pytest.approx(31.0), "Story has a known expected length"
+
+    def test_large_loop_is_iterated(self, monkeypatch):
+        """Test that loops above the dense limit are solved by iteration"""
+        dense = MarkovAnalysis(RETRY).steps_to_finish()
+        monkeypatch.setattr(markov_module, 'DENSE_BLOCK_LIMIT', 1)
+        analysis = MarkovAnalysis(RETRY)
+
+        assert np.allclose(analysis.steps_to_finish(), dense), "Iteration should match the dense solve"
+        assert np.allclose(analysis.fundamental_matrix(), [[1.5, 1.5], [0.5, 1.5]]), "Transpose solves iterate too"
+
+    def test_large_chain_without_scipy(self, monkeypatch):
+        """Test that a 50k-node story needs neither SciPy nor a dense matrix"""
+        monkeypatch.setattr(markov_module, 'sparse', None)
+        names = ['start_game'] + [f'n{i}' for i in range(1, 49_999)] + ['end']
+        selectors = dict.fromkeys(names, 'auto')
+        selectors['start_game'], selectors['end'] = 'start', 'end'
+        analysis = MarkovAnalysis(_graph(list(zip(names, names[1:])), selectors))
+
+        assert analysis.expected_steps() == pytest.approx(49_999), "The chain's length should be exact"
+        assert analysis.absorption_probabilities() == pytest.approx({'end': 1.0}), "Every game ends at end"
+
+    def test_matches_simulation(self, story_dat):
+        """Test exact answers against a large simulated batch"""
+        analysis = MarkovAnalysis(story_dat.graph_arrays)
+        result = simulate(story_dat.graph_arrays, 200_000, seed=2)
+        visits = analysis.expected_visits()
+
+        assert result.path_lengths.mean() == pytest.approx(analysis.expected_steps(), rel=0.02), "Mean length"
+        assert result.visit_counts[story_dat.graph_arrays.index_of('source_data')] / 200_000 == pytest.approx(
+            visits['source_data'], rel=0.02), "source_data visits"
+        assert (result.path_lengths <= 25).mean() == pytest.approx(analysis.finish_within(25), abs=0.01), "Finish curve"
+
+    def test_endless_loop_is_reported(self):
+        """Test that loops with no way out are detected rather than mis-solved"""
+        graph = _graph(
+            [('start_game', 'fork'), ('fork', 'done'), ('fork', 'spin'), ('spin', 'spin_more'), ('spin_more', 'spin')],
+            {'start_game': 'start', 'fork': 'random', 'spin': 'auto', 'spin_more': 'auto', 'done': 'end'}
+        )
+        analysis = MarkovAnalysis(graph)
+
+        assert sorted(graph.node_names[i] for i in analysis.trapped) == ['spin', 'spin_more'], "Closed loop is trapped"
+        assert analysis.absorption_probabilities() == pytest.approx({'done': 0.5}), "Half of all games never end"
+        with pytest.raises(ValueError, match="no path to an end"):
+            analysis.expected_steps()
+
+
+class TestStoryGraphMarkov:
+    """Test suite for the StoryGraph analysis API"""
+
+    def test_path_stats(self, story_dat, capsys):
+        """Test that StoryGraph exposes the exact statistics"""
+        graph = StoryGraph(story_dat)
+        stats = graph.get_path_stats(horizons=(8, 9, 1000))
+        output = capsys.readouterr().out
+
+        assert graph.markov is graph.markov, "Analysis should be built once"
+        assert stats['expected_steps'] == pytest.approx(31.0), "Story has a known expected length"
+        assert stats['absorption'] == pytest.approx({'end': 1.0}), "Every game ends at end"
+        assert stats['finish_within'][8] == 0.0, "The shortest playthrough takes nine steps"
+        assert stats['finish_within'][9] == pytest.approx(1 / 8), "Three lucky random draws finish in nine"
+        assert stats['finish_within'][1000] == pytest.approx(1.0), "Practically every game ends within 1000 steps"
+        assert "Expected steps from start_game: 31.00" in output, "Summary should be printed"
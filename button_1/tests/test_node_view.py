@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import time
+
+import pytest
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.node_view import NodeView, compile_node_views
+from button_common.content_bundle import compile_csv_dir
+
+
+class TestNodeView:
+    """Test suite for precompiled node and edge views"""
+
+    def test_views_hold_node_and_edge_facts(self, story_dat):
+        """Test that views carry everything a step needs"""
+        view = story_dat.node_views['report_analytics']
+
+        assert view.edge_selector == 'random', "Selector should be compiled in"
+        assert view.title_text == "Report your findings", "Title should be compiled in"
+        assert view.event_text is None, "Blank text should be None"
+        assert view.successors == ('decision_maker', 'source_data'), "Successors should keep edge order"
+        assert view.edge_by_target['source_data'].desired is False, "Edge desired flag should be compiled in"
+        assert view.edge_by_target['decision_maker'].outro_text == "You present your findings with flair.", "Outro should be compiled in"
+
+    def test_views_use_slots(self, story_dat):
+        """Test that views are compact slot records"""
+        view = story_dat.node_views['start_game']
+        assert not hasattr(view, '__dict__'), "NodeView should not carry an instance dict"
+        assert not hasattr(view.edges[0], '__dict__'), "EdgeView should not carry an instance dict"
+
+    def test_views_built_once_per_snapshot(self, story_dat):
+        """Test that engines share the snapshot's views"""
+        first = NodeEngine(story_dat)
+        second = NodeEngine(story_dat, developer_mode=True)
+        assert first.views is second.views, "Views should be compiled once and shared"
+
+    def test_engine_answers_from_views(self, story_dat):
+        """Test engine lookups including unknown nodes"""
+        engine = NodeEngine(story_dat)
+
+        assert engine.get_node_column_text('welcome', 'title_text') == "Welcome!", "Title lookup"
+        assert engine.get_edge_outro_text('end', 'summary') is None, "Blank outro should be None"
+        assert engine.get_edge_desired_status('analyse_data', 'transform_data') is False, "Desired lookup"
+        assert engine.get_edge_selector('nonexistent_node') == 'auto', "Unknown nodes default to auto"
+        assert engine.determine_next_node('nonexistent_node') is None, "Unknown nodes have no successors"
+        assert engine.determine_next_node('end') is None, "End nodes do not progress"
+        assert engine.determine_next_node('welcome') == 'onboarding', "Auto nodes take the first edge"
+
+    def test_step_overhead_is_microseconds(self, story_dat):
+        """Test that per-step engine lookups stay in the microsecond range"""
+        engine = NodeEngine(story_dat)
+        nodes = list(story_dat.node_views)
+        steps = 5000
+        started = time.perf_counter()
+        for i in range(steps):
+            node = nodes[i % len(nodes)]
+            next_node = engine.determine_next_node(node)
+            engine.get_node_column_text(node, 'intro_text')
+            engine.get_edge_selector(node)
+            if next_node:
+                engine.get_combined_outro_text(node, next_node)
+                engine.get_edge_desired_status(node, next_node)
+        per_step = (time.perf_counter() - started) / steps
+
+        assert per_step < 50e-6, f"Engine step overhead was {per_step * 1e6:.1f}µs"
+
+    def test_engine_runs_without_pandas(self, story_dir, tmp_path):
+        """Test that stepping the engine never imports pandas"""
+        path = tmp_path / 'content.bundle'
+        compile_csv_dir(story_dir).write(path)
+        script = (
+            "import sys\n"
+            "from button_1.classes.button_dat import ButtonDat\n"
+            "from button_1.classes.node_engine import NodeEngine\n"
+            f"engine = NodeEngine(ButtonDat.from_bundle({str(path)!r}))\n"
+            "node = 'start_game'\n"
+            "while node:\n"
+            "    nxt = engine.determine_next_node(node)\n"
+            "    nxt and engine.get_combined_outro_text(node, nxt)\n"
+            "    node = nxt\n"
+            "assert 'pandas' not in sys.modules, 'pandas was imported'\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
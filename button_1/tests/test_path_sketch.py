@@ -0,0 +1,120 @@
+from collections import Counter
+import random
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.journey_export import JourneyExporter
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.path_sketch import TRUNCATED, CountMinSketch, PathSketch, SpaceSaving
+from button_1.classes.simulator import simulate
+
+
+def _zipf_stream(n, keys, seed=0):
+    """Skewed stream of integer keys, key k drawn with weight 1/(k+1)"""
+    rng = random.Random(seed)
+    return rng.choices(range(keys), weights=[1 / (k + 1) for k in range(keys)], k=n)
+
+
+class TestSpaceSaving:
+    """Test suite for the Space-Saving top-k counter"""
+
+    def test_bounds_hold_on_skewed_stream(self):
+        """Test that counts bracket the truth and heavy keys are found"""
+        stream = _zipf_stream(20_000, 2_000)
+        truth = Counter(stream)
+        summary = SpaceSaving(capacity=100)
+        for key in stream:
+            summary.add(key)
+
+        assert len(summary) == 100 and summary.total == len(stream), "Memory should stay at capacity"
+        for hitter in summary.top():
+            assert hitter.lower_bound <= truth[hitter.key] <= hitter.count, f"Bounds should hold for {hitter.key}"
+            assert hitter.error <= summary.error_bound, "Errors should stay within N / capacity"
+        assert [h.key for h in summary.top(5)] == [k for k, _ in truth.most_common(5)], \
+            "The heaviest keys should be reported in order"
+
+    def test_capacity_must_be_positive(self):
+        """Test that an empty summary is rejected"""
+        with pytest.raises(ValueError):
+            SpaceSaving(0)
+
+
+class TestCountMinSketch:
+    """Test suite for Count-Min frequency estimates"""
+
+    def test_estimates_never_undercount(self):
+        """Test that estimates are upper bounds within the error bound"""
+        stream = [(str(k),) for k in _zipf_stream(20_000, 5_000, seed=1)]
+        truth = Counter(stream)
+        sketch = CountMinSketch(width=1024, depth=4)
+        for key in stream:
+            sketch.add(key)
+
+        over = [sketch.estimate(key) - count for key, count in truth.items()]
+        assert min(over) >= 0, "Count-Min should never undercount"
+        within = sum(error <= sketch.error_bound for error in over) / len(over)
+        assert within >= 1 - sketch.delta, f"Only {within:.3f} of keys were within the bound"
+
+
+class TestPathSketch:
+    """Test suite for journey, n-gram and loop summaries"""
+
+    def test_journeys_loops_and_ngrams(self):
+        """Test counts on a small known stream"""
+        sketch = PathSketch(n=2, end_nodes={"end"})
+        for _ in range(3):
+            sketch.add_journey(["start", "a", "b", "end"])
+        sketch.add_journey(["start", "a", "b", "a", "b", "end"])
+
+        assert [(h.key, h.count) for h in sketch.top_journeys()] == [
+            (("start", "a", "b", "end"), 3), (("start", "a", "b", "a", "b", "end"), 1)
+        ], "Journeys should be counted exactly while under capacity"
+        assert [(h.key, h.count) for h in sketch.top_loops()] == [(("a", "b", "a"), 1), (("b", "a", "b"), 1)], \
+            "Revisits should be recorded as closed cycles"
+        assert sketch.top_ngrams(1)[0].key == ("a", "b") and sketch.estimate(["a", "b"]) >= 5, \
+            "The commonest 2-gram should be a -> b"
+        assert sketch.open_sessions == 0, "Finished journeys should not stay open"
+
+    def test_long_journeys_are_truncated(self):
+        """Test that per-session memory is bounded by max_path"""
+        sketch = PathSketch(max_path=4)
+        sketch.add_journey(["s"] + ["x", "y"] * 50)
+        (hitter,) = sketch.top_journeys()
+        assert hitter.key == ("s", "x", "y", "x", TRUNCATED), "Journeys should be cut at max_path"
+
+    def test_open_sessions_are_capped(self):
+        """Test that abandoned sessions are evicted oldest first"""
+        sketch = PathSketch(max_open=2)
+        for session in range(5):
+            sketch.add(session, None, "start")
+        assert sketch.open_sessions == 2 and sketch.abandoned == 3, "Open sessions should stay at max_open"
+
+    def test_game_exports_feed_the_sketch(self, story_dat):
+        """Test that a PathSketch works as a JourneyExporter sink"""
+        sketch = PathSketch.for_graph(story_dat.graph_arrays, max_path=1000)
+        paths = Counter()
+        with JourneyExporter(sketch) as exporter:
+            for seed in range(10):
+                game = ButtonGame(button_dat=story_dat, rng=random.Random(seed), exporter=exporter,
+                                  key_input=ScriptedInput(['RIGHT'] * 500), renderer=FrameRenderer(MemorySink()))
+                game.play_full_game()
+                paths[tuple(game.game_path.nodes())] += 1
+
+        assert sketch.open_sessions == 0, "Games end at an absorbing node, closing their journeys"
+        assert {h.key: h.count for h in sketch.top_journeys(100)} == dict(paths), \
+            "Exported journeys should be counted exactly while under capacity"
+        assert "Journeys (total 10" in sketch.report(), "The report should state totals and bounds"
+
+    def test_simulator_feeds_the_sketch(self, story_dat):
+        """Test that simulate() reports its journeys to a sketch"""
+        graph = story_dat.graph_arrays
+        sketch = PathSketch.for_graph(graph, capacity=64)
+        result = simulate(graph, 500, seed=3, sketch=sketch)
+
+        assert sketch.journeys.total == 500 and sketch.open_sessions == 0, "Every session should be counted"
+        lengths = Counter(result.path_lengths.tolist())
+        top = sketch.top_journeys(1)[0]
+        assert top.lower_bound <= lengths[len(top.key) - 1], \
+            "The commonest journey cannot occur more often than sessions of its length"
+        assert any(h.key[0] == h.key[-1] for h in sketch.top_loops()), "The story's loops should be found"
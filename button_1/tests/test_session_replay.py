@@ -0,0 +1,113 @@
+import itertools
+import time
+
+import pytest
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.key_input import ScriptedInput, TerminalInput
+from button_1.classes.session_replay import (
+    SessionRecorder, SessionRecording, SessionReplayer, load_recordings
+)
+from button_common.content_bundle import compile_csv_dir
+
+
+@pytest.fixture
+def keyboard():
+    """Scripted player who fumbles keys, one key backend per session"""
+    return lambda: ScriptedInput(itertools.cycle(['UP', 'RIGHT', 'RIGHT', None, 'ENTER']))
+
+
+def _record(story_dat, path, seeds, keyboard, **kwargs):
+    """Play and record one quiet session per seed"""
+    recorder = SessionRecorder(path)
+    recordings = []
+    for seed in seeds:
+        game = recorder.new_game(button_dat=story_dat, seed=seed, key_input=keyboard(),
+                                 renderer=FrameRenderer(MemorySink()), **kwargs)
+        game.play_full_game()
+        recordings.append(recorder.finish(game))
+    return recordings
+
+
+class TestSessionReplay:
+    """Test suite for session recording and headless replay"""
+
+    def test_recording_round_trips(self, story_dat, keyboard, tmp_path):
+        """Test that recordings are written compactly and read back intact"""
+        path = tmp_path / 'sessions.jsonl'
+        recorded = _record(story_dat, path, [1, 2, 3], keyboard)
+        loaded = load_recordings(path)
+
+        assert loaded == recorded, "Recordings should survive a round trip"
+        assert len(path.read_text().splitlines()) == 3, "One line per session"
+        assert loaded[0].path[0] == 'start_game' and loaded[0].path[-1] == 'end', "Path should span the game"
+        assert set(loaded[0].keys) <= set('RUE.'), "Keys should be stored as single characters"
+        assert loaded[0].content_hash == story_dat.content.content_hash, "Content hash should be recorded"
+
+    def test_replay_reproduces_sessions(self, story_dat, keyboard, tmp_path, capsys, monkeypatch):
+        """Test that replays match and never read the terminal"""
+        recordings = _record(story_dat, tmp_path / 'sessions.jsonl', range(20), keyboard)
+        monkeypatch.setattr(TerminalInput, 'read_key', lambda self, timeout=None: pytest.fail("terminal was read"))
+
+        results = SessionReplayer(story_dat).replay_all(recordings)
+
+        assert all(result.ok for result in results), "Every session should replay identically"
+        assert capsys.readouterr().out == "", "Replays should not print to the console"
+        assert len({r.path for r in results}) > 1, "Different seeds should take different routes"
+
+    def test_content_change_is_detected(self, story_dat, story_dir, keyboard, tmp_path):
+        """Test that an edited outro fails the replay and is flagged"""
+        recordings = _record(story_dat, tmp_path / 'sessions.jsonl', [4], keyboard)
+        edges = story_dir / 'edges.csv'
+        edges.write_text(edges.read_text().replace("You proceed to onboarding.", "You proceed reluctantly."))
+        edited = ButtonDat.from_content(compile_csv_dir(story_dir))
+
+        result = SessionReplayer(edited).replay(recordings[0])
+
+        assert not result.ok, "Changed transcript text should fail the replay"
+        assert result.content_changed, "The content hash change should be reported"
+        assert result.path == recordings[0].path, "The route itself is unchanged"
+
+    def test_divergence_and_missing_keys(self, story_dat, keyboard, tmp_path):
+        """Test reporting for tampered recordings"""
+        recording = _record(story_dat, tmp_path / 'sessions.jsonl', [5], keyboard)[0]
+        replayer = SessionReplayer(story_dat)
+
+        truncated = replayer.replay(SessionRecording(
+            recording.seed, recording.keys[:3], recording.content_hash, recording.path, recording.digest
+        ))
+        reseeded = replayer.replay(SessionRecording(
+            recording.seed + 1000, recording.keys, recording.content_hash, recording.path, recording.digest
+        ))
+
+        assert not truncated.ok and "more keys" in truncated.error, "Running out of keys should be reported"
+        if reseeded.path != recording.path:
+            assert not reseeded.ok and reseeded.diverged_at >= 7, "Routes only split after the first random node"
+
+    def test_cut_short_sessions_replay(self, story_dat, tmp_path):
+        """Test that sessions ended by an idle timeout or time budget replay to the same point"""
+        class SlowKeys(ScriptedInput):
+            def read_key(self, timeout=None):
+                time.sleep(0.05)
+                return super().read_key(timeout)
+
+        idle = _record(story_dat, tmp_path / 'idle.jsonl', [6], lambda: ScriptedInput(['RIGHT'] * 6),
+                       idle_timeout=5)[0]
+        budget = _record(story_dat, tmp_path / 'budget.jsonl', [7], lambda: SlowKeys(['RIGHT'] * 500),
+                         max_seconds=0.3)[0]
+        results = SessionReplayer(story_dat).replay_all([idle, budget])
+
+        assert (idle.end_reason, budget.end_reason) == ('idle_timeout', 'time_budget'), "End reasons should be recorded"
+        assert len(idle.path) == 7 and 1 < len(budget.path) < 30, "Both sessions should stop mid-story"
+        assert all(result.ok for result in results), "Cut-short sessions should replay identically"
+
+    def test_thousand_replays_in_seconds(self, story_dat, keyboard, tmp_path):
+        """Test replay throughput"""
+        recordings = _record(story_dat, tmp_path / 'sessions.jsonl', range(50), keyboard) * 20
+        replayer = SessionReplayer(story_dat)
+        started = time.perf_counter()
+        results = replayer.replay_all(recordings)
+        elapsed = time.perf_counter() - started
+
+        assert all(result.ok for result in results), "All replays should match"
+        assert elapsed < 20, f"1000 replays took {elapsed:.1f}s"
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.frame_renderer import FrameRenderer, MemorySink
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.session_snapshot import SnapshotError, SnapshotStore, restore_game, snapshot_game
+from button_common.content_bundle import compile_csv_dir
+
+
+def _game(story_dat, keys, seed=7, **kwargs):
+    """Build a quiet game with a fixed seed and scripted keys"""
+    return ButtonGame(button_dat=story_dat, rng=random.Random(seed), key_input=ScriptedInput(keys),
+                      renderer=FrameRenderer(MemorySink()), **kwargs)
+
+
+class TestSessionSnapshot:
+    """Test suite for binary session snapshots"""
+
+    def test_resume_matches_uninterrupted_game(self, story_dat):
+        """Test that a game parked mid-session finishes on the same path"""
+        full = _game(story_dat, ['RIGHT'] * 500)
+        full.play_full_game()
+
+        paused = _game(story_dat, ['RIGHT'] * 8, idle_timeout=1)
+        paused.play_full_game()
+        assert not paused.game_running and paused.state.node, "The idle timeout should stop the game mid-story"
+
+        data = snapshot_game(paused)
+        resumed = restore_game(data, story_dat, key_input=ScriptedInput(['RIGHT'] * 500),
+                               renderer=FrameRenderer(MemorySink()))
+        assert resumed.game_running and resumed.session_id == paused.session_id, "Restored game should be live"
+        assert list(resumed.game_path) == list(paused.game_path), "Journey should survive the round trip"
+        resumed.play_full_game()
+
+        assert resumed.game_path.nodes() == full.game_path.nodes(), "Resumed path should match the full game"
+        assert resumed.state.steps == full.state.steps, "Step count should carry over"
+
+    def test_snapshot_is_compact(self, story_dat):
+        """Test that snapshots are small"""
+        game = _game(story_dat, ['RIGHT'] * 6, idle_timeout=1)
+        game.play_full_game()
+        data = snapshot_game(game)
+
+        assert len(data) < 200, f"Snapshot should be a few hundred bytes at most, got {len(data)}"
+        restored = restore_game(data, story_dat).state
+        assert (restored.node, restored.rng, restored.steps) == (game.state.node, game.state.rng, game.state.steps), \
+            "The snapshot should restore"
+
+    def test_capped_journey_and_unstarted_game(self, story_dat):
+        """Test capped journeys and games that were never played"""
+        game = _game(story_dat, ['RIGHT'] * 500, max_history=3)
+        game.play_full_game()
+        resumed = restore_game(snapshot_game(game), story_dat, max_history=3)
+        assert resumed.game_path.dropped == game.game_path.dropped, "Dropped count should survive"
+        assert list(resumed.game_path) == list(game.game_path), "Kept entries should survive"
+        assert not resumed.game_running, "A finished game should restore as finished"
+
+        fresh = _game(story_dat, [])
+        restored = restore_game(snapshot_game(fresh), story_dat)
+        assert restored.state.node == "start_game" and restored.seed == fresh.seed, \
+            "An unstarted game should restore at the start with its seed"
+        assert restored.engine.rng_state == fresh.engine.rng_state, "The engine should draw the same random stream"
+
+    def test_bad_snapshots_are_rejected(self, story_dat, story_dir):
+        """Test that corrupt, foreign or other-content snapshots raise SnapshotError"""
+        data = snapshot_game(_game(story_dat, []))
+        corrupt = data[:-1] + bytes([data[-1] ^ 0xFF])
+
+        with pytest.raises(SnapshotError, match="checksum"):
+            restore_game(corrupt, story_dat)
+        with pytest.raises(SnapshotError, match="magic"):
+            restore_game(b"XXXX" + data[4:], story_dat)
+        with pytest.raises(SnapshotError, match="truncated"):
+            restore_game(data[:10], story_dat)
+        edges = story_dir / "edges.csv"
+        edges.write_text(edges.read_text(encoding='utf-8').replace("There is no cake.", "Cake!"), encoding='utf-8')
+        other = ButtonDat.from_content(compile_csv_dir(story_dir))
+        with pytest.raises(SnapshotError, match="different game content"):
+            restore_game(data, other)
+
+
+class TestSnapshotStore:
+    """Test suite for parking sessions on disk"""
+
+    def test_park_and_rehydrate(self, story_dat, tmp_path):
+        """Test that a parked session comes back and its file is removed"""
+        store = SnapshotStore(tmp_path / "parked")
+        game = _game(story_dat, ['RIGHT'] * 4, idle_timeout=1)
+        game.play_full_game()
+
+        path = store.park(game)
+        assert game.session_id in store and path.exists(), "Parked session should be on disk"
+
+        resumed = store.rehydrate(game.session_id, story_dat)
+        assert (resumed.state.node, resumed.state.rng, resumed.state.steps) == \
+            (game.state.node, game.state.rng, game.state.steps), "Rehydrated state should match the parked game"
+        assert game.session_id not in store, "Rehydrating should discard the file by default"
+        with pytest.raises(KeyError):
+            store.rehydrate(game.session_id, story_dat)
+
+    def test_session_ids_stay_inside_the_store(self, story_dat, tmp_path):
+        """Test that ids which are not plain names are refused"""
+        store = SnapshotStore(tmp_path / "parked")
+        game = _game(story_dat, [], session_id="../../escaped")
+
+        for session_id in ("../../escaped", "a/b", "", "x.bsnp", None):
+            with pytest.raises(ValueError, match="Invalid session id"):
+                store.rehydrate(session_id, story_dat)
+            assert session_id not in store, "Invalid ids should never be found"
+        with pytest.raises(ValueError, match="Invalid session id"):
+            store.park(game)
+        assert not list(tmp_path.rglob("*.bsnp")), "Nothing should be written for a refused id"
@@ -0,0 +1,87 @@
+import json
+import time
+
+import pytest
+from button_1.classes.button_df import ButtonDf
+from button_common.sheet_cache import SheetCache
+
+
+class TestSheetCache:
+    """Test suite for the on-disk sheet cache"""
+
+    def test_warm_start_skips_network(self, sheet_server, tmp_path):
+        """Test that a fresh cache entry is served without any request"""
+        cache = SheetCache(tmp_path / 'warm', ttl=3600)
+        url = sheet_server.urls()['edges']
+
+        cold = ButtonDf('edges', data_url=url, cache=cache)
+        hits_after_cold = len(sheet_server.hits)
+        warm = ButtonDf('edges', data_url=url, cache=cache)
+
+        assert hits_after_cold == 1, "Cold start should download once"
+        assert len(sheet_server.hits) == 1, "Warm start should not touch the network"
+        assert warm.df.equals(cold.df), "Cached data should match the download"
+
+    def test_bodies_are_content_addressed(self, sheet_server, tmp_path):
+        """Test that identical bodies are stored once"""
+        cache = SheetCache(tmp_path / 'cas')
+        url = sheet_server.urls()['text']
+        cache.get('first', url)
+        cache.get('second', url)
+
+        objects = list((tmp_path / 'cas' / 'objects').iterdir())
+        assert len(objects) == 1, "Identical content should share one object"
+
+    def test_stale_entry_served_then_revalidated(self, sheet_server, tmp_path):
+        """Test stale-while-revalidate with a conditional request"""
+        cache = SheetCache(tmp_path / 'swr', ttl=0)
+        url = sheet_server.urls()['nodes']
+        first = cache.get('nodes', url)
+
+        sheet_server.tabs['nodes'] = first + "extra,auto,Extra,,,\n"
+        stale = cache.get('nodes', url)
+        cache.wait()
+        refreshed = cache.get('nodes', url)
+        cache.wait()
+
+        assert stale == first, "Stale content should be returned immediately"
+        assert "extra,auto" in refreshed, "Background refresh should pick up the new content"
+
+    def test_not_modified_only_bumps_timestamp(self, sheet_server, tmp_path):
+        """Test that a 304 keeps the body and refreshes fetched_at"""
+        cache = SheetCache(tmp_path / 'etag', ttl=0)
+        url = sheet_server.urls()['edges']
+        cache.get('edges', url)
+        index = tmp_path / 'etag' / 'index' / 'edges.json'
+        before = json.loads(index.read_text())
+
+        time.sleep(0.01)
+        cache.get('edges', url)
+        cache.wait()
+        after = json.loads(index.read_text())
+
+        assert after['content'] == before['content'], "Body should be unchanged on 304"
+        assert after['fetched_at'] > before['fetched_at'], "Revalidation should refresh the timestamp"
+        assert before['last_modified'] is None, "No Last-Modified should be made up when the origin sends none"
+
+    def test_offline_mode(self, sheet_server, tmp_path):
+        """Test that offline mode serves cached data and never downloads"""
+        url = sheet_server.urls()['text']
+        SheetCache(tmp_path / 'offline').get('text', url)
+        hits = len(sheet_server.hits)
+
+        offline = SheetCache(tmp_path / 'offline', ttl=0, offline=True)
+        assert "edge_good" in offline.get('text', url), "Cached copy should be served offline"
+        with pytest.raises(ConnectionError):
+            offline.get('missing', url)
+        assert len(sheet_server.hits) == hits, "Offline mode should not touch the network"
+
+    def test_revalidate_sees_origin_changes(self, sheet_server, tmp_path):
+        """Test that a forced revalidation bypasses a fresh entry"""
+        cache = SheetCache(tmp_path / 'force', ttl=3600)
+        url = sheet_server.urls()['text']
+        cache.get('text', url)
+        sheet_server.tabs['text'] += "new_id,generic,,New text\n"
+
+        assert "new_id" not in cache.get('text', url), "Fresh entry should be served as-is"
+        assert "new_id" in cache.get('text', url, revalidate=True), "Revalidation should fetch the change"
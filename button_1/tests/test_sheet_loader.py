@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pytest
+from button_1.classes.button_dat import ButtonDat
+from button_1.classes.sheet_loader import RateLimiter, SheetLoader
+
+
+class TestSheetLoader:
+    """Test suite for concurrent sheet loading"""
+
+    def test_loader_returns_every_tab(self, sheet_server):
+        """Test that all requested tabs are loaded with timings"""
+        loader = SheetLoader(data_urls=sheet_server.urls())
+        scrapers = loader.load(['edges', 'nodes', 'text'])
+
+        assert set(scrapers) == {'edges', 'nodes', 'text'}, "Every tab should be loaded"
+        assert not scrapers['edges'].df.empty, "Edges tab should have rows"
+        assert set(loader.timings) == {'edges', 'nodes', 'text'}, "Every tab should report a timing"
+        assert all(t >= 0 for t in loader.timings.values()), "Timings should be non-negative"
+
+    def test_button_dat_startup_costs_one_round_trip(self, sheet_server):
+        """Test that tabs are fetched concurrently rather than one after another"""
+        latency = 0.3
+        game_data = ButtonDat(data_urls=sheet_server.urls(latency))
+
+        assert not game_data.nodes_df.empty, "Nodes DataFrame should not be empty"
+        assert all(t >= latency for t in game_data.load_timings.values()), "Each tab should pay the latency"
+        assert sheet_server.max_in_flight == 3, "All three tabs should be in flight at once"
+
+    def test_rate_limiter_allows_burst_then_spaces_requests(self):
+        """Test token bucket behaviour"""
+        limiter = RateLimiter(rate=20.0, burst=2)
+        started = time.perf_counter()
+        limiter.acquire()
+        limiter.acquire()
+        burst_elapsed = time.perf_counter() - started
+        limiter.acquire()
+        total_elapsed = time.perf_counter() - started
+
+        assert burst_elapsed < 0.03, "Burst requests should not wait"
+        assert total_elapsed >= 0.04, "Requests beyond the burst should be spaced out"
+
+    def test_rate_limiter_is_thread_safe(self):
+        """Test that concurrent acquires never exceed the bucket"""
+        limiter = RateLimiter(rate=50.0, burst=3)
+        started = time.perf_counter()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 3 immediate tokens, the remaining 5 arrive at 50 per second
+        assert time.perf_counter() - started >= 0.09, "Limiter should throttle excess threads"
+
+    def test_rate_limiter_rejects_invalid_rate(self):
+        """Test that a non-positive rate is rejected"""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
@@ -0,0 +1,77 @@
+import random
+
+import numpy as np
+import pytest
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.simulation_runner import SimulationRunner, run_simulation
+from button_1.classes.simulator import simulate
+
+
+def _same(first, second):
+    """Check that two simulation results are bit-identical"""
+    return (
+        np.array_equal(first.path_lengths, second.path_lengths)
+        and np.array_equal(first.finished, second.finished)
+        and np.array_equal(first.visit_counts, second.visit_counts)
+        and np.array_equal(first.edge_counts, second.edge_counts)
+    )
+
+
+class TestSimulationRunner:
+    """Test suite for reproducible, parallel simulation runs"""
+
+    def test_identical_for_any_worker_count(self, story_dat):
+        """Test that results depend on the seed, not the number of workers"""
+        graph = story_dat.graph_arrays
+        serial = SimulationRunner(graph, workers=1, chunk_size=5000).run(23_456, seed=42)
+        parallel = SimulationRunner(graph, workers=3, chunk_size=5000).run(23_456, seed=42)
+
+        assert serial.sessions == 23_456, "Every session should be simulated"
+        assert _same(serial, parallel), "Worker count must not change the result"
+
+    def test_seed_controls_streams(self, story_dat):
+        """Test that seeds are reproducible and distinct"""
+        graph = story_dat.graph_arrays
+        first = run_simulation(graph, 10_000, seed=1, workers=1)
+        again = run_simulation(graph, 10_000, seed=1, workers=1)
+        other = run_simulation(graph, 10_000, seed=2, workers=1)
+
+        assert _same(first, again), "The same seed should reproduce the run"
+        assert not _same(first, other), "Different seeds should give different runs"
+
+    def test_chunks_use_independent_streams(self, story_dat):
+        """Test that chunks do not replay the same random numbers"""
+        result = SimulationRunner(story_dat.graph_arrays, workers=1, chunk_size=1000).run(4000, seed=9)
+        chunks = result.path_lengths.reshape(4, 1000)
+
+        assert len({chunk.tobytes() for chunk in chunks}) == 4, "Each chunk should have its own stream"
+
+    def test_merged_counts_match_parts(self, story_dat):
+        """Test that merged counts equal the sum of per-chunk simulations"""
+        graph = story_dat.graph_arrays
+        result = SimulationRunner(graph, workers=1, chunk_size=3000).run(7000, seed=5)
+        seeds = np.random.SeedSequence(5).spawn(3)
+        parts = [simulate(graph, size, rng=np.random.default_rng(seq)) for size, seq in zip((3000, 3000, 1000), seeds)]
+
+        assert np.array_equal(result.visit_counts, sum(part.visit_counts for part in parts)), "Visits should be summed"
+        assert np.array_equal(result.path_lengths, np.concatenate([p.path_lengths for p in parts])), "Lengths in chunk order"
+
+    def test_unknown_start_fails_fast(self, story_dat):
+        """Test that a bad start node is reported before any work"""
+        with pytest.raises(KeyError, match="missing_node"):
+            run_simulation(story_dat.graph_arrays, 10, seed=0, workers=2, start="missing_node")
+
+
+class TestEngineRandomStream:
+    """Test suite for NodeEngine's own random stream"""
+
+    def test_seeded_engines_agree(self, story_dat):
+        """Test that engines with equal seeds make the same choices"""
+        first = NodeEngine(story_dat, rng=random.Random(3))
+        second = NodeEngine(story_dat, rng=random.Random(3))
+        random.seed(0)
+
+        picks = [first.determine_next_node('report_analytics') for _ in range(50)]
+        random.random()
+        assert picks == [second.determine_next_node('report_analytics') for _ in range(50)], \
+            "Engine choices should not depend on the global random state"
@@ -0,0 +1,114 @@
+import random
+import time
+
+import numpy as np
+import pytest
+from button_1.classes.graph_arrays import SELECT_END, SELECT_FIRST, SELECT_RANDOM, compile_graph_arrays
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.simulator import simulate
+from button_common.content_bundle import compile_content
+
+
+def _bundle(edges, selectors):
+    """Compile a small graph from (source, target, desired) rows and node selectors"""
+    return compile_content(
+        [{'source': s, 'target': t, 'outro_text': None, 'desired': d} for s, t, d in edges],
+        [{'node': name, 'edge_selector': selector} for name, selector in selectors.items()],
+        [{'id_text': 'pbn', 'text': 'Press a button now'}],
+    )
+
+
+class TestGraphArrays:
+    """Test suite for the array form of the story graph"""
+
+    def test_csr_matches_content(self, story_dat):
+        """Test that CSR rows mirror the bundle's adjacency"""
+        graph = story_dat.graph_arrays
+        for name in graph.node_names:
+            i = graph.index_of(name)
+            row = graph.targets[graph.indptr[i]:graph.indptr[i + 1]]
+            assert [graph.node_names[t] for t in row] == list(story_dat.get_connections(name)), f"Row for {name} should match"
+
+        assert graph.selector[graph.index_of('report_analytics')] == SELECT_RANDOM, "random selector code"
+        assert graph.selector[graph.index_of('start_game')] == SELECT_FIRST, "start takes the first edge"
+        assert graph.selector[graph.index_of('end')] == SELECT_END, "end selector code"
+        assert graph.absorbing[graph.index_of('end')], "end should absorb despite its outgoing edge"
+        assert story_dat.graph_arrays is graph, "Arrays should be built once per snapshot"
+
+    def test_arrays_are_read_only(self, story_dat):
+        """Test that the shared arrays cannot be modified"""
+        with pytest.raises(ValueError):
+            story_dat.graph_arrays.targets[0] = 0
+
+
+class TestSimulator:
+    """Test suite for the vectorized playthrough simulator"""
+
+    def test_linear_story_is_deterministic(self):
+        """Test that auto chains take the first edge and stop at dead ends"""
+        graph = compile_graph_arrays(_bundle(
+            [('start_game', 'a', True), ('a', 'b', True), ('a', 'c', False)],
+            {'start_game': 'start', 'a': 'auto'}
+        ))
+        result = simulate(graph, 100, seed=1)
+
+        assert (result.path_lengths == 2).all(), "Every session should take two steps"
+        assert result.visits_by_node() == {'start_game': 100, 'a': 100, 'b': 100, 'c': 0}, "Only the first edge is taken"
+        assert result.desired_rate == 1.0 and result.undesired_rate == 0.0, "Only desired edges were taken"
+
+    def test_random_loop_is_geometric(self):
+        """Test that a random retry loop matches its analytic expectation"""
+        graph = compile_graph_arrays(_bundle(
+            [('start_game', 'try', None), ('try', 'done', True), ('try', 'start_game', False)],
+            {'start_game': 'start', 'try': 'random', 'done': 'end'}
+        ))
+        result = simulate(graph, 200_000, seed=7)
+
+        # Each attempt is two steps and succeeds with probability 1/2
+        assert result.path_lengths.mean() == pytest.approx(4.0, rel=0.02), "Mean length should be 2 / 0.5"
+        assert result.undesired_rate == pytest.approx(0.25, abs=0.01), "Half the try edges are retries"
+        assert result.completion_rate == 1.0, "Every session should finish"
+
+    def test_story_counts_are_consistent(self, story_dat):
+        """Test bookkeeping on the real story"""
+        result = simulate(story_dat.graph_arrays, 10_000, seed=3)
+        traversals = result.edge_traversals()
+
+        assert result.completion_rate == 1.0, "The story should always reach the end"
+        assert traversals[('decision_maker', 'end')] == 10_000, "Every session leaves through decision_maker -> end"
+        assert ('end', 'summary') not in traversals, "The end selector should stop play"
+        assert result.visit_counts.sum() == 10_000 + result.path_lengths.sum(), "Each step visits one node"
+        assert result.length_distribution().sum() == 10_000, "Distribution should cover every session"
+
+    def test_seed_is_reproducible_and_max_steps_truncates(self, story_dat):
+        """Test seeding and truncation of long sessions"""
+        graph = story_dat.graph_arrays
+        first = simulate(graph, 1000, seed=11)
+        second = simulate(graph, 1000, seed=11)
+        short = simulate(graph, 1000, seed=11, max_steps=10)
+
+        assert np.array_equal(first.path_lengths, second.path_lengths), "Same seed should give same sessions"
+        assert short.path_lengths.max() == 10, "Sessions should be cut off at max_steps"
+        assert not short.finished.all(), "Cut-off sessions should not count as finished"
+
+    def test_matches_node_engine(self, story_dat):
+        """Test that simulated lengths agree with stepping the engine"""
+        engine = NodeEngine(story_dat, rng=random.Random(5))
+        lengths = []
+        for _ in range(3000):
+            node, steps = 'start_game', 0
+            while (node := engine.determine_next_node(node)) is not None:
+                steps += 1
+            lengths.append(steps)
+        result = simulate(story_dat.graph_arrays, 100_000, seed=5)
+
+        assert result.path_lengths.mean() == pytest.approx(np.mean(lengths), rel=0.08), "Mean lengths should agree"
+
+    def test_million_sessions_in_seconds(self, story_dat):
+        """Test that large batches finish quickly"""
+        started = time.perf_counter()
+        result = simulate(story_dat.graph_arrays, 1_000_000, seed=0)
+        elapsed = time.perf_counter() - started
+
+        assert result.sessions == 1_000_000, "All sessions should be simulated"
+        assert elapsed < 15, f"A million sessions took {elapsed:.1f}s"
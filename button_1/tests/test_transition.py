@@ -0,0 +1,85 @@
+import dataclasses
+
+import pytest
+from button_1.classes.button_game import ButtonGame
+from button_1.classes.game_core import GameCore
+from button_1.classes.key_input import ScriptedInput
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.transition import TransitionResult
+
+
+def _forbid(*names):
+    """Build a patcher that makes the given engine getters fail if called"""
+    def patch(engine, monkeypatch):
+        for name in names:
+            monkeypatch.setattr(engine, name, lambda *args, **kwargs: pytest.fail(f"{name} was called"))
+    return patch
+
+
+_no_lookups = _forbid('get_edge_selector', 'get_edge_desired_status', 'get_edge_outro_text', 'get_combined_outro_text')
+
+
+class TestTransitionResult:
+    """Test suite for the per-step TransitionResult"""
+
+    def test_result_is_immutable(self):
+        """Test that results cannot be modified once built"""
+        result = TransitionResult('welcome', 'onboarding', 'auto', "Off you go.", None, 'RIGHT')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.next_node = 'end'
+        assert not result.is_end, "A result with a next node is not an end"
+        assert TransitionResult('end').is_end, "A result without a next node is an end"
+
+    def test_random_transition_includes_feedback(self, story_dat):
+        """Test combined text and desired flag for a random edge"""
+        engine = NodeEngine(story_dat)
+        good = engine.resolve_transition('report_analytics', 'decision_maker', 'RIGHT')
+        bad = engine.resolve_transition('report_analytics', 'source_data')
+
+        assert good.combined_text == "This step went as expected. You present your findings with flair.", "Good feedback should lead"
+        assert good.is_desired is True, "Desired flag should come from the edge"
+        assert good.user_input == 'RIGHT', "User input should be carried through"
+        assert bad.combined_text.startswith("Oh, no!"), "Bad feedback should lead"
+        assert bad.is_desired is False, "Undesired edge should be flagged"
+
+    def test_auto_and_end_transitions(self, story_dat):
+        """Test transitions without feedback and at the end of the game"""
+        engine = NodeEngine(story_dat)
+        auto = engine.resolve_transition('start_game', 'welcome')
+        end = engine.resolve_transition('end', None)
+
+        assert auto.edge_selector == 'start', "Selector should be resolved"
+        assert not (auto.combined_text or "").startswith("This step"), "Non-random edges get no feedback"
+        assert end.is_end and end.combined_text is None, "End has no transition text"
+        assert end.edge_selector == 'end', "End selector should still be reported"
+
+    def test_step_resolves_facts_once(self, story_dat, monkeypatch, capsys):
+        """Test that a step builds its result without re-querying the engine"""
+        engine = NodeEngine(story_dat, developer_mode=True, key_input=ScriptedInput(['RIGHT']))
+        _no_lookups(engine, monkeypatch)
+
+        result = engine.run_single_node('report_analytics')
+        output = capsys.readouterr().out
+
+        assert isinstance(result, TransitionResult), "run_single_node should return a TransitionResult"
+        assert result.next_node in ('decision_maker', 'source_data'), "Next node should be a successor"
+        assert engine.wrap_text(result.combined_text) in output, "Displayed text should be the result's text"
+        assert f"Next Node: {result.next_node}" in output, "Developer info should use the result"
+
+    def test_game_log_matches_results(self, story_dat, monkeypatch, capsys):
+        """Test that the journey log records exactly what each step resolved"""
+        game = ButtonGame(button_dat=story_dat)
+        monkeypatch.setattr(game.engine, 'get_arrow_key_input', lambda: 'RIGHT')
+        _no_lookups(NodeEngine, monkeypatch)
+        results = []
+        step = GameCore.step
+        monkeypatch.setattr(GameCore, 'step', lambda core, state, key: (
+            lambda out: results.append(out[1].last) or out)(step(core, state, key)))
+
+        game.play_full_game()
+        capsys.readouterr()
+
+        logged = [(s['from'], s['to'], s['edge_selector'], s['outro_text'], s['is_desired']) for s in game.game_path[1:]]
+        expected = [(r.from_node, r.next_node, r.edge_selector, r.combined_text, r.is_desired) for r in results if r.next_node]
+        assert logged == expected, "Log entries should mirror the step results"
+        assert results[-1].is_end, "The game should stop on an end result"
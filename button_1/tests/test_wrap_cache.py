@@ -0,0 +1,93 @@
+import signal
+import textwrap
+
+import pytest
+from button_1.classes import text_wrap
+from button_1.classes.node_engine import NodeEngine
+from button_1.classes.text_wrap import WrapCache, frame_texts, prewarm_views
+
+
+PARAGRAPH = (
+    "Oh, no! Something isn't quite right. During your presentation one of the stakeholders "
+    "points out there's no integration of a data source that was never mentioned until now."
+)
+
+
+class TestWrapCache:
+    """Test suite for memoized text wrapping"""
+
+    def test_matches_textwrap_fill(self):
+        """Test that cached output is identical to textwrap.fill"""
+        cache = WrapCache()
+        for width in (40, 60, 80):
+            expected = textwrap.fill(PARAGRAPH, width=width, initial_indent="   � ", subsequent_indent="   ")
+            assert cache.wrap(PARAGRAPH, width, "   � ", "   ") == expected, f"Width {width} should match textwrap"
+        assert cache.wrap("   \n  \t  ", 80) == "", "Whitespace should wrap to an empty string"
+
+    def test_repeat_wraps_hit_cache(self):
+        """Test that a paragraph is wrapped once per layout"""
+        cache = WrapCache()
+        for _ in range(100):
+            cache.wrap(PARAGRAPH, 80)
+            cache.wrap(PARAGRAPH, 60)
+
+        assert cache.misses == 2, "Each width should be wrapped once"
+        assert cache.hits == 198, "Every repeat should be a cache hit"
+
+    def test_lru_is_bounded(self):
+        """Test that the least recently used frame is evicted"""
+        cache = WrapCache(maxsize=2)
+        cache.wrap("first", 80)
+        cache.wrap("second", 80)
+        cache.wrap("first", 80)
+        cache.wrap("third", 80)
+        cache.wrap("first", 80)
+        cache.wrap("second", 80)
+
+        assert len(cache) == 2, "Cache should never exceed maxsize"
+        assert cache.misses == 4, "Only the least recently used frame should be evicted"
+
+    def test_terminal_width_capped_and_reset_on_resize(self, monkeypatch):
+        """Test width detection and SIGWINCH invalidation"""
+        monkeypatch.setattr(text_wrap, '_width', None)
+        monkeypatch.setattr(text_wrap.shutil, 'get_terminal_size', lambda fallback: type('Size', (), {'columns': 200})())
+        assert text_wrap.terminal_width() == 80, "Wide terminals should be capped at 80"
+
+        text_wrap.wrap_cache.wrap(PARAGRAPH, 80)
+        frames = len(text_wrap.wrap_cache)
+        monkeypatch.setattr(text_wrap.shutil, 'get_terminal_size', lambda fallback: type('Size', (), {'columns': 50})())
+        text_wrap._on_resize(getattr(signal, 'SIGWINCH', 28), None)
+
+        assert len(text_wrap.wrap_cache) == frames, "Resize should keep frames, the width is part of the key"
+        assert text_wrap.terminal_width() == 50, "Resize should re-measure the terminal"
+
+    def test_resize_during_wrap_does_not_deadlock(self):
+        """Test that the resize handler never waits on the cache lock"""
+        cache = text_wrap.wrap_cache
+        with cache._lock:
+            text_wrap._on_resize(getattr(signal, 'SIGWINCH', 28), None)
+
+        assert text_wrap._width is None, "The handler should still forget the width"
+
+    def test_content_load_prewarms_frames(self, story_dat):
+        """Test that node paragraphs are wrapped when views are compiled"""
+        views = story_dat.node_views
+        feedback = ("This step went as expected.", "Oh, no! Something isn't quite right.")
+        texts = list(frame_texts(views, *feedback))
+        cache = WrapCache()
+        count = prewarm_views(views, *feedback, widths=(80, 60), cache=cache)
+
+        assert count == len(texts) * 2, "Every paragraph should be wrapped at every width"
+        assert "This step went as expected. You present your findings with flair." in texts, "Random edges include feedback"
+        assert cache.misses == count and cache.hits == 0, "Prewarming should fill the cache"
+
+    def test_engine_display_reuses_prewarmed_frames(self, story_dat, monkeypatch, capsys):
+        """Test that displaying a node hits the shared cache"""
+        monkeypatch.setattr(text_wrap, '_width', 80)
+        engine = NodeEngine(story_dat)
+        misses = text_wrap.wrap_cache.misses
+        for _ in range(5):
+            engine.display_intro('report_analytics')
+        capsys.readouterr()
+
+        assert text_wrap.wrap_cache.misses == misses, "Prewarmed intro text should never be re-wrapped"
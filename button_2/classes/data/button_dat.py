@@ -1,15 +1,38 @@
-import pandas as pd
 import os
 from pathlib import Path
+from button_common.content_bundle import load_bundle
 
 class ButtonDat:
-    def __init__(self):
+    def __init__(self, bundle_path=None):
         # Get the directory where this file is located
         current_dir = Path(__file__).parent
         # Navigate to the data directory
         data_dir = current_dir.parent.parent / 'data'
-        
+
+        # A compiled bundle (python -m button_common.content_bundle
+        # button_2/data button_2/data/content.bundle) loads in milliseconds
+        # without pandas; DataFrames are then only built if asked for.
+        bundle_path = bundle_path or os.getenv("BUTTON_CONTENT_BUNDLE")
+        if bundle_path:
+            self.content = load_bundle(bundle_path)
+            return
+
+        import pandas as pd
+
+        self.content = None
         self.edges_df = pd.read_csv(data_dir / 'edges.csv')
         self.nodes_df = pd.read_csv(data_dir / 'nodes.csv')
         self.text_df = pd.read_csv(data_dir / 'text.csv')
-        self.employee_df = pd.read_csv(data_dir / 'employee.csv')
\ No newline at end of file
+        self.employee_df = pd.read_csv(data_dir / 'employee.csv')
+
+    def __getattr__(self, name):
+        # Materialize the DataFrames from the bundle on first access
+        content = self.__dict__.get('content')
+        if name in ('edges_df', 'nodes_df', 'text_df', 'employee_df') and content is not None:
+            frames = content.to_frames()
+            self.edges_df = frames['edges']
+            self.nodes_df = frames['nodes']
+            self.text_df = frames['text']
+            self.employee_df = frames['employee']
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
@@ -1,11 +1,12 @@
-from classes.data.gs_scraper import GsScraper
+from .gs_scraper import GsScraper
 
 class DataUpdater:
     def __init__(self):
-        self.edges = GsScraper('edges')
-        self.nodes = GsScraper('nodes')
-        self.text = GsScraper('text')
-        self.employee = GsScraper('employee')
+        # Always check the sheet for changes rather than trusting the cache
+        self.edges = GsScraper('edges', revalidate=True)
+        self.nodes = GsScraper('nodes', revalidate=True)
+        self.text = GsScraper('text', revalidate=True)
+        self.employee = GsScraper('employee', revalidate=True)
   
     def update_all(self):
         self.edges.df.to_csv('button_2/data/edges.csv', index=False)
@@ -19,20 +19,24 @@ Environment Requirements:
     - BUTTON_SHEET_NODES_GID: GID for nodes data tab  
     - BUTTON_SHEET_TEXT_GID: GID for text content tab
     - BUTTON_SHEET_EMPLOYEE_GID: GID for employee data tab
+    - BUTTON_CACHE_DIR / BUTTON_CACHE_TTL / BUTTON_OFFLINE: see SheetCache
 
 Key Features:
     - Automatic retry with exponential backoff
     - Environment-specific .env file loading
     - Comprehensive error handling and reporting
     - Rate limiting protection for API compliance
+    - Persistent on-disk cache so warm starts skip the network
 """
 
 import pandas as pd
+import io
 import os
 from dotenv import load_dotenv
 import time
 from urllib.error import HTTPError
 from pathlib import Path
+from button_common.sheet_cache import SheetCache, default_cache
 
 
 # Load .env file from the button_2 directory (not root)
@@ -72,7 +76,7 @@ class GsScraper:
         BUTTON_SHEET_*_GID: Individual tab GID for each sheet type
     """
     
-    def __init__(self, sheet_name):
+    def __init__(self, sheet_name, cache=None, revalidate=False):
         """
         Initialize Google Sheets connection for specified tab.
         
@@ -82,6 +86,10 @@ class GsScraper:
         Args:
             sheet_name (str): Name of sheet tab to load
                 Must be one of: 'edges', 'nodes', 'text', 'titles'
+            cache (SheetCache, optional): On-disk cache to read through.
+                Defaults to the process-wide cache from the environment
+            revalidate (bool): Check the origin for changes before returning
+                instead of trusting a fresh cache entry
         
         Raises:
             ValueError: If sheet_name is not recognized
@@ -101,15 +109,19 @@ class GsScraper:
         else:
             raise ValueError(f"Unknown sheet name: {sheet_name}. Must be one of: edges, nodes, text, employee")
         self.data_url = f"https://docs.google.com/spreadsheets/d/{self._sheet_id}/export?format=csv&gid={self._sheet_gid}"
+        self._cache = cache or default_cache()
+        self.cache_key = SheetCache.key_for(self._sheet_id, self._sheet_gid)
+        self._revalidate = revalidate
         
         # Load data with retry logic for rate limiting
         self.df = self._load_data_with_retry()
     
     def _load_data_with_retry(self, max_retries=3, delay=1):
-        """Load CSV data with retry logic for rate limiting"""
+        """Load CSV data through the on-disk cache with retry logic for rate limiting"""
         for attempt in range(max_retries):
             try:
-                return pd.read_csv(self.data_url)
+                text = self._cache.get(self.cache_key, self.data_url, revalidate=self._revalidate)
+                return pd.read_csv(io.StringIO(text))
             except HTTPError as e:
                 if e.code == 404 and attempt < max_retries - 1:
                     print(f"⚠️  Rate limited, retrying in {delay} seconds... (attempt {attempt + 1})")
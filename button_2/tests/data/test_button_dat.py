@@ -14,4 +14,18 @@ def test_button_dat_initialisation():
     assert not game_data.edges_df.empty, "Edges DataFrame should not be empty"
     assert not game_data.nodes_df.empty, "Nodes DataFrame should not be empty"
     assert not game_data.text_df.empty, "Text DataFrame should not be empty"
-    assert not game_data.employee_df.empty, "Employee DataFrame should not be empty"
\ No newline at end of file
+    assert not game_data.employee_df.empty, "Employee DataFrame should not be empty"
+
+def test_button_dat_from_bundle(tmp_path):
+    """Test that ButtonDat loads a compiled bundle of the same content"""
+    from pathlib import Path
+    from button_common.content_bundle import compile_csv_dir
+
+    bundle_path = tmp_path / 'content.bundle'
+    compile_csv_dir(Path(__file__).parents[2] / 'data').write(bundle_path)
+    csv_data = ButtonDat()
+    bundle_data = ButtonDat(bundle_path=bundle_path)
+
+    assert bundle_data.content.successors['report_analytics'] == ('decision_maker', 'source_data')
+    assert len(bundle_data.employee_df) == len(csv_data.employee_df), "Employee rows should match the CSV"
+    assert list(bundle_data.edges_df['target']) == list(csv_data.edges_df['target']), "Edges should match the CSV"
@@ -1,4 +1,4 @@
-from classes.data.data_updater import DataUpdater
+from button_2.classes.data.data_updater import DataUpdater
 
 dat = DataUpdater()
 dat.update_all()
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Button Common - Modules Shared by Every Game Version
+====================================================
+
+Code that button_1 and button_2 both use lives here once, so fixes to it
+reach every version. Modules in this package only import the standard
+library and each other, and importing them never loads a game package or
+its .env file.
+
+Modules:
+    sheet_cache: Persistent on-disk cache for Google Sheets CSV exports
+    content_bundle: Compiled, versioned content bundles and their CLI
+"""
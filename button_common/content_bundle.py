@@ -0,0 +1,382 @@
+"""
+ContentBundle - Compiled, Versioned Game Content
+================================================
+
+This module compiles the game's content tables (edges, nodes, text and,
+when present, employee) into a single immutable ContentBundle and writes it
+to disk as one versioned binary file. Loading a bundle back is a header
+check plus one `marshal` read, so it takes milliseconds and never imports
+pandas.
+
+Compilation validates the tables, interns every string so repeated values
+share one object, and pre-resolves the adjacency (successor lists and
+outgoing edge ids per node) so the runtime never has to scan edge rows.
+
+Bundle File Layout:
+    header: magic b'BTNB', schema version (u16), reserved (u16),
+            content hash (32 bytes, SHA-256), payload length (u32),
+            payload CRC-32 (u32)
+    payload: marshal-encoded tuple of a string table and index tuples
+
+Classes:
+    ContentBundle: Immutable compiled content with pre-resolved adjacency
+
+Functions:
+    compile_content: Validate and compile content tables into a bundle
+    compile_csv_dir: Compile edges/nodes/text/employee CSVs in a directory
+    load_bundle: Read a bundle file
+
+Usage:
+    python -m button_common.content_bundle DATA_DIR OUTPUT_PATH
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+import csv
+import hashlib
+import json
+import marshal
+import struct
+import sys
+import zlib
+
+
+BUNDLE_MAGIC = b'BTNB'
+SCHEMA_VERSION = 1
+_HEADER = struct.Struct('<4sHH32sII')
+
+NODE_FIELDS = ('node', 'edge_selector', 'title_text', 'intro_text', 'event_text', 'pbn')
+EDGE_FIELDS = ('source', 'target', 'outro_text', 'desired')
+TEXT_FIELDS = ('id_text', 'text_type', 'text_context', 'text')
+EMPLOYEE_FIELDS = ('job_title', 'department')
+
+_REQUIRED = {
+    'edges': ('source', 'target'),
+    'nodes': ('node',),
+    'text': ('id_text', 'text'),
+    'employee': EMPLOYEE_FIELDS,
+}
+
+
+def _clean(value):
+    """Normalize a cell to an interned string, or None when blank/NaN"""
+    if value is None or value != value:  # NaN is the only value unequal to itself
+        return None
+    text = str(value)
+    return sys.intern(text) if text.strip() else None
+
+
+def _parse_desired(value):
+    """Parse the edges 'desired' flag into True, False or None"""
+    if isinstance(value, bool):
+        return value
+    text = _clean(value)
+    if text is None:
+        return None
+    flag = text.strip().upper()
+    if flag in ('TRUE', '1', 'YES'):
+        return True
+    if flag in ('FALSE', '0', 'NO'):
+        return False
+    raise ValueError(f"Unrecognised desired value: {value!r}")
+
+
+def _rows(table):
+    """Accept a DataFrame or an iterable of dict rows and return (columns, rows)"""
+    if table is None:
+        return (), []
+    if hasattr(table, 'to_dict'):
+        return tuple(table.columns), table.to_dict('records')
+    rows = list(table)
+    columns = tuple(rows[0].keys()) if rows else ()
+    return columns, rows
+
+
+class ContentBundle:
+    """
+    Immutable, compiled snapshot of all game content.
+
+    Node, edge, text and employee rows are stored as tuples of interned
+    strings, and every lookup the game needs is pre-resolved into a
+    read-only mapping. Instances are safe to share between games, threads
+    and sessions.
+
+    Attributes:
+        schema_version (int): Bundle schema the content was compiled with
+        content_hash (str): SHA-256 of the canonical content, hex encoded
+        node_names (tuple): Every node name, nodes table first, then
+            nodes only referenced by edges, in first-seen order
+        nodes (Mapping): Node name to its row tuple (see NODE_FIELDS)
+        edges (tuple): Edge row tuples (see EDGE_FIELDS)
+        out_edges (Mapping): Node name to a tuple of outgoing edge ids
+        successors (Mapping): Node name to a tuple of target node names
+        texts (tuple): Text row tuples (see TEXT_FIELDS)
+        text_by_id (Mapping): id_text to text (first row wins)
+        employees (tuple): Employee row tuples (see EMPLOYEE_FIELDS)
+    """
+
+    __slots__ = (
+        'schema_version', 'content_hash', 'node_names', 'nodes', 'edges',
+        'out_edges', 'successors', 'texts', 'text_by_id', 'employees'
+    )
+
+    def __init__(self, nodes, edges, texts, employees=(), schema_version=SCHEMA_VERSION):
+        """
+        Build the derived indexes from already-cleaned row tuples.
+
+        Args:
+            nodes (tuple): Node row tuples in table order
+            edges (tuple): Edge row tuples in table order
+            texts (tuple): Text row tuples in table order
+            employees (tuple): Employee row tuples
+            schema_version (int): Schema version of the rows
+        """
+        node_rows = {}
+        for row in nodes:
+            node_rows.setdefault(row[0], row)
+
+        names = dict.fromkeys(row[0] for row in nodes)
+        out_edges = {}
+        for edge_id, (source, target, _, _) in enumerate(edges):
+            names.setdefault(source)
+            names.setdefault(target)
+            out_edges.setdefault(source, []).append(edge_id)
+
+        text_by_id = {}
+        for row in texts:
+            if row[3] is not None:
+                text_by_id.setdefault(row[0], row[3])
+
+        self.schema_version = schema_version
+        self.node_names = tuple(names)
+        self.nodes = MappingProxyType(node_rows)
+        self.edges = tuple(edges)
+        self.out_edges = MappingProxyType({name: tuple(ids) for name, ids in out_edges.items()})
+        self.successors = MappingProxyType({
+            name: tuple(self.edges[i][1] for i in ids) for name, ids in self.out_edges.items()
+        })
+        self.texts = tuple(texts)
+        self.text_by_id = MappingProxyType(text_by_id)
+        self.employees = tuple(employees)
+        self.content_hash = self._hash()
+
+    def _hash(self):
+        """SHA-256 over a canonical JSON rendering of the content rows"""
+        canonical = json.dumps(
+            [self.schema_version, list(self.nodes.values()), self.edges, self.texts, self.employees],
+            separators=(',', ':')
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def to_bytes(self):
+        """
+        Serialize to the versioned binary bundle format.
+
+        Strings are written once to a string table and referenced by index,
+        so the payload stays compact and loading interns them for free.
+        """
+        table = {}
+
+        def ref(value):
+            if value is None:
+                return -1
+            if value not in table:
+                table[value] = len(table)
+            return table[value]
+
+        nodes = tuple(tuple(ref(v) for v in row) for row in self.nodes.values())
+        edges = tuple((ref(s), ref(t), ref(o), -1 if d is None else int(d)) for s, t, o, d in self.edges)
+        texts = tuple(tuple(ref(v) for v in row) for row in self.texts)
+        employees = tuple(tuple(ref(v) for v in row) for row in self.employees)
+        payload = marshal.dumps((tuple(table), nodes, edges, texts, employees))
+
+        header = _HEADER.pack(
+            BUNDLE_MAGIC, self.schema_version, 0, bytes.fromhex(self.content_hash),
+            len(payload), zlib.crc32(payload)
+        )
+        return header + payload
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Deserialize a binary bundle.
+
+        Raises:
+            ValueError: If the data is not a bundle, uses an unsupported
+                schema version, or fails its integrity checks
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Content bundle is truncated")
+        magic, version, _, digest, length, crc = _HEADER.unpack_from(data)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError("Not a content bundle (bad magic)")
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported content bundle schema {version}; expected {SCHEMA_VERSION}")
+        payload = data[_HEADER.size:_HEADER.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            raise ValueError("Content bundle is corrupt (checksum mismatch)")
+
+        strings, nodes, edges, texts, employees = marshal.loads(payload)
+        strings = tuple(sys.intern(s) for s in strings)
+
+        def deref(i):
+            return None if i < 0 else strings[i]
+
+        bundle = cls(
+            nodes=tuple(tuple(deref(i) for i in row) for row in nodes),
+            edges=tuple((deref(s), deref(t), deref(o), None if d < 0 else bool(d)) for s, t, o, d in edges),
+            texts=tuple(tuple(deref(i) for i in row) for row in texts),
+            employees=tuple(tuple(deref(i) for i in row) for row in employees),
+            schema_version=version,
+        )
+        if bundle.content_hash != digest.hex():
+            raise ValueError("Content bundle is corrupt (content hash mismatch)")
+        return bundle
+
+    def write(self, path):
+        """Write the bundle to path"""
+        Path(path).write_bytes(self.to_bytes())
+
+    def to_frames(self):
+        """
+        Materialize pandas DataFrames for the content tables.
+
+        pandas is only imported here, so code that never asks for frames
+        never pays for the import.
+
+        Returns:
+            dict: 'edges', 'nodes', 'text' and 'employee' DataFrames
+        """
+        import pandas as pd
+        return {
+            'edges': pd.DataFrame(list(self.edges), columns=list(EDGE_FIELDS)),
+            'nodes': pd.DataFrame(list(self.nodes.values()), columns=list(NODE_FIELDS)),
+            'text': pd.DataFrame(list(self.texts), columns=list(TEXT_FIELDS)),
+            'employee': pd.DataFrame(list(self.employees), columns=list(EMPLOYEE_FIELDS)),
+        }
+
+
+def compile_content(edges, nodes, text, employee=None, issues=None):
+    """
+    Validate content tables and compile them into a ContentBundle.
+
+    Each table may be a pandas DataFrame or an iterable of dict rows (for
+    example from csv.DictReader). Blank and NaN cells become None.
+
+    Args:
+        edges: Edge rows with source, target, outro_text, desired
+        nodes: Node rows with node, edge_selector and display text columns
+        text: Text rows with id_text, text_type, text_context, text
+        employee (optional): Employee rows with job_title, department
+        issues (list, optional): When given, problems are appended here and
+            the offending rows (or tables) are skipped instead of raising
+
+    Returns:
+        ContentBundle: Compiled content
+
+    Raises:
+        ValueError: Listing every validation problem found, unless an
+            issues list was supplied
+    """
+    lenient = issues is not None
+    issues = issues if lenient else []
+    tables = {}
+    for name, table in (('edges', edges), ('nodes', nodes), ('text', text), ('employee', employee)):
+        columns, rows = _rows(table)
+        missing = [column for column in _REQUIRED[name] if table is not None and column not in columns]
+        for column in missing:
+            issues.append(f"{name} table missing '{column}' column")
+        tables[name] = [] if missing else rows
+
+    if issues and not lenient:
+        raise ValueError("Invalid content: " + "; ".join(issues))
+
+    def project(row, fields):
+        return tuple(_clean(row.get(field)) for field in fields)
+
+    node_rows, seen = [], set()
+    for line, row in enumerate(tables['nodes'], start=2):
+        record = project(row, NODE_FIELDS)
+        if record[0] is None:
+            issues.append(f"nodes row {line}: blank node name")
+            continue
+        if record[0] in seen:
+            issues.append(f"nodes row {line}: duplicate node '{record[0]}'")
+            continue
+        seen.add(record[0])
+        node_rows.append(record)
+
+    edge_rows = []
+    for line, row in enumerate(tables['edges'], start=2):
+        source, target, outro, _ = project(row, EDGE_FIELDS)
+        if source is None or target is None:
+            issues.append(f"edges row {line}: blank source or target")
+            continue
+        try:
+            desired = _parse_desired(row.get('desired'))
+        except ValueError as e:
+            issues.append(f"edges row {line}: {e}")
+            continue
+        edge_rows.append((source, target, outro, desired))
+
+    text_rows = []
+    for line, row in enumerate(tables['text'], start=2):
+        record = project(row, TEXT_FIELDS)
+        if record[0] is None:
+            issues.append(f"text row {line}: blank id_text")
+            continue
+        text_rows.append(record)
+
+    employee_rows = [project(row, EMPLOYEE_FIELDS) for row in tables['employee']]
+
+    if issues and not lenient:
+        raise ValueError("Invalid content: " + "; ".join(issues))
+
+    return ContentBundle(tuple(node_rows), tuple(edge_rows), tuple(text_rows), tuple(employee_rows))
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def compile_csv_dir(data_dir):
+    """
+    Compile edges.csv, nodes.csv, text.csv and (optional) employee.csv.
+
+    Args:
+        data_dir (str or Path): Directory holding the exported CSV tables
+
+    Returns:
+        ContentBundle: Compiled content
+    """
+    data_dir = Path(data_dir)
+    employee_path = data_dir / 'employee.csv'
+    return compile_content(
+        edges=_read_csv(data_dir / 'edges.csv'),
+        nodes=_read_csv(data_dir / 'nodes.csv'),
+        text=_read_csv(data_dir / 'text.csv'),
+        employee=_read_csv(employee_path) if employee_path.exists() else None,
+    )
+
+
+def load_bundle(path):
+    """Read a content bundle file written by ContentBundle.write"""
+    return ContentBundle.from_bytes(Path(path).read_bytes())
+
+
+def main(argv=None):
+    """Compile a directory of content CSVs into a bundle file"""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
+        print("Usage: python -m button_common.content_bundle DATA_DIR OUTPUT_PATH")
+        return 2
+    bundle = compile_csv_dir(args[0])
+    bundle.write(args[1])
+    print(f"✅ Wrote {args[1]} ({len(bundle.node_names)} nodes, {len(bundle.edges)} edges, "
+          f"content {bundle.content_hash[:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
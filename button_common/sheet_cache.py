@@ -0,0 +1,208 @@
+"""
+SheetCache - Persistent On-Disk Cache for Google Sheets CSV Exports
+===================================================================
+
+This module keeps a local copy of every sheet tab that has been downloaded,
+so that warm starts are served from disk instead of the network. Bodies are
+stored content-addressed (by the SHA-256 of the CSV) and an index entry per
+sheet id and gid records which body is current, when it was fetched, and
+the validators (ETag / Last-Modified) needed to revalidate it cheaply.
+
+Lookup behaviour:
+    - Fresh entry (younger than the TTL): returned from disk
+    - Stale entry: returned from disk at once, refreshed in the background
+      with a conditional request (304 responses only bump the timestamp)
+    - Missing entry: downloaded synchronously
+    - Offline mode: only ever served from disk
+
+Classes:
+    SheetCache: Content-addressed CSV cache with stale-while-revalidate
+
+Environment Variables:
+    - BUTTON_CACHE_DIR: Cache location (defaults to ~/.cache/button)
+    - BUTTON_CACHE_TTL: Freshness window in seconds (defaults to 3600)
+    - BUTTON_OFFLINE: Set to 1/true to never touch the network
+"""
+
+from pathlib import Path
+from urllib.error import HTTPError
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.request
+
+
+def _env_flag(name):
+    """Interpret an environment variable as a boolean flag"""
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class SheetCache:
+    """
+    Content-addressed local cache for sheet CSV exports.
+
+    Index entries are keyed by sheet id and gid (see `key_for`) and point at
+    a body stored under its content hash, so identical tab contents are only
+    written once. Stale entries are served immediately while a background
+    thread revalidates them against the origin.
+
+    Attributes:
+        cache_dir (Path): Root directory holding `index/` and `objects/`
+        ttl (float): Seconds an entry is considered fresh
+        offline (bool): Never issue network requests when True
+    """
+
+    def __init__(self, cache_dir=None, ttl=None, offline=None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str or Path, optional): Cache root. Defaults to
+                BUTTON_CACHE_DIR or ~/.cache/button
+            ttl (float, optional): Freshness window in seconds. Defaults to
+                BUTTON_CACHE_TTL or 3600
+            offline (bool, optional): Forced offline mode. Defaults to the
+                BUTTON_OFFLINE environment flag
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv("BUTTON_CACHE_DIR") or Path.home() / '.cache' / 'button'
+        self.cache_dir = Path(cache_dir)
+        self.ttl = float(ttl if ttl is not None else os.getenv("BUTTON_CACHE_TTL", 3600))
+        self.offline = _env_flag("BUTTON_OFFLINE") if offline is None else offline
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(sheet_id, gid):
+        """Build the index key for a sheet id and tab gid"""
+        return hashlib.sha256(f"{sheet_id}:{gid}".encode('utf-8')).hexdigest()[:32]
+
+    def _index_path(self, key):
+        return self.cache_dir / 'index' / f"{key}.json"
+
+    def _object_path(self, digest):
+        return self.cache_dir / 'objects' / f"{digest}.csv"
+
+    def _write_atomic(self, path, data: bytes):
+        """Write via a temporary file so readers never see partial content"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _read_entry(self, key):
+        """Return the index entry for key, or None if absent or unreadable"""
+        try:
+            entry = json.loads(self._index_path(key).read_text())
+            if self._object_path(entry['content']).exists():
+                return entry
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def get(self, key, url, rate_limiter=None, revalidate=False):
+        """
+        Return the CSV text for key, downloading or revalidating as needed.
+
+        Args:
+            key (str): Index key, usually from `key_for`
+            url (str): CSV export URL used on a miss or revalidation
+            rate_limiter (RateLimiter, optional): Acquired before any request
+            revalidate (bool): Revalidate synchronously before returning,
+                for callers that must see the origin's current content
+
+        Returns:
+            str: CSV text
+
+        Raises:
+            ConnectionError: If offline and nothing is cached for key
+            HTTPError: If the origin rejects a synchronous download
+        """
+        entry = self._read_entry(key)
+        if entry is not None and revalidate and not self.offline:
+            return self._download(key, url, entry, rate_limiter)
+        if entry is not None:
+            body = self._object_path(entry['content']).read_text(encoding='utf-8')
+            if not self.offline and time.time() - entry['fetched_at'] >= self.ttl:
+                self._refresh_in_background(key, url, entry, rate_limiter)
+            return body
+
+        if self.offline:
+            raise ConnectionError(f"Offline mode: no cached copy of {url}")
+        return self._download(key, url, None, rate_limiter)
+
+    def _download(self, key, url, entry, rate_limiter):
+        """Fetch url, conditionally if entry has validators, and store it"""
+        request = urllib.request.Request(url)
+        if entry is not None:
+            if entry.get('etag'):
+                request.add_header('If-None-Match', entry['etag'])
+            if entry.get('last_modified'):
+                request.add_header('If-Modified-Since', entry['last_modified'])
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = response.read()
+                etag = response.headers.get('ETag')
+                # Only echo the origin's own date; without one, revalidate by ETag
+                last_modified = response.headers.get('Last-Modified')
+        except HTTPError as e:
+            if e.code == 304 and entry is not None:
+                entry['fetched_at'] = time.time()
+                self._write_atomic(self._index_path(key), json.dumps(entry).encode('utf-8'))
+                return self._object_path(entry['content']).read_text(encoding='utf-8')
+            raise
+
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            self._write_atomic(object_path, data)
+        new_entry = {
+            'url': url,
+            'content': digest,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+        }
+        self._write_atomic(self._index_path(key), json.dumps(new_entry).encode('utf-8'))
+        return data.decode('utf-8')
+
+    def _refresh_in_background(self, key, url, entry, rate_limiter):
+        """Start at most one revalidation thread per key"""
+        with self._lock:
+            running = self._refreshing.get(key)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._refresh, args=(key, url, entry, rate_limiter), daemon=True
+            )
+            self._refreshing[key] = thread
+        thread.start()
+
+    def _refresh(self, key, url, entry, rate_limiter):
+        try:
+            self._download(key, url, entry, rate_limiter)
+        except Exception as e:
+            print(f"⚠️  Background refresh of cached sheet failed: {e}")
+
+    def wait(self, timeout=None):
+        """Block until all background refreshes have finished"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+
+_default_cache = None
+
+
+def default_cache():
+    """Return the process-wide SheetCache configured from the environment"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SheetCache()
+    return _default_cache